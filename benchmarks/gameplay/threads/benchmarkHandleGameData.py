@@ -0,0 +1,61 @@
+import argparse
+import pathlib
+import sys
+from time import perf_counter
+
+# runnable as a script from the repository root, not only with python -m
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[3]))
+
+from src.gameplay.context import context
+from src.gameplay.threads.pilotNG import PilotNGThread
+from src.utils.core import getFrameCacheStats, setFrameSource
+from src.utils.frameSources import ReplayFrameSource
+from src.utils.ino import setArduinoSerial
+
+
+class ReplayContext:
+    def __init__(self, context):
+        self.context = context
+
+
+# keyboard and mouse commands of a replay go nowhere, build machines have no board
+class DiscardedSerial:
+    def write(self, _: bytes):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measures PilotNGThread.handleGameData ticks/second over a recorded session')
+    parser.add_argument(
+        'frames', help='directory of .npy/.png frames or a (frames, height, width) .npy file')
+    parser.add_argument('--fps', type=float, default=None,
+                        help='replay speed, defaults to as fast as possible')
+    parser.add_argument('--ticks', type=int, default=None,
+                        help='amount of ticks, defaults to every recorded frame')
+    args = parser.parse_args()
+    frameSource = ReplayFrameSource(args.frames, fps=args.fps, loop=args.ticks is not None)
+    setFrameSource(frameSource)
+    setArduinoSerial(DiscardedSerial())
+    context['ng_pause'] = False
+    pilotNGThread = PilotNGThread(ReplayContext(context))
+    ticks = args.ticks if args.ticks is not None else len(frameSource)
+    ticksDurations = []
+    for _ in range(ticks):
+        startTime = perf_counter()
+        pilotNGThread.context.context = pilotNGThread.handleGameData(
+            pilotNGThread.context.context)
+        ticksDurations.append(perf_counter() - startTime)
+    totalDuration = sum(ticksDurations)
+    sortedTicksDurations = sorted(ticksDurations)
+    print(f'ticks: {ticks}')
+    print(f'ticks/second: {ticks / totalDuration:.2f}')
+    print(f'mean tick: {(totalDuration / ticks) * 1000:.3f}ms')
+    print(f'p95 tick: {sortedTicksDurations[int(ticks * 0.95) - 1] * 1000:.3f}ms')
+    for name, stats in sorted(getFrameCacheStats().items()):
+        if stats['hits'] + stats['misses'] > 0:
+            print(f"frame cache {name}: {stats['hits']} hits, {stats['misses']} misses")
+
+
+if __name__ == '__main__':
+    main()
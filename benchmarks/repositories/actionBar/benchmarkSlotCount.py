@@ -0,0 +1,37 @@
+import argparse
+import numpy as np
+from glob import glob
+from time import perf_counter
+from src.repositories.actionBar.core import getCountByTesseract, getSlotCountImage
+from src.repositories.actionBar.counts import countsCache, getCount
+from src.utils.image import loadFromRGBToGray
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares reading action bar slots counts with tesseract and with the counts font glyphs')
+    parser.add_argument('--screenshots', type=str, default='tests/unit/repositories/actionBar/core/slotIsAvailable/*.png')
+    parser.add_argument('--slot', type=int, default=1)
+    parser.add_argument('--samples', type=int, default=1000)
+    args = parser.parse_args()
+    countsImages = [getSlotCountImage(loadFromRGBToGray(screenshotPath), args.slot) for screenshotPath in sorted(glob(args.screenshots))]
+    countsImages = [countImage for countImage in countsImages if countImage is not None]
+
+    def getCountWithoutCache(countImage):
+        countsCache.clear()
+        return getCount(countImage)
+
+    for name, read, samples in [('glyphs', getCountWithoutCache, args.samples), ('glyphs cached', getCount, args.samples), ('tesseract', getCountByTesseract, len(countsImages))]:
+        durations = []
+        try:
+            for index in range(samples):
+                startTime = perf_counter()
+                read(countsImages[index % len(countsImages)])
+                durations.append(perf_counter() - startTime)
+        except Exception as exception:
+            print(f'{name}: unavailable ({type(exception).__name__})')
+            continue
+        print(f'{name}: mean {np.mean(durations) * 1000:.3f}ms, p95 {np.percentile(durations, 95) * 1000:.3f}ms')
+
+if __name__ == '__main__':
+    main()
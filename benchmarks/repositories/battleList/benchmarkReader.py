@@ -0,0 +1,47 @@
+import argparse
+import numpy as np
+from time import perf_counter
+from src.repositories.battleList.core import getCreatures
+from src.repositories.battleList.reader import BattleListReader, slotHeight
+from src.utils.image import loadFromRGBToGray
+
+
+# every tick at most one slot changes, it is swapped with a slot of another content
+def getContents(content: np.ndarray, otherContent: np.ndarray, ticks: int, changeRate: float, rng: np.random.Generator):
+    contents = []
+    current = content.copy()
+    for _ in range(ticks):
+        if rng.random() < changeRate:
+            current = current.copy()
+            slotIndex = rng.integers(len(content) // slotHeight)
+            otherSlotIndex = rng.integers(len(otherContent) // slotHeight)
+            current[slotIndex * slotHeight:(slotIndex + 1) * slotHeight] = otherContent[otherSlotIndex * slotHeight:(otherSlotIndex + 1) * slotHeight]
+        contents.append(current)
+    return contents
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares decoding every battle list slot every tick with reusing the slots whose strip did not change')
+    parser.add_argument('--content', type=str, default='tests/unit/repositories/battleList/core/getFilledSlotsCount/fullCreaturesInBattleListContent.png')
+    parser.add_argument('--other-content', type=str, default='tests/unit/repositories/battleList/core/getBeingAttackedCreatures/beingAttackedCreature.png')
+    parser.add_argument('--ticks', type=int, default=1000)
+    parser.add_argument('--change-rate', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    otherContent = loadFromRGBToGray(args.other_content)
+    contents = getContents(loadFromRGBToGray(args.content), otherContent[:3 * slotHeight], args.ticks, args.change_rate, rng)
+    reader = BattleListReader()
+    for name, read in [('full parse', getCreatures), ('row hashes', reader.read)]:
+        read(contents[0])
+        durations = []
+        for content in contents:
+            startTime = perf_counter()
+            read(content)
+            durations.append(perf_counter() - startTime)
+        print(f'{name}: mean {np.mean(durations) * 1000:.3f}ms, p95 {np.percentile(durations, 95) * 1000:.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import argparse
+from numba import njit
+import numpy as np
+import pathlib
+from time import perf_counter
+from src.repositories.gameWindow.creatures import getCreaturesBars
+from src.utils.image import loadFromRGBToGray
+
+
+# the serial scan getCreaturesBars ran before the row bands, kept verbatim as the reference of the banded scan
+@njit(fastmath=True)
+def getSerialBars(gameWindowImage: np.ndarray):
+    bars = []
+    width = gameWindowImage.shape[1] - 27
+    height = gameWindowImage.shape[0] - 3
+    creatureIndex = 0
+    for y in range(height):
+        x = -1
+        while x < width:
+            x += 1
+            if gameWindowImage[y, x + 26] != 0:
+                x += 26
+                continue
+            bothBordersAreBlack = True
+            for l in range(25):
+                key = x + 25 - l
+                if gameWindowImage[y, key] != 0 or gameWindowImage[y + 3, key] != 0:
+                    bothBordersAreBlack = False
+                    x = key
+                    break
+            if bothBordersAreBlack == False:
+                continue
+            if (
+                gameWindowImage[y + 1, x] != 0 or
+                gameWindowImage[y + 2, x] != 0 or
+                gameWindowImage[y + 1, x + 26] != 0 or
+                gameWindowImage[y + 2, x + 26] != 0
+            ):
+                continue
+            bars.append((x, y))
+            creatureIndex += 1
+            x += 26
+    return bars
+
+
+def getSerialCreaturesBars(gameWindowImage: np.ndarray):
+    return [(int(x), int(y)) for (x, y) in getSerialBars(gameWindowImage)]
+
+
+# crowded spawns are drawn over noise when there are no recorded game windows
+def getCrowdedGameWindowImages(samples: int, creatures: int, blackPixels: float, rng: np.random.Generator):
+    gameWindowImages = []
+    for _ in range(samples):
+        gameWindowImage = rng.integers(1, 256, (704, 960), dtype=np.uint8)
+        gameWindowImage[rng.random((704, 960)) < blackPixels] = 0
+        for _ in range(creatures):
+            (x, y) = (rng.integers(0, 960 - 27), rng.integers(0, 704 - 4))
+            gameWindowImage[y:y + 4, x:x + 27] = 0
+            gameWindowImage[y + 1:y + 3, x + 1:x + 26] = 112
+        gameWindowImages.append(gameWindowImage)
+    return gameWindowImages
+
+
+def measure(gameWindowImages, getBars):
+    durations = []
+    for gameWindowImage in gameWindowImages:
+        startTime = perf_counter()
+        getBars(gameWindowImage)
+        durations.append(perf_counter() - startTime)
+    return np.mean(durations) * 1000, np.percentile(durations, 95) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the serial creatures bars scan with the row banded parallel scan')
+    parser.add_argument('--frames', type=str, default=None, help='folder of recorded game window screenshots')
+    parser.add_argument('--samples', type=int, default=50)
+    parser.add_argument('--creatures', type=int, default=30)
+    parser.add_argument('--black-pixels', type=float, default=0.0005, help='share of black pixels drawn as outlines')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    if args.frames is not None:
+        gameWindowImages = [loadFromRGBToGray(str(path)) for path in sorted(pathlib.Path(args.frames).glob('*.png'))]
+    else:
+        gameWindowImages = getCrowdedGameWindowImages(args.samples, args.creatures, args.black_pixels, np.random.default_rng(args.seed))
+    for gameWindowImage in gameWindowImages:
+        assert getCreaturesBars(gameWindowImage) == getSerialCreaturesBars(gameWindowImage)
+    for name, getBars in [('serial', getSerialCreaturesBars), ('banded', getCreaturesBars)]:
+        (meanDuration, p95Duration) = measure(gameWindowImages, getBars)
+        print(f'{name}: mean {meanDuration:.3f}ms, p95 {p95Duration:.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
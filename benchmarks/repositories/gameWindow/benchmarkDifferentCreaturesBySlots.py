@@ -0,0 +1,53 @@
+import argparse
+import numpy as np
+from time import perf_counter
+from src.gameplay.comboSpells.core import spellsPath
+from src.repositories.gameWindow.creatures import getDifferentCreaturesBySlots
+from src.repositories.gameWindow.typings import Creature
+from src.utils.core import hashit
+
+
+# previous implementation, arrays grown with np.append and every pair of creatures hashed
+def getDifferentCreaturesByHashes(previousGameWindowCreatures, currentGameWindowCreatures, slots):
+    previousGameWindowCreaturesBySlots = np.array([], dtype=Creature)
+    differentCreatures = np.array([], dtype=Creature)
+    for previousGameWindowCreature in previousGameWindowCreatures:
+        if np.isin(previousGameWindowCreature['slot'], slots).all():
+            previousGameWindowCreaturesBySlots = np.append(previousGameWindowCreaturesBySlots, [previousGameWindowCreature])
+    for previousGameWindowCreature in previousGameWindowCreaturesBySlots:
+        creatureDoesNotExists = True
+        for currentGameWindowCreature in currentGameWindowCreatures:
+            if hashit(previousGameWindowCreature) == hashit(currentGameWindowCreature):
+                creatureDoesNotExists = False
+                break
+        if creatureDoesNotExists:
+            differentCreatures = np.append(differentCreatures, [previousGameWindowCreature])
+    return differentCreatures
+
+
+def getCreatures(rng: np.random.Generator, count: int):
+    return [{'name': 'Rotworm', 'type': 'monster', 'isBeingAttacked': False, 'slot': (int(rng.integers(4, 11)), int(rng.integers(2, 9))),
+             'coordinate': [33000, 32000, 7], 'windowCoordinate': (0, 0), 'gameWindowCoordinate': (0, 0), 'isUnderRoof': False} for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares finding creatures killed by an area spell with pair hashing and with slot keys')
+    parser.add_argument('--samples', type=int, default=1000)
+    parser.add_argument('--creatures', type=int, default=12)
+    parser.add_argument('--spell', type=str, default='exori mas')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    ticks = [(getCreatures(rng, args.creatures), getCreatures(rng, args.creatures // 2)) for _ in range(args.samples)]
+    for name, getDifferentCreatures in [('pair hashing', getDifferentCreaturesByHashes), ('slot keys', getDifferentCreaturesBySlots)]:
+        durations = []
+        for previousGameWindowCreatures, currentGameWindowCreatures in ticks:
+            startTime = perf_counter()
+            getDifferentCreatures(previousGameWindowCreatures, currentGameWindowCreatures, spellsPath[args.spell])
+            durations.append(perf_counter() - startTime)
+        print(f'{name}: mean {np.mean(durations) * 1000000:.1f}us, p95 {np.percentile(durations, 95) * 1000000:.1f}us')
+
+
+if __name__ == '__main__':
+    main()
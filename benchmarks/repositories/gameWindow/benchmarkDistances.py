@@ -0,0 +1,53 @@
+import argparse
+import numpy as np
+from time import perf_counter
+import tcod
+from src.repositories.gameWindow.distances import getSlotsDistances, isSlotReachable
+
+
+# the old tick built a tcod graph for the closest creature and an A* for the target creature
+def getTcodTick(walkableSqms: np.ndarray, creaturesSlots: np.ndarray):
+    graph = tcod.path.SimpleGraph(cost=walkableSqms, cardinal=1, diagonal=0)
+    pf = tcod.path.Pathfinder(graph)
+    pf.add_root((5, 7))
+    for (x, y) in creaturesSlots:
+        pf.resolve((y, x))
+    blockedWalkableSqms = walkableSqms.copy()
+    blockedWalkableSqms[creaturesSlots[:, 1], creaturesSlots[:, 0]] = 0
+    blockedWalkableSqms[creaturesSlots[0, 1], creaturesSlots[0, 0]] = 1
+    tcod.path.AStar(blockedWalkableSqms, 0).get_path(5, 7, creaturesSlots[0, 1], creaturesSlots[0, 0])
+
+
+def getKernelTick(walkableSqms: np.ndarray, creaturesSlots: np.ndarray):
+    distances = getSlotsDistances(walkableSqms, creaturesSlots[:0])
+    distances[creaturesSlots[:, 1], creaturesSlots[:, 0]].argmin()
+    isSlotReachable(getSlotsDistances(walkableSqms, creaturesSlots), creaturesSlots[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares tcod pathfinding with the numba distances kernel on the game window')
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('--creatures', type=int, default=6)
+    parser.add_argument('--walls', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    ticks = []
+    for _ in range(args.samples):
+        walkableSqms = (rng.random((11, 15)) >= args.walls).astype(np.uint8)
+        walkableSqms[5, 7] = 1
+        creaturesSlots = np.stack([rng.integers(0, 15, args.creatures), rng.integers(0, 11, args.creatures)], axis=1).astype(np.int32)
+        ticks.append((walkableSqms, creaturesSlots))
+    getKernelTick(*ticks[0])
+    for name, tick in [('tcod', getTcodTick), ('numba kernel', getKernelTick)]:
+        durations = []
+        for walkableSqms, creaturesSlots in ticks:
+            startTime = perf_counter()
+            tick(walkableSqms, creaturesSlots)
+            durations.append(perf_counter() - startTime)
+        print(f'{name}: mean {np.mean(durations) * 1000000:.1f}us, p95 {np.percentile(durations, 95) * 1000000:.1f}us')
+
+
+if __name__ == '__main__':
+    main()
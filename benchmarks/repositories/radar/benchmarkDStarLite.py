@@ -0,0 +1,71 @@
+import argparse
+import numpy as np
+from time import perf_counter
+from src.gameplay.core.flowFields import flowFieldsMinCost
+from src.gameplay.core.waypoint import generateRadarWalkpoints
+from src.repositories.radar.config import floorsPathsSqms, packedWalkableFloorsSqms
+from src.repositories.radar.dStarLite import DStarLitePlanner
+from src.repositories.radar.flowFields import getFlowFieldRegion, getRegionCosts
+from src.repositories.radar.walkableSqms import isSqmWalkable
+from src.utils.coordinate import getCoordinateFromPixel
+
+
+def getWalks(floorLevel: int, samples: int, distance: int, rng: np.random.Generator):
+    ys, xs = np.nonzero(np.unpackbits(packedWalkableFloorsSqms[floorLevel], axis=-1))
+    walks = []
+    while len(walks) < samples:
+        index = rng.integers(len(xs))
+        (goalX, goalY) = (xs[index] + rng.integers(-distance, distance + 1), ys[index] + rng.integers(-distance, distance + 1))
+        if isSqmWalkable(packedWalkableFloorsSqms, goalX, goalY, floorLevel):
+            walks.append((getCoordinateFromPixel((xs[index], ys[index])) + (floorLevel,),
+                          getCoordinateFromPixel((goalX, goalY)) + (floorLevel,)))
+    return walks
+
+
+# creatures wander around the player, every tick a few of them step to a neighbour sqm
+def getCreaturesTicks(coordinate, ticks: int, creaturesCount: int, rng: np.random.Generator):
+    creatures = [(coordinate[0] + rng.integers(-7, 8), coordinate[1] + rng.integers(-5, 6)) for _ in range(creaturesCount)]
+    creaturesTicks = []
+    for _ in range(ticks):
+        creatures = [(x + rng.integers(-1, 2), y + rng.integers(-1, 2)) if rng.random() < 0.3 else (x, y) for (x, y) in creatures]
+        creaturesTicks.append([(int(x), int(y), coordinate[2]) for (x, y) in creatures if (x, y) != tuple(coordinate[:2])])
+    return creaturesTicks
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares replanning the radar A* every tick with repairing a D* Lite planner')
+    parser.add_argument('--floor', type=int, default=7)
+    parser.add_argument('--samples', type=int, default=20)
+    parser.add_argument('--distance', type=int, default=30)
+    parser.add_argument('--ticks', type=int, default=100)
+    parser.add_argument('--creatures', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    (_, floorHeight, packedFloorWidth) = packedWalkableFloorsSqms.shape
+    fullDurations = []
+    repairDurations = []
+    repairCosts = []
+    for coordinate, goalCoordinate in getWalks(args.floor, args.samples, args.distance, rng):
+        creaturesTicks = getCreaturesTicks(coordinate, args.ticks, args.creatures, rng)
+        region = getFlowFieldRegion(goalCoordinate, coordinate, floorHeight, packedFloorWidth * 8)
+        costs = getRegionCosts(packedWalkableFloorsSqms, floorsPathsSqms, region, args.floor, flowFieldsMinCost)
+        planner = DStarLitePlanner(goalCoordinate, region, costs, flowFieldsMinCost)
+        planner.updateNonWalkableCoordinates(coordinate, [])
+        for creatures in creaturesTicks:
+            startTime = perf_counter()
+            generateRadarWalkpoints(coordinate, goalCoordinate, creatures)
+            fullDurations.append(perf_counter() - startTime)
+            startTime = perf_counter()
+            planner.updateNonWalkableCoordinates(coordinate, creatures)
+            planner.getWalkpoints(coordinate)
+            repairDurations.append(perf_counter() - startTime)
+        repairCosts.append(planner.getMetrics()['meanRepairCost'])
+    for name, durations in [('full replan', fullDurations), ('d* lite repair', repairDurations)]:
+        print(f'{name}: mean {np.mean(durations) * 1000:.3f}ms, p95 {np.percentile(durations, 95) * 1000:.3f}ms')
+    print(f'mean repair cost: {np.mean(repairCosts):.1f} expanded sqms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import numpy as np
+from time import perf_counter
+from src.repositories.radar.config import dimensions, floorsCoarseImgs, floorsConfidence, floorsImgs, floorsPyramidFactor, nonWalkablePixelsColors
+from src.utils.core import locate, locateByPyramid
+
+
+crossRows = np.array([52, 52, 53, 53, 54, 54, 55, 55, 54, 54, 55, 55, 54, 54, 55, 55, 56, 56, 57, 57])
+crossColumns = np.array([53, 54, 53, 54, 51, 52, 51, 52, 53, 54, 53, 54, 55, 56, 55, 56, 53, 54, 53, 54])
+
+
+def getRadarImages(floorLevel: int, samples: int, seed: int):
+    floorImg = floorsImgs[floorLevel]
+    ys, xs = np.nonzero(~np.isin(floorImg, nonWalkablePixelsColors))
+    insideIndexes = np.flatnonzero((ys >= dimensions['halfHeight']) & (ys < len(floorImg) - dimensions['halfHeight'] - 1) &
+                                   (xs >= dimensions['halfWidth']) & (xs < len(floorImg[0]) - dimensions['halfWidth']))
+    randomIndexes = np.random.default_rng(seed).choice(insideIndexes, min(samples, len(insideIndexes)), replace=False)
+    radarImages = []
+    for index in randomIndexes:
+        (x, y) = (xs[index] - dimensions['halfWidth'], ys[index] - dimensions['halfHeight'])
+        radarImage = floorImg[y:y + dimensions['height'], x:x + dimensions['width']].copy()
+        # same cross getCoordinate draws before matching
+        radarImage[crossRows, crossColumns] = 128
+        radarImages.append(((x, y), radarImage))
+    return radarImages
+
+
+def measure(radarImages, locateRadarImage):
+    durations = []
+    hits = 0
+    for position, radarImage in radarImages:
+        startTime = perf_counter()
+        result = locateRadarImage(radarImage)
+        durations.append(perf_counter() - startTime)
+        if result is not None and (result[0], result[1]) == position:
+            hits += 1
+    sortedDurations = sorted(durations)
+    return np.mean(durations) * 1000, sortedDurations[int(len(durations) * 0.95) - 1] * 1000, hits / len(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the full floor radar template match with the coarse-to-fine pyramid search')
+    parser.add_argument('--floor', type=int, default=7)
+    parser.add_argument('--samples', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    radarImages = getRadarImages(args.floor, args.samples, args.seed)
+    fullFloorResult = measure(radarImages, lambda radarImage: locate(
+        floorsImgs[args.floor], radarImage, confidence=0.75))
+    pyramidResult = measure(radarImages, lambda radarImage: locateByPyramid(
+        floorsImgs[args.floor], floorsCoarseImgs[args.floor], radarImage, floorsPyramidFactor, confidence=floorsConfidence[args.floor]))
+    for name, (meanDuration, p95Duration, accuracy) in [('full floor', fullFloorResult), ('pyramid', pyramidResult)]:
+        print(f'{name}: mean {meanDuration:.3f}ms, p95 {p95Duration:.3f}ms, accuracy {accuracy * 100:.1f}%')
+
+
+if __name__ == '__main__':
+    main()
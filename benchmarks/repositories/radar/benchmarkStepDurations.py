@@ -0,0 +1,47 @@
+import argparse
+import numpy as np
+from time import perf_counter
+from src.repositories.radar.config import packedWalkableFloorsSqms
+from src.repositories.radar.core import getBreakpointTileMovementSpeed, getPathStepDurations, getTileFrictionByCoordinate
+from src.utils.coordinate import getCoordinateFromPixel
+
+
+def getPaths(floorLevel: int, samples: int, pathLength: int, rng: np.random.Generator):
+    ys, xs = np.nonzero(np.unpackbits(packedWalkableFloorsSqms[floorLevel], axis=-1))
+    paths = []
+    for index in rng.choice(len(xs), samples):
+        (x, y) = getCoordinateFromPixel((xs[index], ys[index]))
+        paths.append(np.array([(x + step, y, floorLevel) for step in range(pathLength)], dtype=np.int32))
+    return paths
+
+
+def measure(paths, charSpeeds, getStepDurations):
+    startTime = perf_counter()
+    for path, charSpeed in zip(paths, charSpeeds):
+        getStepDurations(charSpeed, path)
+    return (perf_counter() - startTime) / len(paths) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares per tile step durations with the speed by friction lookup table')
+    parser.add_argument('--floor', type=int, default=7)
+    parser.add_argument('--samples', type=int, default=1000)
+    parser.add_argument('--pathLength', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    paths = getPaths(args.floor, args.samples, args.pathLength, rng)
+    charSpeeds = rng.integers(100, 2500, args.samples).tolist()
+    def getPerTileStepDurations(charSpeed, path):
+        return [getBreakpointTileMovementSpeed(charSpeed, getTileFrictionByCoordinate(walkpoint)) for walkpoint in path]
+    for path, charSpeed in zip(paths, charSpeeds):
+        assert getPathStepDurations(charSpeed, path).tolist() == getPerTileStepDurations(charSpeed, path)
+    perTileDuration = measure(paths, charSpeeds, getPerTileStepDurations)
+    tableDuration = measure(paths, charSpeeds, getPathStepDurations)
+    print(f'per tile: {perTileDuration:.3f}ms per {args.pathLength} tiles path')
+    print(f'lookup table: {tableDuration:.3f}ms per {args.pathLength} tiles path ({perTileDuration / tableDuration:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
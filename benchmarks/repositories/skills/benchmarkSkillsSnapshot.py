@@ -0,0 +1,41 @@
+import argparse
+import numpy as np
+from glob import glob
+from time import perf_counter
+from src.repositories.skills.core import getMinutesCount, getValuesCount
+from src.repositories.skills.locators import getSkillsIconPosition
+from src.repositories.skills.snapshot import SkillsReader, skillsPanelX, skillsRowsAreValues, skillsRowsOffsets
+from src.utils.image import loadFromRGBToGray
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares reading the skills rows one by one with their hashes and reading them into a snapshot')
+    parser.add_argument('--screenshots', type=str, default='tests/unit/repositories/actionBar/core/*/*.png')
+    parser.add_argument('--samples', type=int, default=1000)
+    args = parser.parse_args()
+    screenshots = [loadFromRGBToGray(screenshotPath) for screenshotPath in sorted(glob(args.screenshots))]
+    screenshots = [screenshot for screenshot in screenshots if getSkillsIconPosition(screenshot) is not None]
+
+    # what getHp, getMana, getCapacity, getSpeed, getFood and getStamina did before sharing the snapshot
+    def readRowsByHashes(screenshot):
+        (x, y, width, height) = getSkillsIconPosition(screenshot)
+        return [getValuesCount(screenshot, (x + skillsPanelX, y + rowOffset, width, height)) if isValue else getMinutesCount(screenshot, (x + skillsPanelX, y + rowOffset, width, height))
+                for rowOffset, isValue in zip(skillsRowsOffsets, skillsRowsAreValues)]
+
+    def readSnapshot(screenshot):
+        return SkillsReader().read(screenshot)
+
+    skillsReader = SkillsReader()
+    for name, read in [('hashes', readRowsByHashes), ('snapshot', readSnapshot), ('snapshot reused', skillsReader.read)]:
+        read(screenshots[0])
+        durations = []
+        for index in range(args.samples):
+            startTime = perf_counter()
+            read(screenshots[index % len(screenshots)])
+            durations.append(perf_counter() - startTime)
+        print(f'{name}: mean {np.mean(durations) * 1000:.3f}ms, p95 {np.percentile(durations, 95) * 1000:.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
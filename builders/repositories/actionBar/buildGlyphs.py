@@ -0,0 +1,39 @@
+import argparse
+import os
+from src.repositories.actionBar.counts import getCountGlyphs
+from src.repositories.actionBar.core import getSlotCountImage
+from src.utils.image import loadFromRGBToGray, save
+
+
+glyphsImagesPath = 'src/repositories/actionBar/images/glyphs'
+
+
+# every glyph of a recorded slot count is saved as the template of its digit, recorded templates are kept
+def main():
+    parser = argparse.ArgumentParser(
+        description='Saves the counts font glyphs of recorded screenshots whose slot count is known')
+    parser.add_argument('--screenshot', type=str, action='append', required=True)
+    parser.add_argument('--slot', type=int, action='append', required=True)
+    parser.add_argument('--count', type=int, action='append', required=True)
+    args = parser.parse_args()
+    os.makedirs(glyphsImagesPath, exist_ok=True)
+    for screenshotPath, slot, count in zip(args.screenshot, args.slot, args.count):
+        countImage = getSlotCountImage(loadFromRGBToGray(screenshotPath), slot)
+        if countImage is None:
+            print(f'{screenshotPath}: action bar not found')
+            continue
+        glyphs = getCountGlyphs(countImage)
+        if len(glyphs) != len(str(count)):
+            print(f'{screenshotPath}: {len(glyphs)} glyphs found for count {count}')
+            continue
+        for glyph, digit in zip(glyphs, str(count)):
+            if os.path.exists(f'{glyphsImagesPath}/{digit}.png'):
+                continue
+            save(glyph.copy(), f'{glyphsImagesPath}/{digit}.png')
+    missingDigits = [digit for digit in range(10) if not os.path.exists(f'{glyphsImagesPath}/{digit}.png')]
+    if len(missingDigits) > 0:
+        print(f'digits without glyph: {missingDigits}, counts with them are not read')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,48 +1,80 @@
+import argparse
 import numpy as np
+from src.utils.assetsBundle import createAssetsBundle
 from src.utils.image import loadFromRGBToGray, save
 from src.wiki.creatures import creatures
 
 
-def main():
-    for monster in creatures:
-        monsterLetters = np.zeros((11, 0), dtype=np.uint8)
-        for index, letter in enumerate(monster):
-            letter = letter if letter != ' ' else 'space'
-            letter = letter if letter != '.' else 'dot'
-            letterBasePath = 'src/repositories/gameWindow/images/letters/uppercase' if letter.isupper() else 'src/repositories/gameWindow/images/letters/lowercase'
-            letterFullPath = '{0}/{1}.png'.format(letterBasePath, letter)
-            letterAsArray = loadFromRGBToGray(letterFullPath).copy()
-            letterAsArray[np.nonzero(letterAsArray == 0)] = 1
-            letterAsArray[np.nonzero(letterAsArray == 255)] = 0
-            if index > 0:
-                previousLetter = monster[index - 1]
-                previousLetterIsMessLetter = (previousLetter == 't' or previousLetter == 'T' or previousLetter ==
-                                            'r' or previousLetter == 'R' or previousLetter == 'f' or previousLetter == 'L')
-                letterIsMessLetter = (letter == 't' or letter ==
-                                    'T' or letter == 'f' or letter == 'J')
-                if previousLetterIsMessLetter or letterIsMessLetter:
-                    size = 2 if previousLetterIsMessLetter and letterIsMessLetter else 1
-                    ultimaFileiraDaImagem = monsterLetters[:,
-                                                        monsterLetters.shape[1] - size:monsterLetters.shape[1]]
-                    primeiraFileiraDaProximaLetra = letterAsArray[:, 0:size]
-                    somaDasDuas = np.add(ultimaFileiraDaImagem,
-                                        primeiraFileiraDaProximaLetra)
-                    monsterLetters = monsterLetters[:,
-                                                    0:monsterLetters.shape[1] - size]
-                    monsterLetters = np.hstack((monsterLetters, somaDasDuas))
-                    restoDaProximaLetra = letterAsArray[:,
-                                                        size:letterAsArray.shape[1]]
-                    monsterLetters = np.hstack(
-                        (monsterLetters, restoDaProximaLetra))
-                else:
-                    monsterLetters = np.hstack((monsterLetters, letterAsArray))
+# the gameWindow config is not imported, it maps the bundle this script rewrites
+creaturesNamesAtlasPath = 'src/repositories/gameWindow/npys/creaturesNamesAtlas.bin'
+
+
+def getMonsterNameImg(monster: str) -> np.ndarray:
+    monsterLetters = np.zeros((11, 0), dtype=np.uint8)
+    for index, letter in enumerate(monster):
+        letter = letter if letter != ' ' else 'space'
+        letter = letter if letter != '.' else 'dot'
+        letterBasePath = 'src/repositories/gameWindow/images/letters/uppercase' if letter.isupper() else 'src/repositories/gameWindow/images/letters/lowercase'
+        letterFullPath = '{0}/{1}.png'.format(letterBasePath, letter)
+        letterAsArray = loadFromRGBToGray(letterFullPath).copy()
+        letterAsArray[np.nonzero(letterAsArray == 0)] = 1
+        letterAsArray[np.nonzero(letterAsArray == 255)] = 0
+        if index > 0:
+            previousLetter = monster[index - 1]
+            previousLetterIsMessLetter = (previousLetter == 't' or previousLetter == 'T' or previousLetter ==
+                                        'r' or previousLetter == 'R' or previousLetter == 'f' or previousLetter == 'L')
+            letterIsMessLetter = (letter == 't' or letter ==
+                                'T' or letter == 'f' or letter == 'J')
+            if previousLetterIsMessLetter or letterIsMessLetter:
+                size = 2 if previousLetterIsMessLetter and letterIsMessLetter else 1
+                ultimaFileiraDaImagem = monsterLetters[:,
+                                                    monsterLetters.shape[1] - size:monsterLetters.shape[1]]
+                primeiraFileiraDaProximaLetra = letterAsArray[:, 0:size]
+                somaDasDuas = np.add(ultimaFileiraDaImagem,
+                                    primeiraFileiraDaProximaLetra)
+                monsterLetters = monsterLetters[:,
+                                                0:monsterLetters.shape[1] - size]
+                monsterLetters = np.hstack((monsterLetters, somaDasDuas))
+                restoDaProximaLetra = letterAsArray[:,
+                                                    size:letterAsArray.shape[1]]
+                monsterLetters = np.hstack(
+                    (monsterLetters, restoDaProximaLetra))
             else:
                 monsterLetters = np.hstack((monsterLetters, letterAsArray))
-        monsterLetters[np.nonzero(monsterLetters == 0)] = 255
-        monsterLetters[np.nonzero(monsterLetters == 1)] = 0
-        monsterLetters[np.nonzero(monsterLetters == 2)] = 0
-        save(
-            monsterLetters, 'src/repositories/gameWindow/images/monsters/{}.png'.format(monster))
+        else:
+            monsterLetters = np.hstack((monsterLetters, letterAsArray))
+    monsterLetters[np.nonzero(monsterLetters == 0)] = 255
+    monsterLetters[np.nonzero(monsterLetters == 1)] = 0
+    monsterLetters[np.nonzero(monsterLetters == 2)] = 0
+    return monsterLetters
+
+
+# every name template is stored side by side in a single 11 pixels tall buffer, sliced by offset and width
+def main():
+    parser = argparse.ArgumentParser(
+        description='Renders the creatures names templates into the names atlas and their pngs')
+    parser.add_argument('--atlas-only', action='store_true', help='only writes the atlas, the committed pngs are left untouched')
+    args = parser.parse_args()
+    monstersNamesImgs = []
+    for monster in creatures:
+        monsterNameImg = getMonsterNameImg(monster)
+        if not args.atlas_only:
+            save(monsterNameImg, 'src/repositories/gameWindow/images/monsters/{}.png'.format(monster))
+        monstersNamesImgs.append(monsterNameImg)
+    widths = np.array([monsterNameImg.shape[1] for monsterNameImg in monstersNamesImgs], dtype=np.int32)
+    creaturesNamesAtlas = createAssetsBundle(creaturesNamesAtlasPath, {
+        'names': ((len(creatures),), '<U64'),
+        'offsets': ((len(creatures),), 'int32'),
+        'widths': ((len(creatures),), 'int32'),
+        'templates': ((11, int(widths.sum())), 'uint8'),
+    })
+    creaturesNamesAtlas['names'][:] = list(creatures)
+    creaturesNamesAtlas['widths'][:] = widths
+    creaturesNamesAtlas['offsets'][:] = np.cumsum(widths) - widths
+    for offset, monsterNameImg in zip(creaturesNamesAtlas['offsets'], monstersNamesImgs):
+        creaturesNamesAtlas['templates'][:, offset:offset + monsterNameImg.shape[1]] = monsterNameImg
+    for asset in creaturesNamesAtlas.values():
+        asset.flush()
 
 
 if __name__ == '__main__':
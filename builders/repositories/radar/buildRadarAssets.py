@@ -0,0 +1,42 @@
+import numpy as np
+from src.repositories.radar.walkableSqms import packWalkableFloorsSqms
+from src.utils.assetsBundle import createAssetsBundle
+from src.utils.core import downsample
+from src.utils.image import load, loadFromRGBToGray
+
+
+# the radar config is not imported, it maps the bundle this script rewrites
+radarAssetsPath = 'src/repositories/radar/npys/radarAssets.bin'
+floorsImagesPath = 'src/repositories/radar/images'
+floorsCount = 16
+floorHeight = 2048
+floorWidth = 2560
+# must match floorsPyramidFactor of src/repositories/radar/config.py
+floorsPyramidFactor = 4
+
+
+def main():
+    floorShape = (floorsCount, floorHeight, floorWidth)
+    coarseFloorShape = (floorsCount, floorHeight // floorsPyramidFactor, floorWidth // floorsPyramidFactor)
+    radarAssets = createAssetsBundle(radarAssetsPath, {
+        'floors': (floorShape, 'uint8'),
+        'floorsCoarse': (coarseFloorShape, 'uint8'),
+        'floorsPathsSqms': (floorShape, 'uint8'),
+        'packedWalkableFloorsSqms': ((floorsCount, floorHeight, floorWidth // 8), 'uint8'),
+    })
+    # floors are decoded one at a time, only a single floor of each kind is held in memory
+    for floor in range(floorsCount):
+        floorImg = loadFromRGBToGray(f'{floorsImagesPath}/floor-{floor}.png')
+        radarAssets['floors'][floor] = floorImg
+        radarAssets['floorsCoarse'][floor] = downsample(floorImg, floorsPyramidFactor)
+        floorPathsImg = loadFromRGBToGray(f'{floorsImagesPath}/paths/floor-{floor}.png')
+        radarAssets['packedWalkableFloorsSqms'][floor] = packWalkableFloorsSqms(
+            np.where(np.isin(floorPathsImg, [105, 226]), 0, 1))
+        radarAssets['floorsPathsSqms'][floor] = load(
+            f'{floorsImagesPath}/paths/floor-{floor}.png')[:, :, 0]
+    for asset in radarAssets.values():
+        asset.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,64 +1,92 @@
+from concurrent.futures import ProcessPoolExecutor
+import glob
 import numpy as np
+import os
+import shutil
 from src.repositories.radar.typings import CoordinateHash
-from src.repositories.radar.config import nonWalkablePixelsColors
+from src.repositories.radar.config import dimensions, floors, nonWalkablePixelsColors
 from src.utils.core import hashit
 from src.utils.image import loadFromRGBToGray
 
 
+floorsImagesPath = 'src/repositories/radar/images'
+radarImagesCoordinatesPath = 'src/repositories/radar/npys/radarImagesCoordinates.npy'
+shardsPath = 'src/repositories/radar/npys/radarImagesCoordinatesShards'
+startingXCoordinate = 31744
+startingYCoordinate = 30976
+rowsPerBand = 128
+# records are partitioned by the highest byte of the hash, so each bucket can be sorted on its own
+bucketsCount = 256
+crossRows = np.array([52, 52, 53, 53, 54, 54, 55, 55, 54, 54, 55, 55, 54, 54, 55, 55, 56, 56, 57, 57])
+crossColumns = np.array([53, 54, 53, 54, 51, 52, 51, 52, 53, 54, 53, 54, 55, 56, 55, 56, 53, 54, 53, 54])
+
+
+def getBands():
+    floorHeight = len(loadFromRGBToGray(f'{floorsImagesPath}/floor-0.png'))
+    return [(floorLevel, yStart, min(yStart + rowsPerBand, floorHeight)) for floorLevel in floors for yStart in range(0, floorHeight, rowsPerBand)]
+
+
+def buildBand(floorLevel: int, yStart: int, yEnd: int) -> int:
+    pixels = loadFromRGBToGray(f'{floorsImagesPath}/floor-{floorLevel}.png')
+    # pixels outside of the floor are black, as the radar shows them near the map borders
+    paddedPixels = np.pad(pixels, ((dimensions['halfHeight'], dimensions['halfHeight'] + 1),
+                          (dimensions['halfWidth'], dimensions['halfWidth'])))
+    ys, xs = np.nonzero(~np.isin(pixels[yStart:yEnd], nonWalkablePixelsColors))
+    ys = ys + yStart
+    hashes = np.zeros(len(ys), dtype=np.uint64)
+    for index, (y, x) in enumerate(zip(ys, xs)):
+        radarImage = paddedPixels[y:y + dimensions['height'], x:x + dimensions['width']].copy()
+        isWhitePixel = pixels[y, x] == 255 or pixels[y, x] == 239
+        radarImage[crossRows, crossColumns] = 0 if isWhitePixel else 255
+        hashes[index] = hashit(radarImage)
+    records = np.zeros(len(ys), dtype=CoordinateHash)
+    records['hash'] = hashes
+    records['x'] = startingXCoordinate + xs
+    records['y'] = startingYCoordinate + ys
+    records['z'] = floorLevel
+    buckets = (records['hash'] >> np.uint64(56)).astype(np.int64)
+    sortedIndexes = np.argsort(buckets, kind='stable')
+    bucketsStarts = np.searchsorted(buckets[sortedIndexes], np.arange(bucketsCount + 1))
+    for bucket in range(bucketsCount):
+        bucketRecords = records[sortedIndexes[bucketsStarts[bucket]:bucketsStarts[bucket + 1]]]
+        if len(bucketRecords) > 0:
+            np.save(f'{shardsPath}/{bucket:03}-{floorLevel:02}-{yStart:04}.npy', bucketRecords)
+    return len(records)
+
+
+# hashes shared by more than one coordinate cannot tell where the player is, so they are dropped
+def mergeBucket(bucket: int) -> int:
+    shardsPaths = sorted(glob.glob(f'{shardsPath}/{bucket:03}-*.npy'))
+    if len(shardsPaths) == 0:
+        return 0
+    records = np.concatenate([np.load(shardPath) for shardPath in shardsPaths])
+    records = records[np.argsort(records['hash'], kind='stable')]
+    _, uniqueIndexes, counts = np.unique(records['hash'], return_index=True, return_counts=True)
+    records = records[uniqueIndexes[counts == 1]]
+    for shardPath in shardsPaths:
+        os.remove(shardPath)
+    np.save(f'{shardsPath}/{bucket:03}.npy', records)
+    return len(records)
+
+
 def main():
-    floorLevel = 7
-    coordinatesAsArray = np.array([], dtype=CoordinateHash)
-    startingXCoordinate = 31744
-    startingYCoordinate = 30976
-    pixels = loadFromRGBToGray('radar/images/floor-7.png')
-    for y, rowPixels in enumerate(pixels):
-        for x, pixelColor in enumerate(rowPixels):
-            isNonWalkablePixel = np.isin(
-                pixelColor, nonWalkablePixelsColors)
-            if isNonWalkablePixel:
-                continue
-            coordinate = (startingXCoordinate + x,
-                          startingYCoordinate + y, floorLevel)
-            if y <= 54:
-                coordinateScreenshot = pixels[0:y+54, x-53:x+53]
-                blackPixelsMatrix = np.zeros((54-y, 106), dtype=np.uint8)
-                coordinateScreenshot = np.concatenate(
-                    (blackPixelsMatrix, coordinateScreenshot), axis=0)
-            elif (y + 54) > 2048:
-                continue
-                # coordinateScreenshot = pixels[y-54:2048, x-53:x+53]
-                # blackPixelsMatrix = np.zeros((y - 54, 106), dtype=np.uint8)
-                # coordinateScreenshot = np.concatenate((blackPixelsMatrix, coordinateScreenshot), axis=0)
-            else:
-                coordinateScreenshot = pixels[y-54:y+55, x-53:x+53]
-            isWhitePixel = pixelColor == 255 or pixelColor == 239
-            crossPixelColor = 0 if isWhitePixel else 255
-            coordinateScreenshot[52, 53] = crossPixelColor
-            coordinateScreenshot[52, 54] = crossPixelColor
-            coordinateScreenshot[53, 53] = crossPixelColor
-            coordinateScreenshot[53, 54] = crossPixelColor
-            coordinateScreenshot[54, 51] = crossPixelColor
-            coordinateScreenshot[54, 52] = crossPixelColor
-            coordinateScreenshot[55, 51] = crossPixelColor
-            coordinateScreenshot[55, 52] = crossPixelColor
-            coordinateScreenshot[54, 53] = crossPixelColor
-            coordinateScreenshot[54, 54] = crossPixelColor
-            coordinateScreenshot[55, 53] = crossPixelColor
-            coordinateScreenshot[55, 54] = crossPixelColor
-            coordinateScreenshot[54, 55] = crossPixelColor
-            coordinateScreenshot[54, 56] = crossPixelColor
-            coordinateScreenshot[55, 55] = crossPixelColor
-            coordinateScreenshot[55, 56] = crossPixelColor
-            coordinateScreenshot[56, 53] = crossPixelColor
-            coordinateScreenshot[56, 54] = crossPixelColor
-            coordinateScreenshot[57, 53] = crossPixelColor
-            coordinateScreenshot[57, 54] = crossPixelColor
-            coordinateHash = hashit(coordinateScreenshot)
-            coordinatesToAppend = np.array(
-                [(coordinateHash, coordinate)], dtype=CoordinateHash)
-            coordinatesAsArray = np.append(
-                coordinatesAsArray, coordinatesToAppend)
-    np.save('radar/npys/radarImagesCoordinates.npy', coordinatesAsArray)
+    shutil.rmtree(shardsPath, ignore_errors=True)
+    os.makedirs(shardsPath)
+    bands = getBands()
+    with ProcessPoolExecutor() as executor:
+        recordsCount = sum(executor.map(buildBand, *zip(*bands)))
+        bucketsRecordsCount = list(executor.map(mergeBucket, range(bucketsCount)))
+    radarImagesCoordinates = np.lib.format.open_memmap(
+        radarImagesCoordinatesPath, mode='w+', dtype=CoordinateHash, shape=(sum(bucketsRecordsCount),))
+    offset = 0
+    for bucket, bucketRecordsCount in enumerate(bucketsRecordsCount):
+        if bucketRecordsCount == 0:
+            continue
+        radarImagesCoordinates[offset:offset + bucketRecordsCount] = np.load(f'{shardsPath}/{bucket:03}.npy')
+        offset += bucketRecordsCount
+    radarImagesCoordinates.flush()
+    shutil.rmtree(shardsPath)
+    print(f'{offset} of {recordsCount} walkable coordinates have an unique radar image')
 
 
 if __name__ == '__main__':
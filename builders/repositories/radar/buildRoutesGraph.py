@@ -0,0 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from time import time
+from src.repositories.radar.config import availableTilesFrictions, floors, floorsImgs, floorsPathsSqms, packedWalkableFloorsSqms, pixelsColorsValues, routesGraphPath
+from src.repositories.radar.routes import buildFloorRoutesGraph, getFloorChangeSqms, getSqmsCosts, mergeRoutesGraphs
+from src.utils.assetsBundle import createAssetsBundle
+
+
+# frictions under the fastest known ground are map markers, they are charged as the fastest ground
+minCost = int(availableTilesFrictions[0])
+
+
+def getFloorCostsAndChangesSqms(floorLevel: int):
+    walkableSqms = np.unpackbits(packedWalkableFloorsSqms[floorLevel], axis=-1)
+    return getSqmsCosts(walkableSqms, floorsPathsSqms[floorLevel], minCost), getFloorChangeSqms(floorsImgs[floorLevel], walkableSqms, pixelsColorsValues['accessPoint'])
+
+
+def buildFloor(floorLevel: int):
+    floorsCosts = {}
+    floorsChangesSqms = {}
+    for otherFloorLevel in (floorLevel - 1, floorLevel, floorLevel + 1):
+        if otherFloorLevel in floors:
+            (floorsCosts[otherFloorLevel], floorsChangesSqms[otherFloorLevel]) = getFloorCostsAndChangesSqms(otherFloorLevel)
+    return buildFloorRoutesGraph(floorLevel, floorsCosts, floorsChangesSqms)
+
+
+def main():
+    startedAt = time()
+    with ProcessPoolExecutor() as executor:
+        floorsRoutesGraphs = list(executor.map(buildFloor, floors))
+    (_, floorHeight, packedFloorWidth) = packedWalkableFloorsSqms.shape
+    routesGraph = mergeRoutesGraphs(floorsRoutesGraphs, floorHeight, packedFloorWidth * 8, len(floors), minCost)
+    routesGraphBundle = createAssetsBundle(routesGraphPath, {name: (array.shape, array.dtype.str) for name, array in routesGraph.items()})
+    for name, array in routesGraph.items():
+        routesGraphBundle[name][:] = array
+        routesGraphBundle[name].flush()
+    print(f'{len(routesGraph["nodesX"])} nodes and {len(routesGraph["edgesTargets"])} edges built in {time() - startedAt:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
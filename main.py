@@ -3,8 +3,11 @@ from src.gameplay.threads.pilotNG import PilotNGThread
 from src.gameplay.threads.ui import UIThread
 from src.gameplay.threads.alert import AlertThread
 from src.ui.context import Context
+from src.utils.core import setFrameSource
+from src.utils.frameSources import DxcamFrameSource
 
 def main():
+    setFrameSource(DxcamFrameSource(useRegionsOfInterest=True))
     contextInstance = Context(context)
     uiThreadInstance = UIThread(contextInstance)
     uiThreadInstance.start()
@@ -9,6 +9,13 @@ context = {
     'ng_battleList': {
         'beingAttackedCreatureCategory': None,
         'creatures': [],
+        'creaturesDiff': {
+            'added': [],
+            'removed': [],
+            'previousTarget': None,
+            'target': None,
+            'targetChanged': False,
+        },
     },
     'ng_cave': {
         'enabled': True,
@@ -41,6 +48,7 @@ context = {
         'image': None,
         'previousGameWindowImage': None,
         'previousMonsters': [],
+        'creaturesEvents': [],
         'monsters': [],
         'players': [],
         'walkedPixelsInSqm': 0,
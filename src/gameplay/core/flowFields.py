@@ -0,0 +1,57 @@
+import numpy as np
+from typing import Dict, Union
+from src.repositories.radar.config import availableTilesFrictions, floorsPathsSqms, packedWalkableFloorsSqms
+from src.repositories.radar.flowFields import buildFlowField, getFlowFieldsGoalsRegions, getFlowFieldsLayout, getFlowFieldWalkpoints, getWalkWaypointsGoals, isInsideFlowField
+from src.shared.typings import Coordinate, CoordinateList
+from src.utils.assetsBundle import createAssetsBundle, openAssetsBundle
+
+
+flowFieldsMinCost = int(availableTilesFrictions[0])
+# flow fields of the loaded script by goal coordinate, replaced at once so walking never sees a partial script
+flowFields: Dict[Coordinate, dict] = {}
+
+
+def getFlowFieldsPath(scriptPath: str) -> str:
+    return f'{scriptPath}.flows'
+
+
+# TODO: add unit tests
+# flow fields are stored next to the script and only rebuilt when its walk waypoints change
+def loadFlowFields(scriptPath: str, waypoints: list):
+    global flowFields
+    (goals, previousCoordinates) = getWalkWaypointsGoals(waypoints)
+    if len(goals) == 0:
+        flowFields = {}
+        return
+    (_, floorHeight, packedFloorWidth) = packedWalkableFloorsSqms.shape
+    (goals, regions) = getFlowFieldsGoalsRegions(goals, previousCoordinates, floorHeight, packedFloorWidth * 8)
+    regions = np.array(regions, dtype=np.int32)
+    path = getFlowFieldsPath(scriptPath)
+    bundle = openAssetsBundle(path)
+    if bundle is None or 'goals' not in bundle or not np.array_equal(bundle['goals'], goals) or not np.array_equal(bundle['regions'], regions):
+        # the old mapping must be released before its file is rewritten
+        flowFields = {}
+        bundle = None
+        bundle = createAssetsBundle(path, getFlowFieldsLayout(regions))
+        bundle['goals'][:] = goals
+        bundle['regions'][:] = regions
+        for index, goal in enumerate(goals):
+            bundle[f'distances{index}'][:] = buildFlowField(
+                packedWalkableFloorsSqms, floorsPathsSqms, goal, tuple(regions[index]), flowFieldsMinCost)
+        for asset in bundle.values():
+            asset.flush()
+    flowFields = {goal: {'region': tuple(int(value) for value in regions[index]), 'distances': bundle[f'distances{index}']}
+                  for index, goal in enumerate(goals)}
+
+
+def getFlowField(goalCoordinate: Coordinate) -> Union[dict, None]:
+    return flowFields.get(tuple(goalCoordinate), None)
+
+
+# returns None when the goal has no flow field or the coordinate is outside of it
+def getFlowFieldWalkpointsToGoal(coordinate: Coordinate, goalCoordinate: Coordinate, nonWalkableCoordinates: CoordinateList = []) -> Union[CoordinateList, None]:
+    flowField = getFlowField(goalCoordinate)
+    if flowField is None or not isInsideFlowField(flowField['region'], goalCoordinate, coordinate):
+        return None
+    return getFlowFieldWalkpoints(flowField['distances'], flowField['region'], packedWalkableFloorsSqms,
+                                  floorsPathsSqms, coordinate, nonWalkableCoordinates, flowFieldsMinCost)
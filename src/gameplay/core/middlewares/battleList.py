@@ -1,12 +1,19 @@
-from src.repositories.battleList.core import getCreatures, isAttackingSomeCreature
-from src.repositories.battleList.extractors import getContent
+from src.repositories.battleList.core import isAttackingSomeCreature
+from src.repositories.battleList.extractors import getContent, getContentRegion
+from src.repositories.battleList.reader import BattleListReader
+from src.utils.regionsOfInterest import declareRegionOfInterest
 from ...typings import Context
 
 
+battleListReader = BattleListReader()
+
+
 # TODO: add unit tests
 def setBattleListMiddleware(context: Context) -> Context:
-    context['ng_battleList']['creatures'] = getCreatures(
+    context['ng_battleList']['creatures'] = battleListReader.read(
         getContent(context['ng_screenshot']))
+    context['ng_battleList']['creaturesDiff'] = battleListReader.diff
     context['ng_cave']['isAttackingSomeCreature'] = isAttackingSomeCreature(
         context['ng_battleList']['creatures'])
+    declareRegionOfInterest('battleList', getContentRegion(context['ng_screenshot']))
     return context
@@ -1,8 +1,10 @@
-from src.repositories.chat.core import getTabs
+from src.repositories.chat.core import getChatRegion, getTabs
+from src.utils.regionsOfInterest import declareRegionOfInterest
 from ...typings import Context
 
 
 # TODO: add unit tests
 def setChatTabsMiddleware(context: Context) -> Context:
     context['ng_chat']['tabs'] = getTabs(context['ng_screenshot'])
+    declareRegionOfInterest('chat', getChatRegion(context['ng_screenshot']))
     return context
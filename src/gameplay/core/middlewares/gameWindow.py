@@ -1,13 +1,17 @@
-from src.repositories.battleList.core import getBeingAttackedCreatureCategory
 from src.repositories.chat.core import hasNewLoot
 from src.repositories.gameWindow.config import gameWindowSizes
-from src.repositories.gameWindow.core import getCoordinate, getImageByCoordinate
-from src.repositories.gameWindow.creatures import getCreatures, getCreaturesByType, getDifferentCreaturesBySlots, getTargetCreature
+from src.repositories.gameWindow.core import getCoordinate, getGameWindowRegion, getImageByCoordinate
+from src.repositories.gameWindow.creatures import getCreaturesByType, getDifferentCreaturesBySlots, getTargetCreature
+from src.repositories.gameWindow.tracker import CreaturesTracker
+from src.utils.regionsOfInterest import declareRegionOfInterest
 from ...comboSpells.core import spellsPath
 from ...typings import Context
 from ..tasks.selectChatTab import SelectChatTabTask
 
 
+creaturesTracker = CreaturesTracker()
+
+
 # TODO: add unit tests
 def setDirectionMiddleware(context: Context) -> Context:
     if context['ng_radar']['previousCoordinate'] is None:
@@ -50,8 +54,11 @@ def setHandleLootMiddleware(context: Context) -> Context:
                 context, SelectChatTabTask('loot'))
     if hasNewLoot(context['ng_screenshot']):
         if context['ng_cave']['previousTargetCreature'] is not None:
+            # the target can still walk a step after losing its red border, the corpse lies where it was seen last
+            lastSeenCreature = creaturesTracker.getLastSeenCreature(
+                context['ng_cave']['previousTargetCreature']['id'])
             context['loot']['corpsesToLoot'].append(
-                context['ng_cave']['previousTargetCreature'])
+                context['ng_cave']['previousTargetCreature'] if lastSeenCreature is None else lastSeenCreature)
             context['ng_cave']['previousTargetCreature'] = None
         # has spelled exori category
         if context['ng_comboSpells']['lastUsedSpell'] is not None and context['ng_comboSpells']['lastUsedSpell'] in ['exori', 'exori gran', 'exori mas']:
@@ -77,20 +84,23 @@ def setGameWindowMiddleware(context: Context) -> Context:
         context['ng_screenshot'], (gameWindowSizes[1080][0], gameWindowSizes[1080][1]))
     context['gameWindow']['image'] = getImageByCoordinate(
         context['ng_screenshot'], context['gameWindow']['coordinate'], (gameWindowSizes[1080][0], gameWindowSizes[1080][1]))
+    declareRegionOfInterest('gameWindow', getGameWindowRegion(
+        context['ng_screenshot'], (gameWindowSizes[1080][0], gameWindowSizes[1080][1])))
     return context
 
 
 # TODO: add unit tests
 def setGameWindowCreaturesMiddleware(context: Context) -> Context:
-    context['ng_battleList']['beingAttackedCreatureCategory'] = getBeingAttackedCreatureCategory(
-        context['ng_battleList']['creatures'])
+    # the battle list reader already told the target apart while reading its slots
+    context['ng_battleList']['beingAttackedCreatureCategory'] = context['ng_battleList']['creaturesDiff']['target']
     # TODO: func to check if coord is none
     if context['ng_radar']['coordinate'] is None:
         return context
     if any(coord is None for coord in context['ng_radar']['coordinate']):
         return context
-    context['gameWindow']['creatures'] = getCreatures(
+    context['gameWindow']['creatures'] = creaturesTracker.track(
         context['ng_battleList']['creatures'], context['ng_comingFromDirection'], context['gameWindow']['coordinate'], context['gameWindow']['image'], context['ng_radar']['coordinate'], beingAttackedCreatureCategory=context['ng_battleList']['beingAttackedCreatureCategory'], walkedPixelsInSqm=context['gameWindow']['walkedPixelsInSqm'])
+    context['gameWindow']['creaturesEvents'] = creaturesTracker.events
     if len(context['gameWindow']['creatures']) == 0:
         context['gameWindow']['monsters'] = []
         context['gameWindow']['players'] = []
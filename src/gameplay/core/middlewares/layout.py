@@ -0,0 +1,11 @@
+from src.utils.layout import calibrateLayout, getLayoutKey, useLayout
+from ...typings import Context
+
+
+# TODO: add unit tests
+def setLayoutMiddleware(context: Context) -> Context:
+    if context['ng_screenshot'] is None:
+        return context
+    if useLayout(getLayoutKey(context['ng_screenshot'])):
+        calibrateLayout(context['ng_screenshot'])
+    return context
@@ -1,12 +1,23 @@
-from src.repositories.skills.core import getHp, getMana
+from src.repositories.actionBar.extractors import getActionBarRegion
+from src.repositories.skills.core import getSkillsRegion
+from src.repositories.skills.snapshot import getSkillsSnapshot
 from src.repositories.statusBar.core import getManaPercentage, getHpPercentage
+from src.repositories.statusBar.extractors import getHpBarRegion, getManaBarRegion
+from src.utils.regionsOfInterest import declareRegionOfInterest
 from ...typings import Context
 
 
 # TODO: add unit tests
 def setMapPlayerStatusMiddleware(context: Context) -> Context:
-    context['ng_statusBar']['hp'] = getHp(context['ng_screenshot'])
+    # every skills row is decoded once per frame, walking and refill tasks read speed and capacity from the same snapshot
+    skillsSnapshot = getSkillsSnapshot(context['ng_screenshot'])
+    context['ng_statusBar']['hp'] = None if skillsSnapshot is None else int(skillsSnapshot['hp'])
     context['ng_statusBar']['hpPercentage'] = getHpPercentage(context['ng_screenshot'])
-    context['ng_statusBar']['mana'] = getMana(context['ng_screenshot'])
+    context['ng_statusBar']['mana'] = None if skillsSnapshot is None else int(skillsSnapshot['mana'])
     context['ng_statusBar']['manaPercentage'] = getManaPercentage(context['ng_screenshot'])
+    declareRegionOfInterest('skills', getSkillsRegion(context['ng_screenshot']))
+    declareRegionOfInterest('hpBar', getHpBarRegion(context['ng_screenshot']))
+    declareRegionOfInterest('manaBar', getManaBarRegion(context['ng_screenshot']))
+    # healing and combo threads read slots and cooldowns from the same screenshot
+    declareRegionOfInterest('actionBar', getActionBarRegion(context['ng_screenshot']))
     return context
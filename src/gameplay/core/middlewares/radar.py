@@ -1,14 +1,37 @@
-from src.repositories.radar.core import getClosestWaypointIndexFromCoordinate, getCoordinate
+import numpy as np
+from src.repositories.radar.config import availableTilesFrictions, breakpointTileMovementSpeed
+from src.repositories.radar.core import getClosestWaypointIndexFromCoordinate, getTilesStepDurations
+from src.repositories.radar.extractors import getRadarRegion
+from src.repositories.radar.tracker import CoordinateTracker
+from src.repositories.skills.core import getSpeed
+from src.utils.regionsOfInterest import declareRegionOfInterest
 from ...typings import Context
 
 
+coordinateTracker = CoordinateTracker()
+
+
 # TODO: add unit tests
 def setRadarMiddleware(context: Context) -> Context:
-    context['ng_radar']['coordinate'] = getCoordinate(
-        context['ng_screenshot'], previousCoordinate=context['ng_radar']['previousCoordinate'])
+    walkpoint = None
+    currentTask = context['ng_tasksOrchestrator'].peekCurrentTask()
+    if currentTask is not None and currentTask.name == 'pathFollow':
+        walkpoint = currentTask.walkpoint
+    context['ng_radar']['coordinate'] = coordinateTracker.track(
+        context['ng_screenshot'], getFastestStepDuration(context), walkpoint=walkpoint)
+    declareRegionOfInterest('radar', getRadarRegion(context['ng_screenshot']))
     return context
 
 
+# TODO: add unit tests
+# the lowest friction gives the fastest step the player could take
+def getFastestStepDuration(context: Context) -> float:
+    charSpeed = getSpeed(context['ng_screenshot'])
+    if charSpeed is None:
+        return min(breakpointTileMovementSpeed.values()) / 1000
+    return getTilesStepDurations(charSpeed, np.array([availableTilesFrictions[0]]))[0] / 1000
+
+
 # TODO: add unit tests
 def setWaypointIndexMiddleware(context: Context) -> Context:
     if context['ng_cave']['waypoints']['currentIndex'] is None:
@@ -1,8 +1,13 @@
 from src.utils.core import getScreenshot
+from src.utils.regionsOfInterest import requestFullFrame
 from ...typings import Context
 
 
 # TODO: add unit tests
 def setScreenshotMiddleware(context: Context) -> Context:
+    rootTask = context['ng_tasksOrchestrator'].rootTask
+    # tasks not declaring they only read the regions of interest may look anywhere on the screen
+    if rootTask is not None and not rootTask.readsOnlyRegionsOfInterest:
+        requestFullFrame()
     context['ng_screenshot'] = getScreenshot()
     return context
@@ -1,4 +1,5 @@
-from src.repositories.statsBar.core import getStats
+from src.repositories.statsBar.core import getStats, getStatsBarRegion
+from src.utils.regionsOfInterest import declareRegionOfInterest
 from ...typings import Context
 
 # TODO: add unit tests
@@ -10,4 +11,6 @@ def setMapStatsBarMiddleware(context: Context) -> Context:
       context['statsBar']['hur'] = stats['hur']
       context['statsBar']['poison'] = stats['poison']
 
+    declareRegionOfInterest('statsBar', getStatsBarRegion(context['ng_screenshot']))
+
     return context
@@ -9,6 +9,7 @@ class AttackClosestCreatureTask(VectorTask):
     def __init__(self):
         super().__init__()
         self.name = 'attackClosestCreature'
+        self.readsOnlyRegionsOfInterest = True
         self.isRootTask = True
         self.runTimesWithoutCloseMonster = 0
 
@@ -3,7 +3,7 @@ from ....typings import Context
 
 
 class BaseTask:
-    def __init__(self, delayBeforeStart=0, delayAfterComplete=0, delayOfTimeout=0, isRootTask=False, manuallyTerminable=False, name='baseTask', parentTask=None, shouldTimeoutTreeWhenTimeout=False):
+    def __init__(self, delayBeforeStart=0, delayAfterComplete=0, delayOfTimeout=0, isRootTask=False, manuallyTerminable=False, name='baseTask', parentTask=None, readsOnlyRegionsOfInterest=False, shouldTimeoutTreeWhenTimeout=False):
         self.createdAt = time()
         self.startedAt = None
         self.finishedAt = None
@@ -16,6 +16,8 @@ class BaseTask:
         self.manuallyTerminable = manuallyTerminable
         self.name = name
         self.parentTask = parentTask
+        # root tasks reading only the regions declared by the middlewares let the screenshot skip the rest of the screen
+        self.readsOnlyRegionsOfInterest = readsOnlyRegionsOfInterest
         self.retryCount = 0
         self.rootTask = None
         self.shouldTimeoutTreeWhenTimeout = shouldTimeoutTreeWhenTimeout
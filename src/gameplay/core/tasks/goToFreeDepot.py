@@ -6,7 +6,7 @@ from src.wiki.cities import cities
 from ...typings import Context
 from ..waypoint import generateFloorWalkpoints
 from .common.vector import VectorTask
-from .walk import WalkTask
+from .pathFollow import PathFollowTask
 
 class GoToFreeDepotTask(VectorTask):
     def __init__(self, waypoint: Waypoint):
@@ -58,7 +58,7 @@ class GoToFreeDepotTask(VectorTask):
             # TODO: FIX PING FUNCTION AND REMOVE THIS
 
             walkpoints = generateFloorWalkpoints(coordinate, self.closestFreeDepotCoordinate)
-            self.tasks = [WalkTask(context, walkpoint).setParentTask(self).setRootTask(self.rootTask) for walkpoint in walkpoints]
+            self.tasks = [PathFollowTask(context, walkpoints).setParentTask(self).setRootTask(self.rootTask)] if len(walkpoints) > 0 else []
         else:
             self.state = 'walkingIntoVisibleCoordinates'
             # - gerar caminho até visualizar os próximos depots se necessário
@@ -8,6 +8,7 @@ class LootCorpseTask(VectorTask):
     def __init__(self, creature: Creature):
         super().__init__()
         self.name = 'lootCorpse'
+        self.readsOnlyRegionsOfInterest = True
         self.isRootTask = True
         self.creature = creature
 
@@ -38,6 +38,13 @@ class TasksOrchestrator:
             return currentTask.name
         return currentTask.rootTask.name
 
+    # same as getCurrentTask without starting the tasks on the way
+    def peekCurrentTask(self):
+        task = self.rootTask
+        while hasattr(task, 'tasks') and task.status != 'completed' and len(task.tasks) > 0:
+            task = task.tasks[task.currentTaskIndex]
+        return task
+
     def getNestedTask(self, task, context: Context):
         if hasattr(task, 'tasks'):
             if task.status == 'notStarted':
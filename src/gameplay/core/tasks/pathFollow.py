@@ -0,0 +1,124 @@
+import numpy as np
+from time import time
+from typing import Union
+from src.repositories.radar.config import breakpointTileMovementSpeed
+from src.repositories.radar.core import getTilesFrictionsByCoordinates, getTilesStepDurations
+from src.repositories.skills.core import getSpeed
+from src.shared.typings import Coordinate, CoordinateList
+from src.utils.coordinate import getDirectionBetweenCoordinates
+from src.utils.keyboard import keyDown, press
+from ...typings import Context
+from ...utils import coordinatesAreEqual, releaseKeys
+from .common.base import BaseTask
+
+
+# walks a whole path as a single task. Every walkpoint times out the tree after twice its
+# movement speed, as a walk task per walkpoint did
+class PathFollowTask(BaseTask):
+    def __init__(self, context: Context, walkpoints: CoordinateList, passinho=False):
+        super().__init__()
+        self.name = 'pathFollow'
+        self.shouldTimeoutTreeWhenTimeout = True
+        self.path = np.array(walkpoints, dtype=np.int32).reshape(-1, 3)
+        self.tilesFrictions = getTilesFrictionsByCoordinates(self.path)
+        self.charSpeed = None
+        # speed is unknown until the skills are read, the slowest movement is assumed meanwhile
+        self.tilesMovementSpeeds = np.full(len(self.path), breakpointTileMovementSpeed[1], dtype=np.int32)
+        self.updateTilesMovementSpeeds(getSpeed(context['ng_screenshot']))
+        self.passinho = passinho
+        self.walkpointIndex = 0
+        self.walkedWalkpointIndex = None
+        self.reachedWalkpointAt = self.createdAt
+        # TODO: fix passinho with char speed
+        self.delayBeforeStart = self.getWalkpointDelay(0)
+        self.delayOfTimeout = self.getWalkpointTimeout(0)
+
+    @property
+    def walkpoint(self) -> Union[Coordinate, None]:
+        if self.walkpointIndex >= len(self.path):
+            return None
+        return tuple(self.path[self.walkpointIndex].tolist())
+
+    def getRemainingWalkpoints(self) -> CoordinateList:
+        return [tuple(walkpoint) for walkpoint in self.path[self.walkpointIndex:].tolist()]
+
+    def updateTilesMovementSpeeds(self, charSpeed: Union[int, None]):
+        if charSpeed is None or charSpeed == self.charSpeed or len(self.path) == 0:
+            return
+        self.charSpeed = charSpeed
+        self.tilesMovementSpeeds = getTilesStepDurations(charSpeed, self.tilesFrictions)
+
+    def getWalkpointDelay(self, walkpointIndex: int) -> float:
+        if not self.passinho or walkpointIndex >= len(self.path):
+            return 0
+        return (self.tilesMovementSpeeds[walkpointIndex] * 2) / 1000
+
+    def getWalkpointTimeout(self, walkpointIndex: int) -> float:
+        if walkpointIndex >= len(self.path):
+            return 0
+        return self.getWalkpointDelay(walkpointIndex) + (self.tilesMovementSpeeds[walkpointIndex] * 2) / 1000
+
+    def do(self, context: Context) -> Context:
+        self.reachedWalkpointAt = time()
+        return self.walk(context)
+
+    # the player may have walked several walkpoints between frames, the timeout of a walkpoint
+    # starts when the previous one is reached
+    def ping(self, context: Context) -> Context:
+        self.updateTilesMovementSpeeds(getSpeed(context['ng_screenshot']))
+        reachedIndexes = np.flatnonzero(np.all(self.path[self.walkpointIndex:] == context['ng_radar']['coordinate'], axis=1))
+        if len(reachedIndexes) > 0:
+            self.walkpointIndex += int(reachedIndexes[0]) + 1
+            self.reachedWalkpointAt = time()
+            self.startedAt = self.reachedWalkpointAt
+            self.delayOfTimeout = self.getWalkpointTimeout(self.walkpointIndex)
+        if self.walkpointIndex >= len(self.path) or self.walkedWalkpointIndex == self.walkpointIndex:
+            return context
+        if time() - self.reachedWalkpointAt < self.getWalkpointDelay(self.walkpointIndex):
+            return context
+        return self.walk(context)
+
+    # keys are handled once per walkpoint, a key is held along walkpoints of the same direction
+    # and released before the direction changes
+    def walk(self, context: Context) -> Context:
+        # as a walk task was ignored, keys are left alone while the player is still mid-step, the walkpoint is walked on a later ping
+        if context['ng_radar']['lastCoordinateVisited'] is None or not coordinatesAreEqual(context['ng_radar']['coordinate'], context['ng_radar']['lastCoordinateVisited']):
+            return context
+        self.walkedWalkpointIndex = self.walkpointIndex
+        direction = getDirectionBetweenCoordinates(context['ng_radar']['coordinate'], self.path[self.walkpointIndex])
+        if direction is None:
+            return context
+        futureDirection = None
+        if self.walkpointIndex + 1 < len(self.path):
+            futureDirection = getDirectionBetweenCoordinates(self.path[self.walkpointIndex], self.path[self.walkpointIndex + 1])
+        if direction != futureDirection:
+            if context['ng_lastPressedKey'] is not None:
+                context = releaseKeys(context)
+            else:
+                press(direction)
+            return context
+        if direction != context['ng_lastPressedKey']:
+            if len(self.path) > 2:
+                keyDown(direction)
+                context['ng_lastPressedKey'] = direction
+            else:
+                press(direction)
+            return context
+        if len(self.path) == 1 and context['ng_lastPressedKey'] is not None:
+            context = releaseKeys(context)
+        return context
+
+    def did(self, context: Context) -> bool:
+        return len(self.path) == 0 or np.array_equal(self.path[-1], context['ng_radar']['coordinate'])
+
+    # TODO: add unit tests
+    def onInterrupt(self, context: Context) -> Context:
+        return releaseKeys(context)
+
+    # TODO: add unit tests
+    def onTimeout(self, context: Context) -> Context:
+        return releaseKeys(context)
+
+    # TODO: add unit tests
+    def onComplete(self, context: Context) -> Context:
+        return releaseKeys(context)
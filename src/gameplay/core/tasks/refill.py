@@ -22,8 +22,9 @@ class RefillTask(VectorTask):
 
     # TODO: add unit tests
     def onBeforeStart(self, context: Context) -> Context:
-        healthPotionsAmount = getSlotCount(context['ng_screenshot'], context['healing']['potions']['firstHealthPotion']['slot'])
-        manaPotionsAmount = getSlotCount(context['ng_screenshot'], context['healing']['potions']['firstManaPotion']['slot'])
+        # counts are unknown only while the action bar is not found, the whole quantity is bought then
+        healthPotionsAmount = getSlotCount(context['ng_screenshot'], context['healing']['potions']['firstHealthPotion']['slot']) or 0
+        manaPotionsAmount = getSlotCount(context['ng_screenshot'], context['healing']['potions']['firstManaPotion']['slot']) or 0
 
         amountOfManaPotionsToBuy = max(
             0, self.waypoint['options']['manaPotion']['quantity'] - manaPotionsAmount)
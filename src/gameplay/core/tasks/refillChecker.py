@@ -10,6 +10,7 @@ class RefillCheckerTask(BaseTask):
     def __init__(self, waypoint: Waypoint):
         super().__init__()
         self.name = 'refillChecker'
+        self.readsOnlyRegionsOfInterest = True
         self.delayAfterComplete = 1
         self.isRootTask = True
         self.waypoint = waypoint
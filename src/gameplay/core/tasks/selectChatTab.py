@@ -8,6 +8,7 @@ class SelectChatTabTask(BaseTask):
     def __init__(self, name):
         super().__init__()
         self.name = 'selectChatTab'
+        self.readsOnlyRegionsOfInterest = True
         self.delayBeforeStart = 0.5
         self.delayAfterComplete = 0.5
         self.tabName = name
@@ -8,6 +8,7 @@ class SingleMoveTask(VectorTask):
     def __init__(self, direction: str):
         super().__init__()
         self.name = 'singleMove'
+        self.readsOnlyRegionsOfInterest = True
         self.delayBeforeStart = 1
         self.delayAfterComplete = 1
         self.isRootTask = True
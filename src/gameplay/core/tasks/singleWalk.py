@@ -10,6 +10,7 @@ class SingleWalkTask(VectorTask):
     def __init__(self, waypointType: str, direction: str):
         super().__init__()
         self.name = 'singleWalk'
+        self.readsOnlyRegionsOfInterest = True
         self.delayAfterComplete = 2
         self.isRootTask = True
         self.direction = direction
@@ -1,6 +1,6 @@
 import numpy as np
 import src.gameplay.utils as gameplayUtils
-from src.repositories.radar.core import getBreakpointTileMovementSpeed, getTileFrictionByCoordinate
+from src.repositories.radar.core import getPathStepDurations
 from src.repositories.skills.core import getSpeed
 from src.shared.typings import Coordinate
 from src.utils.coordinate import getDirectionBetweenCoordinates
@@ -14,9 +14,7 @@ class SingleWalkPressTask(BaseTask):
         super().__init__()
         self.name = 'singleWalkPress'
         charSpeed = getSpeed(context['ng_screenshot'])
-        tileFriction = getTileFrictionByCoordinate(coordinate)
-        movementSpeed = getBreakpointTileMovementSpeed(
-            charSpeed, tileFriction)
+        movementSpeed = getPathStepDurations(charSpeed, np.array([coordinate]))[0]
         self.delayOfTimeout = (movementSpeed * 2) / 1000
         self.coordinate = coordinate
 
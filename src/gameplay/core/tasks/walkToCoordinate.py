@@ -2,9 +2,9 @@ from src.gameplay.typings import Context
 import src.gameplay.utils as gameplayUtils
 from src.repositories.radar.typings import Coordinate
 from ...typings import Context
-from ..waypoint import generateFloorWalkpoints
+from ..waypoint import createWalkPlanner, generateFloorWalkpoints
 from .common.vector import VectorTask
-from .walk import WalkTask
+from .pathFollow import PathFollowTask
 from .attackMonstersBox import AttackMonstersBoxTask
 from .lootMonstersBox import LootMonstersBoxTask
 from .resetSpellIndex import ResetSpellIndexTask
@@ -15,9 +15,11 @@ class WalkToCoordinateTask(VectorTask):
     def __init__(self, coordinate: Coordinate, passinho=False):
         super().__init__()
         self.name = 'walkToCoordinate'
+        self.readsOnlyRegionsOfInterest = True
         self.coordinate = coordinate
         self.passinho = passinho
         self.isTrapped = False
+        self.planner = None
 
     def shouldRestartAfterAllChildrensComplete(self, context: Context) -> bool:
         if self.isTrapped == True:
@@ -26,6 +28,19 @@ class WalkToCoordinateTask(VectorTask):
             return True
         return not gameplayUtils.coordinatesAreEqual(context['ng_radar']['coordinate'], self.coordinate)
 
+    # TODO: add unit tests
+    # creatures are handed to the planner every tick, the walk only restarts when one of them
+    # steps into the remaining walkpoints
+    def shouldRestart(self, context: Context) -> bool:
+        if self.planner is None or self.isTrapped or context['ng_radar']['coordinate'] is None:
+            return False
+        if not self.planner.isInside(context['ng_radar']['coordinate']):
+            return False
+        blockedCoordinates = self.planner.updateNonWalkableCoordinates(
+            context['ng_radar']['coordinate'], self.getNonWalkableCoordinates(context))
+        return any(walkpoint in blockedCoordinates for task in self.tasks[self.currentTaskIndex:] if isinstance(task, PathFollowTask)
+                   for walkpoint in task.getRemainingWalkpoints())
+
     def onBeforeStart(self, context: Context) -> Context:
         self.calculateWalkpoint(context)
         return context
@@ -40,7 +55,7 @@ class WalkToCoordinateTask(VectorTask):
         return gameplayUtils.releaseKeys(context)
 
     # TODO: add unit tests
-    def calculateWalkpoint(self, context: Context):
+    def getNonWalkableCoordinates(self, context: Context):
         nonWalkableCoordinates = context['ng_cave']['holesOrStairs'].copy()
         for monster in context['gameWindow']['monsters']:
             # TODO: func to check if coord is none
@@ -56,8 +71,19 @@ class WalkToCoordinateTask(VectorTask):
                     hasNoneCoord = any(coord is None for coord in player['coordinate'])
                     if not hasNoneCoord:
                         nonWalkableCoordinates.append(player['coordinate'])
+        return nonWalkableCoordinates
+
+    # TODO: add unit tests
+    def calculateWalkpoint(self, context: Context):
+        nonWalkableCoordinates = self.getNonWalkableCoordinates(context)
         self.tasks = []
-        walkpoints = generateFloorWalkpoints(
+        if self.planner is None or not self.planner.isInside(context['ng_radar']['coordinate']):
+            self.planner = createWalkPlanner(context['ng_radar']['coordinate'], self.coordinate)
+        if self.planner is not None:
+            self.planner.updateNonWalkableCoordinates(context['ng_radar']['coordinate'], nonWalkableCoordinates)
+            walkpoints = self.planner.getWalkpoints(context['ng_radar']['coordinate'])
+        else:
+            walkpoints = generateFloorWalkpoints(
                 context['ng_radar']['coordinate'], self.coordinate, nonWalkableCoordinates=nonWalkableCoordinates)
         if len(walkpoints) == 0 and not gameplayUtils.coordinatesAreEqual(context['ng_radar']['coordinate'], self.coordinate):
             self.isTrapped = True
@@ -78,6 +104,6 @@ class WalkToCoordinateTask(VectorTask):
                     ]
         else:
             self.isTrapped = False
-        for walkpoint in walkpoints:
-            self.tasks.append(WalkTask(context, walkpoint, self.passinho).setParentTask(
+        if len(walkpoints) > 0:
+            self.tasks.append(PathFollowTask(context, walkpoints, self.passinho).setParentTask(
                 self).setRootTask(self.rootTask))
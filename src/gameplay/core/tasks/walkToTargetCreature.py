@@ -6,7 +6,7 @@ from ...typings import Context
 from ...utils import releaseKeys
 from ..waypoint import generateFloorWalkpoints
 from .common.vector import VectorTask
-from .walk import WalkTask
+from .pathFollow import PathFollowTask
 import src.utils.keyboard as keyboard
 
 class WalkToTargetCreatureTask(VectorTask):
@@ -76,8 +76,8 @@ class WalkToTargetCreatureTask(VectorTask):
                 context['ng_radar']['coordinate'], context['ng_cave']['targetCreature']['coordinate'], nonWalkableCoordinates=nonWalkableCoordinates)
             if walkpoints:
                 walkpoints.pop()
-        for walkpoint in walkpoints:
-            self.tasks.append(WalkTask(context, walkpoint).setParentTask(
+        if len(walkpoints) > 0:
+            self.tasks.append(PathFollowTask(context, walkpoints).setParentTask(
                 self).setRootTask(self.rootTask))
         self.targetCreatureCoordinateSinceLastRestart = context['ng_cave']['targetCreature']['coordinate'].copy(
         )
@@ -12,6 +12,7 @@ class WalkToWaypointTask(VectorTask):
     def __init__(self, coordinate: Coordinate, ignore: bool, passinho: bool):
         super().__init__()
         self.name = 'walkToWaypoint'
+        self.readsOnlyRegionsOfInterest = True
         self.delayAfterComplete = 1
         self.isRootTask = True
         self.coordinate = coordinate
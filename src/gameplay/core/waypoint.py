@@ -1,25 +1,81 @@
+import numpy as np
 import tcod
-from src.repositories.radar.config import walkableFloorsSqms
+from typing import Union
+from src.repositories.radar.config import floorsPathsSqms, packedWalkableFloorsSqms
+from src.repositories.radar.core import getRoutesGraph
+from src.repositories.radar.dStarLite import DStarLitePlanner
+from src.repositories.radar.flowFields import getFlowFieldRegion, getRegionCosts, isInsideFlowField
+from src.repositories.radar.routes import getRoute
+from src.repositories.radar.walkableSqms import getWalkableSqmsWindow
 from src.shared.typings import Coordinate, CoordinateList
-from src.utils.coordinate import getAvailableAroundCoordinates, getClosestCoordinate, getPixelFromCoordinate
+from src.utils.coordinate import getClosestCoordinate, getPixelFromCoordinate
+from .flowFields import flowFieldsMinCost, getFlowField, getFlowFieldWalkpointsToGoal
 from .typings import Checkpoint
 
 
 # TODO: add unit tests
+# script goals are walked by their flow fields, other goals outside of the radar are routed through
+# the routes graph, creatures are only avoided inside the radar where the route leaves it
 def generateFloorWalkpoints(coordinate: Coordinate, goalCoordinate: Coordinate, nonWalkableCoordinates: CoordinateList = []) -> CoordinateList:
+    walkpoints = getFlowFieldWalkpointsToGoal(coordinate, goalCoordinate, nonWalkableCoordinates)
+    if walkpoints is not None:
+        return walkpoints
+    routesGraph = getRoutesGraph()
+    if routesGraph is None or goalCoordinate[2] != coordinate[2] or isInsideRadar(coordinate, goalCoordinate):
+        return generateRadarWalkpoints(coordinate, goalCoordinate, nonWalkableCoordinates)
+    route = getRoute(routesGraph, packedWalkableFloorsSqms,
+                     floorsPathsSqms, coordinate, goalCoordinate, allowFloorChanges=False)
+    leavingRadarIndex = next((index for index, routeCoordinate in enumerate(
+        route) if not isInsideRadar(coordinate, routeCoordinate)), len(route))
+    if leavingRadarIndex == 0:
+        return []
+    walkpoints = generateRadarWalkpoints(
+        coordinate, route[leavingRadarIndex - 1], nonWalkableCoordinates)
+    if len(walkpoints) == 0:
+        return []
+    return walkpoints + [[routeCoordinate[0], routeCoordinate[1], routeCoordinate[2]] for routeCoordinate in route[leavingRadarIndex:]]
+
+
+# planners keep a few arrays per sqm of their region, farther goals are left to the routes graph
+maxPlannerSqms = 256 * 256
+
+
+# TODO: add unit tests
+# the flow field of a script goal already holds the distances the planner would search for
+def createWalkPlanner(coordinate: Coordinate, goalCoordinate: Coordinate) -> Union[DStarLitePlanner, None]:
+    if coordinate[2] != goalCoordinate[2]:
+        return None
+    flowField = getFlowField(goalCoordinate)
+    if flowField is not None and isInsideFlowField(flowField['region'], goalCoordinate, coordinate):
+        region = flowField['region']
+        distances = flowField['distances']
+    else:
+        (_, floorHeight, packedFloorWidth) = packedWalkableFloorsSqms.shape
+        region = getFlowFieldRegion(goalCoordinate, coordinate, floorHeight, packedFloorWidth * 8)
+        distances = None
+    if region[2] * region[3] > maxPlannerSqms:
+        return None
+    costs = getRegionCosts(packedWalkableFloorsSqms, floorsPathsSqms, region, goalCoordinate[2], flowFieldsMinCost)
+    return DStarLitePlanner(goalCoordinate, region, costs, flowFieldsMinCost, distances=distances)
+
+
+def isInsideRadar(coordinate: Coordinate, otherCoordinate: Coordinate) -> bool:
+    return -53 <= otherCoordinate[0] - coordinate[0] < 53 and -54 <= otherCoordinate[1] - coordinate[1] < 55
+
+
+# TODO: add unit tests
+def generateRadarWalkpoints(coordinate: Coordinate, goalCoordinate: Coordinate, nonWalkableCoordinates: CoordinateList = []) -> CoordinateList:
     pixelCoordinate = getPixelFromCoordinate(coordinate)
     xFromTheStartOfRadar = pixelCoordinate[0] - 53
-    xFromTheEndOfRadar = pixelCoordinate[0] + 53
     yFromTheStartOfRadar = pixelCoordinate[1] - 54
-    yFromTheEndOfRadar = pixelCoordinate[1] + 55
-    copiedWalkableFloorSqms = walkableFloorsSqms[coordinate[2]][
-        yFromTheStartOfRadar:yFromTheEndOfRadar, xFromTheStartOfRadar:xFromTheEndOfRadar].copy()
+    copiedWalkableFloorSqms = getWalkableSqmsWindow(
+        packedWalkableFloorsSqms, xFromTheStartOfRadar, yFromTheStartOfRadar, coordinate[2], 106, 109)
     for nonWalkableCoordinate in nonWalkableCoordinates:
         if nonWalkableCoordinate[2] == coordinate[2]:
             nonWalkableCoordinateInPixelX, nonWalkableCoordinateInPixelY = getPixelFromCoordinate(nonWalkableCoordinate)
             leX = nonWalkableCoordinateInPixelX - xFromTheStartOfRadar
             leY = nonWalkableCoordinateInPixelY - yFromTheStartOfRadar
-            if leX >= 0 and leX <= 106 and leY >= 0 and leY <= 109:
+            if leX >= 0 and leX < 106 and leY >= 0 and leY < 109:
                 copiedWalkableFloorSqms[leY, leX] = 0
     x = goalCoordinate[0] - coordinate[0] + 53
     y = goalCoordinate[1] - coordinate[1] + 54
@@ -73,8 +129,13 @@ def resolveMoveUpCoordinate(_, waypoint) -> Checkpoint:
 
 # TODO: add unit tests
 def resolveUseShovelWaypointCoordinate(coordinate, nextCoordinate: Coordinate) -> Checkpoint:
-    availableAroundCoordinates = getAvailableAroundCoordinates(
-        nextCoordinate, walkableFloorsSqms[nextCoordinate[2]])
+    (xOfPixelCoordinate, yOfPixelCoordinate) = getPixelFromCoordinate(nextCoordinate)
+    aroundWalkableSqms = getWalkableSqmsWindow(
+        packedWalkableFloorsSqms, xOfPixelCoordinate - 1, yOfPixelCoordinate - 1, nextCoordinate[2], 3, 3)
+    aroundWalkableSqms[1, 1] = 0
+    (ys, xs) = np.nonzero(aroundWalkableSqms)
+    availableAroundCoordinates = np.column_stack(
+        (xs + nextCoordinate[0] - 1, ys + nextCoordinate[1] - 1, np.full(len(xs), nextCoordinate[2])))
     closestCoordinate = getClosestCoordinate(
         coordinate, availableAroundCoordinates)
     checkInCoordinate = [nextCoordinate[0], nextCoordinate[1], nextCoordinate[2] + 1]
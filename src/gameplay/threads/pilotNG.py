@@ -1,4 +1,3 @@
-import pyautogui
 from time import sleep, time
 import traceback
 import sys
@@ -7,6 +6,7 @@ from src.gameplay.combo import comboSpells
 from src.gameplay.core.middlewares.battleList import setBattleListMiddleware
 from src.gameplay.core.middlewares.chat import setChatTabsMiddleware
 from src.gameplay.core.middlewares.gameWindow import setDirectionMiddleware, setGameWindowCreaturesMiddleware, setGameWindowMiddleware, setHandleLootMiddleware
+from src.gameplay.core.middlewares.layout import setLayoutMiddleware
 from src.gameplay.core.middlewares.playerStatus import setMapPlayerStatusMiddleware
 from src.gameplay.core.middlewares.statsBar import setMapStatsBarMiddleware
 from src.gameplay.core.middlewares.radar import setRadarMiddleware, setWaypointIndexMiddleware
@@ -24,9 +24,8 @@ from src.gameplay.healing.observers.swapAmulet import swapAmulet
 from src.gameplay.healing.observers.swapRing import swapRing
 from src.gameplay.targeting import hasCreaturesToAttack
 from src.repositories.gameWindow.creatures import getClosestCreature, getTargetCreature
+from src.utils.layout import consumeLayoutChanges
 
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0
 
 class PilotNGThread:
     # TODO: add typings
@@ -42,6 +41,8 @@ class PilotNGThread:
                 startTime = time()
                 self.context.context = self.handleGameData(
                     self.context.context)
+                if consumeLayoutChanges():
+                    self.context.updateLayouts()
                 self.context.context = self.handleGameplayTasks(
                     self.context.context)
                 self.context.context = self.context.context['ng_tasksOrchestrator'].do(
@@ -69,6 +70,7 @@ class PilotNGThread:
         if context['ng_pause']:
             return context
         context = setScreenshotMiddleware(context)
+        context = setLayoutMiddleware(context)
         context = setRadarMiddleware(context)
         context = setChatTabsMiddleware(context)
         context = setBattleListMiddleware(context)
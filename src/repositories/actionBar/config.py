@@ -1,3 +1,4 @@
+from glob import glob
 import pathlib
 from src.utils.core import hashit
 from src.utils.image import loadFromRGBToGray
@@ -8,6 +9,7 @@ imagesPath = f'{currentPath}/images'
 arrowsImagesPath = f'{imagesPath}/arrows'
 cooldownsImagesPath = f'{imagesPath}/cooldowns'
 digitsImagesPath = f'{imagesPath}/digits'
+glyphsImagesPath = f'{imagesPath}/glyphs'
 hashes = {
     'cooldowns': {
         hashit(loadFromRGBToGray(f'{cooldownsImagesPath}/attack.png')): 'attack',
@@ -67,4 +69,8 @@ images = {
         hashit(loadFromRGBToGray(f'{digitsImagesPath}/8.png')): 8,
         hashit(loadFromRGBToGray(f'{digitsImagesPath}/9.png')): 9,
     },
+    # counts font glyphs recorded so far by builders/repositories/actionBar/buildGlyphs.py, named by their digit
+    'glyphs': {
+        int(pathlib.Path(glyphPath).stem): loadFromRGBToGray(glyphPath) for glyphPath in sorted(glob(f'{glyphsImagesPath}/*.png'))
+    },
 }
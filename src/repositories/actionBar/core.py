@@ -6,22 +6,38 @@ import src.repositories.actionBar.locators as actionBarLocators
 from src.shared.typings import GrayImage
 import src.utils.core as coreUtils
 from .config import hashes, images
+from .counts import getCount, setCachedCount
 from skimage import exposure
 
 pytesseract.pytesseract.tesseract_cmd = "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
 
 # TODO: add unit tests
-# PERF: [0.04209370000000012, 9.999999999621423e-06]
-def getSlotCount(screenshot: GrayImage, slot: int) -> Union[int, None]:
+def getSlotCountImage(screenshot: GrayImage, slot: int) -> Union[GrayImage, None]:
     leftSideArrowsPos = actionBarLocators.getLeftArrowsPosition(screenshot)
     if leftSideArrowsPos is None:
         return None
     x0 = leftSideArrowsPos[0] + leftSideArrowsPos[2] + \
         (slot * 2) + ((slot - 1) * 34)
     slotImage = screenshot[leftSideArrowsPos[1]:leftSideArrowsPos[1] + 34, x0:x0 + 34]
-    digits = slotImage[24:32, 3:33]
-    
-    number_region_image = np.array(digits, dtype=np.uint8)
+    return slotImage[24:32, 3:33]
+
+
+# PERF: [0.04209370000000012, 9.999999999621423e-06]
+# tesseract only reads counts with a digit without recorded glyph, its reads are cached by count image
+@coreUtils.cacheByFrame
+def getSlotCount(screenshot: GrayImage, slot: int) -> Union[int, None]:
+    countImage = getSlotCountImage(screenshot, slot)
+    if countImage is None:
+        return None
+    count = getCount(countImage)
+    if count is None:
+        count = getCountByTesseract(countImage)
+        setCachedCount(coreUtils.hashit(countImage), count)
+    return count
+
+
+def getCountByTesseract(countImage: GrayImage) -> int:
+    number_region_image = np.array(countImage, dtype=np.uint8)
 
     stretch = exposure.rescale_intensity(number_region_image, in_range=(50,175), out_range=(0,255)).astype(np.uint8)
 
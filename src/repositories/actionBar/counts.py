@@ -0,0 +1,83 @@
+import numpy as np
+from typing import Dict, List, Union
+from src.shared.typings import GrayImage
+from src.utils.core import hashit
+from .config import images
+
+
+# colors of the counts font, the outline and the potions drawn behind the digits are masked out
+countTextColors = np.zeros(256, dtype=np.bool_)
+countTextColors[[83, 111, 125, 139, 167, 180, 194, 208, 223]] = True
+# counts are right aligned in cells of 6 columns, the rightmost cell starts at the 24th column of the count image
+countGlyphWidth = 6
+countGlyphsCount = 5
+# stray text colored pixels of the potions are far below the 15 pixels of the thinnest digit
+minCountGlyphTextPixels = 8
+# glyphs with a few pixels covered by potions still match their template, only once every digit has one,
+# otherwise a digit without template is read as its closest one, 6 and 9 are a stroke away from 8
+maxCountGlyphDistance = 3
+digitsCount = 10
+# counts images already read, a slot count only changes when a potion is used or bought
+maxCountsCacheSize = 256
+
+
+# glyph templates of each digit and their hashes, digits missing here are added by recording them with buildGlyphs.py
+countGlyphsTemplates: Dict[int, GrayImage] = dict(images['glyphs'])
+countGlyphsDigits: Dict[int, int] = {hashit(glyph): digit for digit, glyph in countGlyphsTemplates.items()}
+countsCache: Dict[int, int] = {}
+
+
+def getMaskedCountImage(countImage: GrayImage) -> GrayImage:
+    return np.where(countTextColors[countImage], countImage, 0).astype(np.uint8)
+
+
+# TODO: add perf
+# glyphs from left to right, cells are taken from the right until one has no text
+def getCountGlyphs(countImage: GrayImage) -> List[GrayImage]:
+    maskedCountImage = getMaskedCountImage(countImage)
+    columnsTextPixels = np.count_nonzero(maskedCountImage, axis=0)
+    glyphs = []
+    for glyphIndex in range(countGlyphsCount):
+        x = len(countImage[0]) - countGlyphWidth * (glyphIndex + 1)
+        if x < 0 or columnsTextPixels[x:x + countGlyphWidth].sum() < minCountGlyphTextPixels:
+            break
+        glyphs.append(maskedCountImage[:, x:x + countGlyphWidth])
+    return glyphs[::-1]
+
+
+# exact hash first, otherwise the template with the fewest different pixels when close enough
+def getCountGlyphDigit(glyph: GrayImage) -> Union[int, None]:
+    digit = countGlyphsDigits.get(hashit(glyph), None)
+    if digit is not None or len(countGlyphsTemplates) < digitsCount:
+        return digit
+    closestDigit = None
+    closestDistance = maxCountGlyphDistance + 1
+    for templateDigit, template in countGlyphsTemplates.items():
+        distance = np.count_nonzero(template != glyph)
+        if distance < closestDistance:
+            closestDigit = templateDigit
+            closestDistance = distance
+    return closestDigit
+
+
+# TODO: add perf
+# None when a glyph is not known yet
+def getCount(countImage: GrayImage) -> Union[int, None]:
+    countImageHash = hashit(countImage)
+    count = countsCache.get(countImageHash, None)
+    if count is not None:
+        return count
+    count = 0
+    for glyph in getCountGlyphs(countImage):
+        digit = getCountGlyphDigit(glyph)
+        if digit is None:
+            return None
+        count = count * 10 + digit
+    setCachedCount(countImageHash, count)
+    return count
+
+
+def setCachedCount(countImageHash: int, count: int):
+    if len(countsCache) >= maxCountsCacheSize:
+        countsCache.clear()
+    countsCache[countImageHash] = count
@@ -1,5 +1,5 @@
 from typing import Union
-from src.shared.typings import GrayImage
+from src.shared.typings import BBox, GrayImage
 import src.repositories.actionBar.locators as actionBarLocators
 
 
@@ -12,3 +12,20 @@ def getCooldownsImage(screenshot: GrayImage) -> Union[GrayImage, None]:
     if rightArrowsPos is None:
         return None
     return screenshot[leftArrowsPos[1] + 37: leftArrowsPos[1] + 37 + 22, leftArrowsPos[0]:rightArrowsPos[0]]
+
+
+
+# TODO: add unit tests
+# slots are 34 pixels tall and cooldowns are drawn 37 pixels below the arrows
+def getActionBarRegion(screenshot: GrayImage) -> Union[BBox, None]:
+    leftArrowsPos = actionBarLocators.getLeftArrowsPosition(screenshot)
+    if leftArrowsPos is None:
+        return None
+    rightArrowsPos = actionBarLocators.getRightArrowsPosition(screenshot)
+    if rightArrowsPos is None:
+        return None
+    x0 = leftArrowsPos[0]
+    y0 = min(leftArrowsPos[1], rightArrowsPos[1])
+    x1 = rightArrowsPos[0] + rightArrowsPos[2]
+    y1 = max(leftArrowsPos[1] + 37 + 22, rightArrowsPos[1] + rightArrowsPos[3])
+    return (x0, y0, x1 - x0, y1 - y0)
@@ -28,6 +28,18 @@ images = {
         'yellow': loadFromRGBToGray(f'{skullsPath}/yellow.png'),
     }
 }
+# icons drawn at the right of a battle list slot with the confidence locate used for each of them,
+# every icon is a bit of the slot icons mask
+slotsIcons = [
+    ('blackSkull', images['skulls']['black'], 0.85),
+    ('greenSkull', images['skulls']['green'], 0.85),
+    ('orangeSkull', images['skulls']['orange'], 0.85),
+    ('redSkull', images['skulls']['red'], 0.85),
+    ('whiteSkull', images['skulls']['white'], 0.85),
+    ('yellowSkull', images['skulls']['yellow'], 0.85),
+    ('dust', images['icons']['dust'], 0.75),
+]
+slotsIconsBits = {iconName: 1 << index for index, (iconName, _, _) in enumerate(slotsIcons)}
 creaturesNamesImagesHashes = {}
 
 for creatureName in creatures:
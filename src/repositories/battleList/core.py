@@ -2,12 +2,20 @@ from numba import njit
 import numpy as np
 from typing import Generator, Union
 from src.shared.typings import CreatureCategory, CreatureCategoryOrUnknown, GrayImage
-from src.utils.core import hashit, locate
-from .config import creaturesNamesImagesHashes, images
+from src.utils.core import hashit
+from .config import creaturesNamesImagesHashes, slotsIcons, slotsIconsBits
 from .extractors import getCreaturesNamesImages
 from .typings import CreatureList, Creature
 
 
+# icons templates flattened with zero mean and unit norm, a window dot product is the cv2.TM_CCOEFF_NORMED score
+slotsIconsTemplates = np.array([np.ravel(iconImage) - np.mean(iconImage) for (_, iconImage, _) in slotsIcons], dtype=np.float32)
+slotsIconsTemplates /= np.linalg.norm(slotsIconsTemplates, axis=1, keepdims=True)
+slotsIconsConfidences = np.array([confidence for (_, _, confidence) in slotsIcons], dtype=np.float32)
+(slotsIconsHeight, slotsIconsWidth) = slotsIcons[0][1].shape
+skullsIconsMask = slotsIconsBits['blackSkull'] | slotsIconsBits['orangeSkull'] | slotsIconsBits['redSkull'] | slotsIconsBits['whiteSkull'] | slotsIconsBits['yellowSkull']
+
+
 # PERF: [0.13737060000000056, 4.999999987376214e-07]
 @njit(cache=True, fastmath=True)
 def getBeingAttackedCreatureCategory(creatures: CreatureList) -> Union[CreatureCategory, None]:
@@ -77,33 +85,42 @@ def getFilledSlotsCount(content: GrayImage) -> int:
     return filledSlotsCount
 
 
+# TODO: add perf
+# icons masks of the given slots, every icon template is scored against every position of every slot icons strip at once
+def getSlotsIcons(content: GrayImage, slotsIndexes: np.ndarray) -> np.ndarray:
+    slotsIconsMasks = np.zeros(len(slotsIndexes), dtype=np.uint8)
+    # the icons strip of the last slot can be cut by the container bottom bar
+    hasIconsStrip = slotsIndexes * 22 + 13 <= len(content)
+    if not hasIconsStrip.any():
+        return slotsIconsMasks
+    strips = np.array([content[slotIndex * 22 + 2:slotIndex * 22 + 13, -38:-2] for slotIndex in slotsIndexes[hasIconsStrip]], dtype=np.float32)
+    windows = np.lib.stride_tricks.sliding_window_view(strips, (slotsIconsHeight, slotsIconsWidth), axis=(1, 2))
+    windows = windows.reshape(len(strips), -1, slotsIconsHeight * slotsIconsWidth)
+    windows = windows - windows.mean(axis=2, keepdims=True)
+    windowsNorms = np.linalg.norm(windows, axis=2)
+    scores = windows @ slotsIconsTemplates.T
+    # flat windows have no score, as in cv2.matchTemplate
+    scores = np.divide(scores, windowsNorms[:, :, None], out=np.zeros_like(scores), where=windowsNorms[:, :, None] > 1e-3)
+    matches = scores.max(axis=1) > slotsIconsConfidences
+    slotsIconsMasks[hasIconsStrip] = matches @ (1 << np.arange(len(slotsIcons), dtype=np.uint8))
+    return slotsIconsMasks
+
+
 # PERF: [7.5999999999964984e-06, 7.999999986907369e-07]
+# only unknown creatures can be players
 def hasSkull(content: GrayImage, creatures: CreatureList) -> bool:
-    for creatureIndex, creature in enumerate(creatures):
-        if creature['name'] != 'Unknown':
-            continue
-        y = (creatureIndex * 22)
-        creatureIconsImage = content[y + 2:y + 13, -38:-2]
-        if locate(creatureIconsImage, images['skulls']['black']):
-            return True
-        if locate(creatureIconsImage, images['skulls']['orange']):
-            return True
-        if locate(creatureIconsImage, images['skulls']['red']):
-            return True
-        if locate(creatureIconsImage, images['skulls']['white']):
-            return True
-        if locate(creatureIconsImage, images['skulls']['yellow']):
-            return True
-    return False
+    if len(creatures) == 0:
+        return False
+    unknownCreaturesIndexes = np.flatnonzero(creatures['name'] == 'Unknown')
+    return bool((getSlotsIcons(content, unknownCreaturesIndexes) & skullsIconsMask).any())
+
 
 def checkDust(content: GrayImage, creatures: CreatureList):
-    for creatureIndex, creature in enumerate(creatures):
-        if creature['name'] != 'Unknown':
-            continue
-        y = (creatureIndex * 22)
-        creatureIconsImage = content[y + 2:y + 13, -38:-2]
-        if locate(creatureIconsImage, images['icons']['dust'], confidence=0.75):
-            creature['name'] = 'Dusted'
+    if len(creatures) == 0:
+        return creatures
+    unknownCreaturesIndexes = np.flatnonzero(creatures['name'] == 'Unknown')
+    dustedCreaturesIndexes = unknownCreaturesIndexes[getSlotsIcons(content, unknownCreaturesIndexes) & slotsIconsBits['dust'] > 0]
+    creatures['name'][dustedCreaturesIndexes] = 'Dusted'
     return creatures
 
 # PERF: [4.499999999296733e-06, 9.999999992515995e-07]
@@ -1,7 +1,7 @@
 from numba import njit
 import numpy as np
 from typing import Union
-from src.shared.typings import GrayImage
+from src.shared.typings import BBox, GrayImage
 from .locators import getContainerBottomBarPosition, getBattleListIconPosition
 
 
@@ -18,6 +18,17 @@ def getContent(screenshot: GrayImage) -> Union[GrayImage, None]:
     return content[:containerBottomBarPos[1] - 11, :]
 
 
+# TODO: add unit tests
+# content has no fixed height, so the region goes down to the bottom of the screen
+def getContentRegion(screenshot: GrayImage) -> Union[BBox, None]:
+    battleListIconPosition = getBattleListIconPosition(screenshot)
+    if battleListIconPosition is None:
+        return None
+    x = battleListIconPosition[0] - 1
+    y = battleListIconPosition[1]
+    return (x, y, max(156, battleListIconPosition[2] + 1), len(screenshot) - y)
+
+
 # PERF: [0.8151709999999994, 1.1999999999900979e-05]
 # TODO: add unit tests
 @njit(cache=True, fastmath=True, boundscheck=False)
@@ -30,3 +41,27 @@ def getCreaturesNamesImages(content: GrayImage, filledSlotsCount: int) -> GrayIm
             if creatureNameImage[j] == 192 or creatureNameImage[j] == 247:
                 creaturesNamesImages[i, j] = 192
     return creaturesNamesImages
+
+
+# TODO: add unit tests
+# TODO: add perf
+# pixels of every slot read by the being attacked corners, the name row and the icons checks, a slot decodes the same while they do not change
+@njit(cache=True, fastmath=True)
+def getSlotsDecodedPixels(content: GrayImage, filledSlotsCount: int) -> GrayImage:
+    (height, width) = content.shape
+    slotsDecodedPixels = np.zeros((filledSlotsCount, 4 + 115 + 11 * 36), dtype=np.uint8)
+    for i in range(filledSlotsCount):
+        y = i * 22
+        index = 0
+        for (cornerY, cornerX) in ((y, 0), (y, 19), (y + 19, 0), (y + 19, 19)):
+            if cornerY < height:
+                slotsDecodedPixels[i, index] = content[cornerY, cornerX]
+            index += 1
+        for x in range(23, 138):
+            slotsDecodedPixels[i, index] = content[y + 11, x]
+            index += 1
+        for iconY in range(y + 2, y + 13):
+            for x in range(width - 38, width - 2):
+                slotsDecodedPixels[i, index] = content[iconY, x]
+                index += 1
+    return slotsDecodedPixels
@@ -0,0 +1,104 @@
+import numpy as np
+from typing import Dict, List, Tuple, Union
+from src.shared.typings import CreatureCategoryOrUnknown, GrayImage
+from src.utils.core import hashit
+from .core import checkDust, getBeingAttackedCreatures, getCreaturesNames, getFilledSlotsCount
+from .extractors import getSlotsDecodedPixels
+from .typings import Creature, CreatureList
+
+
+# every battle list slot is a strip of 22 rows of the content
+slotHeight = 22
+
+
+class BattleListReader:
+    def __init__(self):
+        self.rows: Dict[int, Tuple[CreatureCategoryOrUnknown, bool]] = {}
+        self.creatures: CreatureList = np.array([], dtype=Creature)
+        self.creaturesRows: List[Tuple[CreatureCategoryOrUnknown, bool]] = []
+        self.names: List[CreatureCategoryOrUnknown] = []
+        self.target: Union[CreatureCategoryOrUnknown, None] = None
+        self.diff = self.getDiff([], None)
+
+    def reset(self):
+        self.rows = {}
+        self.creatures = np.array([], dtype=Creature)
+        self.creaturesRows = []
+        self.names = []
+        self.target = None
+        self.diff = self.getDiff([], None)
+
+    # TODO: add perf
+    # same creatures getCreatures returns, slots whose strip did not change since the previous read are not decoded again
+    def read(self, content: Union[GrayImage, None]) -> CreatureList:
+        if content is None:
+            self.rows = {}
+            self.creatures = np.array([], dtype=Creature)
+            self.creaturesRows = []
+            self.diff = self.getDiff([], None)
+            return []
+        filledSlotsCount = getFilledSlotsCount(content)
+        slotsDecodedPixels = getSlotsDecodedPixels(content, filledSlotsCount)
+        rows = {}
+        names = []
+        beingAttackedFlags = []
+        for slotIndex in range(filledSlotsCount):
+            # rows are keyed by their pixels instead of their index, so a creature leaving the list does not decode every slot below it,
+            # only pixels read by the decoders are hashed so health bars going down do not decode the slot again
+            slotHash = hashit(slotsDecodedPixels[slotIndex])
+            row = rows.get(slotHash, None) or self.rows.get(slotHash, None)
+            if row is None:
+                row = self.getSlotRow(content[slotIndex * slotHeight:(slotIndex + 1) * slotHeight])
+            rows[slotHash] = row
+            names.append(row[0])
+            beingAttackedFlags.append(row[1])
+        self.rows = rows
+        target = None
+        # only the first highlighted slot is the attacked creature, as in getBeingAttackedCreatures
+        if any(beingAttackedFlags):
+            targetIndex = beingAttackedFlags.index(True)
+            target = names[targetIndex]
+            beingAttackedFlags = [slotIndex == targetIndex for slotIndex in range(filledSlotsCount)]
+        creaturesRows = list(zip(names, beingAttackedFlags))
+        # most ticks nothing changed, the creatures of the previous read are returned as they are
+        if creaturesRows != self.creaturesRows:
+            self.creaturesRows = creaturesRows
+            self.creatures = np.array(creaturesRows, dtype=Creature)
+        self.diff = self.getDiff(names, target)
+        return self.creatures
+
+    def getSlotRow(self, slotContent: GrayImage) -> Tuple[CreatureCategoryOrUnknown, bool]:
+        isBeingAttacked = next(getBeingAttackedCreatures(slotContent, 1))
+        creatureName = next(getCreaturesNames(slotContent, 1))
+        creatures = checkDust(slotContent, np.array([(creatureName, isBeingAttacked)], dtype=Creature))
+        return (str(creatures[0]['name']), bool(isBeingAttacked))
+
+    # battle list slots have no identity, added and removed creatures are the names whose count changed,
+    # slots move up when a creature above leaves the list so the target is told apart by its species only
+    def getDiff(self, names: List[CreatureCategoryOrUnknown], target: Union[CreatureCategoryOrUnknown, None]) -> dict:
+        previousNamesCounts = self.getNamesCounts(self.names)
+        namesCounts = self.getNamesCounts(names)
+        added: List[CreatureCategoryOrUnknown] = []
+        removed: List[CreatureCategoryOrUnknown] = []
+        for creatureName in dict.fromkeys(self.names + names):
+            difference = namesCounts.get(creatureName, 0) - previousNamesCounts.get(creatureName, 0)
+            if difference > 0:
+                added.extend([creatureName] * difference)
+            elif difference < 0:
+                removed.extend([creatureName] * -difference)
+        diff = {
+            'added': added,
+            'removed': removed,
+            'previousTarget': self.target,
+            'target': target,
+            'targetChanged': self.target != target,
+        }
+        self.names = names
+        self.target = target
+        return diff
+
+    def getNamesCounts(self, names: List[CreatureCategoryOrUnknown]) -> Dict[CreatureCategoryOrUnknown, int]:
+        namesCounts = {}
+        for creatureName in names:
+            namesCounts[creatureName] = namesCounts.get(creatureName, 0) + 1
+        return namesCounts
@@ -48,6 +48,20 @@ def getTabs(screenshot: GrayImage):
         return {}
 
 
+# TODO: add unit tests
+# tabs, messages and chat on/off button live in the console below the game window
+def getChatRegion(screenshot: GrayImage) -> Union[BBox, None]:
+    leftSidebarArrowsPosition = getLeftArrowPosition(screenshot)
+    if leftSidebarArrowsPosition is None:
+        return None
+    chatMenuPosition = getChatMenuPosition(screenshot)
+    if chatMenuPosition is None:
+        return None
+    x = leftSidebarArrowsPosition[0]
+    y = chatMenuPosition[1]
+    return (x, y, len(screenshot[0]) - x, len(screenshot) - y)
+
+
 # TODO: add unit tests
 # TODO: add perf
 def hasNewLoot(screenshot: GrayImage) -> bool:
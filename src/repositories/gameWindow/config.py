@@ -1,5 +1,5 @@
 import pathlib
-from src.utils.core import hashit
+from src.utils.assetsBundle import openAssetsBundle
 from src.utils.image import loadFromRGBToGray
 
 
@@ -25,21 +25,9 @@ images = {
         'holeOpen': loadFromRGBToGray(f'{waypointsImagesPath}/holeOpen1080.png')
     }
 }
-arrowsImagesHashes = {
-    hashit(images['arrows']['leftGameWindow01']): 'leftGameWindow01',
-    hashit(images['arrows']['leftGameWindow10']): 'leftGameWindow10',
-    hashit(images['arrows']['leftGameWindow11']): 'leftGameWindow11',
-    hashit(images['arrows']['leftGameWindow00']): 'leftGameWindow00',
-    hashit(images['arrows']['rightGameWindow01']): 'rightGameWindow01',
-    hashit(images['arrows']['rightGameWindow10']): 'rightGameWindow10',
-    hashit(images['arrows']['rightGameWindow11']): 'rightGameWindow11',
-    hashit(images['arrows']['rightGameWindow00']): 'rightGameWindow00',
-}
 gameWindowSizes = {
     720: (480, 352),
     1080: (960, 704)
 }
-gameWindowCache = {
-    'left': {'arrow': None, 'position': None},
-    'right': {'arrow': None, 'position': None},
-}
+# built by builders/repositories/gameWindow/buildMonsters.py, names templates are sliced from it on first use
+creaturesNamesAtlas = openAssetsBundle(f'{currentPath}/npys/creaturesNamesAtlas.bin')
@@ -1,83 +1,57 @@
 from typing import Tuple, Union
 from src.shared.typings import BBox, Coordinate, GrayImage, Slot
-from src.utils.core import hashit, locate
-from .config import arrowsImagesHashes, gameWindowCache, images
+from src.utils.core import cacheObjectPosition, locate
+from src.utils.regionsOfInterest import getBoundingRegion
+from .config import images
 
 
 # TODO: add unit tests
 # TODO: add perf
+@cacheObjectPosition
 def getLeftArrowPosition(screenshot: GrayImage) -> Union[BBox, None]:
-    global gameWindowCache
-    if gameWindowCache['left']['position'] is not None:
-        leftArrowImage = images['arrows'][gameWindowCache['left']['arrow']]
-        leftArrowImageHash = hashit(leftArrowImage)
-        if arrowsImagesHashes.get(leftArrowImageHash, None) is not None:
-            return gameWindowCache['left']['position']
     leftGameWindow01Position = locate(
         screenshot, images['arrows']['leftGameWindow01'], confidence=0.95)
     if leftGameWindow01Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow01'
-        gameWindowCache['left']['position'] = leftGameWindow01Position
         return leftGameWindow01Position
     leftGameWindow11Position = locate(
         screenshot, images['arrows']['leftGameWindow11'], confidence=0.95)
     if leftGameWindow11Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow11'
-        gameWindowCache['left']['position'] = leftGameWindow11Position
         return leftGameWindow11Position
     leftGameWindow10Position = locate(
         screenshot, images['arrows']['leftGameWindow10'], confidence=0.95)
     if leftGameWindow10Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow10'
-        gameWindowCache['left']['position'] = leftGameWindow10Position
         return leftGameWindow10Position
     leftGameWindow00Position = locate(
         screenshot, images['arrows']['leftGameWindow00'], confidence=0.95)
     if leftGameWindow00Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow00'
-        gameWindowCache['left']['position'] = leftGameWindow00Position
         return leftGameWindow00Position
 
 
 # TODO: add unit tests
 # TODO: add perf
+@cacheObjectPosition
 def getRightArrowPosition(screenshot: GrayImage) -> Union[BBox, None]:
-    global gameWindowCache
-    if gameWindowCache['right']['position'] is not None:
-        rightArrowImage = images['arrows'][gameWindowCache['right']['arrow']]
-        rightArrowImageHash = hashit(rightArrowImage)
-        if arrowsImagesHashes.get(rightArrowImageHash, None) is not None:
-            return gameWindowCache['right']['position']
     rightGameWindow01Position = locate(
         screenshot, images['arrows']['rightGameWindow01'], confidence=0.95)
     if rightGameWindow01Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow01'
-        gameWindowCache['right']['position'] = rightGameWindow01Position
         return rightGameWindow01Position
     rightGameWindow11Position = locate(
         screenshot, images['arrows']['rightGameWindow11'], confidence=0.95)
     if rightGameWindow11Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow11'
-        gameWindowCache['right']['position'] = rightGameWindow11Position
         return rightGameWindow11Position
     rightGameWindow10Position = locate(
         screenshot, images['arrows']['rightGameWindow10'], confidence=0.95)
     if rightGameWindow10Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow10'
-        gameWindowCache['right']['position'] = rightGameWindow10Position
         return rightGameWindow10Position
     rightGameWindow00Position = locate(
         screenshot, images['arrows']['rightGameWindow00'], confidence=0.95)
     if rightGameWindow00Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow00'
-        gameWindowCache['right']['position'] = rightGameWindow00Position
         return rightGameWindow00Position
 
 
 # TODO: add unit tests
 # TODO: add perf
 def getCoordinate(screenshot: GrayImage, gameWindowSize) -> Union[BBox, None]:
-    global gameWindowCache
     leftArrowPosition = getLeftArrowPosition(screenshot)
     if leftArrowPosition is None:
         return None
@@ -89,6 +63,14 @@ def getCoordinate(screenshot: GrayImage, gameWindowSize) -> Union[BBox, None]:
     return (x, y, gameWindowSize[0], gameWindowSize[1])
 
 
+# TODO: add unit tests
+def getGameWindowRegion(screenshot: GrayImage, gameWindowSize) -> Union[BBox, None]:
+    coordinate = getCoordinate(screenshot, gameWindowSize)
+    if coordinate is None:
+        return None
+    return getBoundingRegion([getLeftArrowPosition(screenshot), getRightArrowPosition(screenshot), coordinate])
+
+
 # TODO: add unit tests
 # TODO: add perf
 def getImageByCoordinate(screenshot: GrayImage, coordinate, gameWindowSize) -> GrayImage:
@@ -1,22 +1,18 @@
 import math
-from numba import njit
+from numba import njit, prange
 import numpy as np
-import pathlib
-from scipy.spatial import distance
-import tcod
-from typing import List, Tuple, Union
-from src.repositories.radar.config import walkableFloorsSqms
+from typing import Dict, List, Tuple, Union
+from src.repositories.radar.config import packedWalkableFloorsSqms
 from src.repositories.radar.core import isCoordinateWalkable
+from src.repositories.radar.walkableSqms import getWalkableSqmsWindow
 from src.shared.typings import Coordinate, GrayImage, Slot, SlotWidth, XYCoordinate
-from src.utils.core import hashit
 from src.utils.coordinate import getPixelFromCoordinate
-from src.utils.image import loadFromRGBToGray
-from src.utils.matrix import hasMatrixInsideOther
 from src.wiki.creatures import creatures as wikiCreatures
+from .creaturesNames import getBattleListSpecies, getMatchedCreaturesNames, getPackedCreaturesNamesTemplates
+from .distances import getSlotsDistances, isPlayerSlotSurrounded, isSlotReachable
 from .typings import Creature, CreatureList
 
 
-currentPath = pathlib.Path(__file__).parent.resolve()
 resolutions = {
     720: {
         'gameWindowHeight': 352,
@@ -29,181 +25,190 @@ resolutions = {
         'slotWidth': 64,
     },
 }
-creaturesNamesHashes = {}
-for creature in wikiCreatures:
-    creaturesNamesHashes[creature] = loadFromRGBToGray(
-        f'{currentPath}/images/monsters/{creature}.png')
 
 
-# TODO: add unit tests
+# distances are computed once per tick, the creatures list is rebuilt every frame so its identity keys the tick
+gameWindowDistancesCache = {'creatures': None, 'coordinate': None, 'distances': None}
+
+
 # TODO: add perf
+# returns the distances from the player slot walking over creatures and with creatures blocking
+def getGameWindowDistances(gameWindowCreatures: CreatureList, coordinate: Coordinate) -> Tuple[np.ndarray, np.ndarray]:
+    if gameWindowDistancesCache['creatures'] is gameWindowCreatures and gameWindowDistancesCache['coordinate'] == tuple(coordinate):
+        return gameWindowDistancesCache['distances']
+    gameWindowWalkableFloorsSqms = getGameWindowWalkableFloorsSqms(
+        packedWalkableFloorsSqms, coordinate)
+    creaturesSlots = np.array([creature['slot'] for creature in gameWindowCreatures], dtype=np.int32).reshape(-1, 2)
+    distances = (
+        getSlotsDistances(gameWindowWalkableFloorsSqms, creaturesSlots[:0]),
+        getSlotsDistances(gameWindowWalkableFloorsSqms, creaturesSlots),
+    )
+    gameWindowDistancesCache['creatures'] = gameWindowCreatures
+    gameWindowDistancesCache['coordinate'] = tuple(coordinate)
+    gameWindowDistancesCache['distances'] = distances
+    return distances
+
+
+# TODO: add unit tests
 # TODO: add typings
 def getClosestCreature(gameWindowCreatures, coordinate: Coordinate):
     if len(gameWindowCreatures) == 0:
         return None
     if len(gameWindowCreatures) == 1:
         return gameWindowCreatures[0]
-    gameWindowWalkableFloorsSqms = getGameWindowWalkableFloorsSqms(
-        walkableFloorsSqms[coordinate[2]], coordinate)
-    graph = tcod.path.SimpleGraph(
-        cost=gameWindowWalkableFloorsSqms, cardinal=1, diagonal=0)
-    pf = tcod.path.Pathfinder(graph)
-    pf.add_root((5, 7))
-    closestCreatureSlot = None
-    closestCreatureIndex = 0
-    for creatureIndex, gameWindowCreature in enumerate(gameWindowCreatures):
-        creatureSlot = (
-            gameWindowCreature['slot'][1], gameWindowCreature['slot'][0])
-        pf.resolve(creatureSlot)
-        if closestCreatureSlot is None:
-            closestCreatureSlot = creatureSlot
+    (distances, _) = getGameWindowDistances(gameWindowCreatures, coordinate)
+    creaturesDistances = [distances[creature['slot'][1], creature['slot'][0]] for creature in gameWindowCreatures]
+    return gameWindowCreatures[int(np.argmin(creaturesDistances))]
+
+
+# rows are split in bands scanned by different threads, bars of every row keep their order when merged
+creaturesBarsBandHeight = 32
+
+
+# scans a single row for bars, returns how many bars were written in rowBars
+@njit(cache=True, fastmath=True)
+def getRowCreaturesBars(gameWindowImage: GrayImage, y: int, rowBars: np.ndarray) -> int:
+    width = gameWindowImage.shape[1] - 27
+    barsCount = 0
+    x = -1
+    while x < width:
+        x += 1
+        if gameWindowImage[y, x + 26] != 0:
+            x += 26
             continue
-        if pf.distance[creatureSlot[0], creatureSlot[1]] < pf.distance[closestCreatureSlot[0], closestCreatureSlot[1]]:
-            closestCreatureSlot = creatureSlot
-            closestCreatureIndex = creatureIndex
-    return gameWindowCreatures[closestCreatureIndex]
+        bothBordersAreBlack = True
+        for l in range(25):
+            key = x + 25 - l
+            if gameWindowImage[y, key] != 0 or gameWindowImage[y + 3, key] != 0:
+                bothBordersAreBlack = False
+                x = key
+                break
+        if bothBordersAreBlack == False:
+            continue
+        if (
+            gameWindowImage[y + 1, x] != 0 or
+            gameWindowImage[y + 2, x] != 0 or
+            gameWindowImage[y + 1, x + 26] != 0 or
+            gameWindowImage[y + 2, x + 26] != 0
+        ):
+            continue
+        rowBars[barsCount, 0] = x
+        rowBars[barsCount, 1] = y
+        barsCount += 1
+        x += 26
+    return barsCount
 
 
-# TODO: add unit tests
 # TODO: add perf
-@njit(fastmath=True)
-def getCreaturesBars(gameWindowImage: GrayImage) -> List[tuple[int, int]]:
-    bars = []
-    width = gameWindowImage.shape[1] - 27
+# rows whose bar borders cannot be black are skipped before scanning
+@njit(cache=True, fastmath=True, parallel=True)
+def getBandedCreaturesBars(gameWindowImage: GrayImage, bandHeight: int) -> np.ndarray:
     height = gameWindowImage.shape[0] - 3
-    creatureIndex = 0
+    # both bar borders have at least 25 black pixels in a row, one of them is always in a column multiple of 25
+    hasBlackPixels = np.zeros(gameWindowImage.shape[0], dtype=np.bool_)
+    for y in prange(gameWindowImage.shape[0]):
+        for x in range(0, gameWindowImage.shape[1], 25):
+            if gameWindowImage[y, x] == 0:
+                hasBlackPixels[y] = True
+                break
+    # a bar takes 27 pixels and the next one starts after it, so rows never hold more than this
+    maxRowBars = gameWindowImage.shape[1] // 27 + 2
+    rowsBars = np.empty((max(height, 0), maxRowBars, 2), dtype=np.int32)
+    rowsBarsCount = np.zeros(max(height, 0), dtype=np.int64)
+    bandsCount = (height + bandHeight - 1) // bandHeight
+    for band in prange(bandsCount):
+        for y in range(band * bandHeight, min((band + 1) * bandHeight, height)):
+            if hasBlackPixels[y] and hasBlackPixels[y + 3]:
+                rowsBarsCount[y] = getRowCreaturesBars(gameWindowImage, y, rowsBars[y])
+    bars = np.empty((rowsBarsCount.sum(), 2), dtype=np.int64)
+    barsCount = 0
     for y in range(height):
-        x = -1
-        while x < width:
-            x += 1
-            if gameWindowImage[y, x + 26] != 0:
-                x += 26
-                continue
-            bothBordersAreBlack = True
-            for l in range(25):
-                key = x + 25 - l
-                if gameWindowImage[y, key] != 0 or gameWindowImage[y + 3, key] != 0:
-                    bothBordersAreBlack = False
-                    x = key
-                    break
-            if bothBordersAreBlack == False:
-                continue
-            if (
-                gameWindowImage[y + 1, x] != 0 or
-                gameWindowImage[y + 2, x] != 0 or
-                gameWindowImage[y + 1, x + 26] != 0 or
-                gameWindowImage[y + 2, x + 26] != 0
-            ):
-                continue
-            bars.append((x, y))
-            creatureIndex += 1
-            x += 26
+        for index in range(rowsBarsCount[y]):
+            bars[barsCount] = rowsBars[y, index]
+            barsCount += 1
     return bars
 
 
+# TODO: add typings
+def getCreaturesBars(gameWindowImage: GrayImage) -> List[Tuple[int, int]]:
+    return [(x, y) for (x, y) in getBandedCreaturesBars(gameWindowImage, creaturesBarsBandHeight).tolist()]
+
+
+# bars closer to the game window center come first, the target is searched from the player outwards
+def getSortedCreaturesBars(gameWindowImage: GrayImage) -> List[Tuple[int, int]]:
+    creaturesBars = getCreaturesBars(gameWindowImage)
+    x = (len(gameWindowImage[1]) / 2) - 1
+    y = (len(gameWindowImage[0]) / 2) - 1
+    sqrt = np.array([
+        math.sqrt(((creatureBar[0] - x) ** 2) + ((creatureBar[1] - y) ** 2)) for creatureBar in creaturesBars], dtype=np.float64)
+    return [creaturesBars[creatureBarSortedIndex] for creatureBarSortedIndex in np.argsort(sqrt)]
+
+
+# players and dusted creatures are not recognized by name, every bar can be one of them
+def getBattleListMonstersSpecies(battleListSpecies: List[str]) -> List[str]:
+    return [creatureName for creatureName in battleListSpecies if creatureName != 'Unknown' and creatureName != 'Dusted']
+
+
+# TODO: add unit tests
+def getCreatureBarMonstersSpecies(gameWindowImage: GrayImage, creatureBar: Tuple[int, int], monstersSpecies: List[str]) -> List[str]:
+    if len(monstersSpecies) == 0:
+        return []
+    matchedMonstersSpecies = getMatchedCreaturesNames(
+        gameWindowImage, creatureBar[0], creatureBar[1], *getPackedCreaturesNamesTemplates(monstersSpecies))
+    return [creatureName for creatureName, isMatched in zip(monstersSpecies, matchedMonstersSpecies) if isMatched]
+
+
+# names are matched once per species, every battle list creature of a matched species is kept, repeated names included
+def getCreatureBarSpecies(battleListNames: List[str], creatureBarMonstersSpecies: List[str]) -> List[str]:
+    return [creatureName for creatureName in battleListNames if creatureName == 'Unknown' or creatureName == 'Dusted' or creatureName in creatureBarMonstersSpecies]
+
+
+def getBattleListNames(battleListCreatures) -> List[str]:
+    return [battleListCreature['name'] for battleListCreature in battleListCreatures]
+
+
+# TODO: add unit tests
+# TODO: add typings
+def makeCreatureBarCreatures(creatureBarSpecies: List[str], creatureBar: Tuple[int, int], direction, gameWindowCoordinate: XYCoordinate, gameWindowImage: GrayImage, coordinate: Coordinate, slotWidth: SlotWidth, discoverTarget: bool, beingAttackedCreatureCategory: Union[str, None], walkedPixelsInSqm: int) -> Tuple[list, bool]:
+    creatures = []
+    for creatureName in creatureBarSpecies:
+        if creatureName == 'Unknown':
+            creature = makeCreature(creatureName, 'player', creatureBar, direction, gameWindowCoordinate, gameWindowImage,
+                                    coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
+        elif creatureName == 'Dusted':
+            creature = makeCreature('Minotaur Cult Follower', 'monster', creatureBar, direction, gameWindowCoordinate, gameWindowImage,
+                                    coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
+        else:
+            creature = makeCreature(creatureName, 'monster', creatureBar, direction, gameWindowCoordinate, gameWindowImage,
+                                    coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
+        if creature['isBeingAttacked']:
+            discoverTarget = False
+        creatures.append(creature)
+    return creatures, discoverTarget
+
+
 # TODO: add unit tests
 # TODO: add perf
 # TODO: add typings
-# TODO: add name missAlignment for each creature, it avoid possible 3 calculations
 # TODO: maximum creatures allowed should be equal battle list size
-# TODO: Find a way to avoid 3 calculation times when comparing names since some words have a wrong location
 # TODO: Whenever the last species is left, avoid loops and resolve species immediately for remaining creatures bars
 def getCreatures(battleListCreatures, direction, gameWindowCoordinate: XYCoordinate, gameWindowImage: GrayImage, coordinate: Coordinate, beingAttackedCreatureCategory: str = None, walkedPixelsInSqm: int = 0):
     if len(battleListCreatures) == 0:
         return []
-    creaturesBars = getCreaturesBars(gameWindowImage)
+    creaturesBars = getSortedCreaturesBars(gameWindowImage)
     if len(creaturesBars) == 0:
         return []
     creatures = []
-    gameWindowWidth = len(gameWindowImage[1])
-    x = (len(gameWindowImage[1]) / 2) - 1
-    y = (len(gameWindowImage[0]) / 2) - 1
     slotWidth = len(gameWindowImage[1]) // 15
-    sqrt = np.array([
-        math.sqrt(((creatureBar[0] - x) ** 2) + ((creatureBar[1] - y) ** 2)) for creatureBar in creaturesBars], dtype=np.float64)
-    creaturesBarsSortedIndexes = np.argsort(sqrt)
     discoverTarget = beingAttackedCreatureCategory is not None
-    nonCreaturesForCurrentBar = {}
-    for creatureBarSortedIndex in creaturesBarsSortedIndexes:
-        for battleListIndex in range(len(battleListCreatures)):
-            creatureName = battleListCreatures[battleListIndex]['name']
-            if creatureName == 'Unknown':
-                creature = makeCreature(creatureName, 'player', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            if creatureName == 'Dusted':
-                creature = makeCreature('Minotaur Cult Follower', 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            if nonCreaturesForCurrentBar.get(creatureName, None) is not None:
-                continue
-            creatureNameImg = creaturesNamesHashes.get(creatureName)
-            (creatureBarX,
-             creatureBarY) = creaturesBars[creatureBarSortedIndex]
-            creatureBarY0 = creatureBarY - 13
-            creatureBarY1 = creatureBarY0 + 11
-            creatureNameImgHalfWidth = math.floor(creatureNameImg.shape[1] / 2)
-            leftDiff = max(creatureNameImgHalfWidth - 13, 0)
-            gapLeft = 0 if creatureBarX > leftDiff else leftDiff - creatureBarX
-            gapInnerLeft = 0 if creatureNameImg.shape[1] > 27 else math.ceil(
-                (27 - creatureNameImg.shape[1]) / 2)
-            rightDiff = max(
-                creatureNameImg.shape[1] - creatureNameImgHalfWidth - 14, 0)
-            gapRight = 0 if gameWindowWidth > (
-                creatureBarX + 27 + rightDiff) else creatureBarX + 27 + rightDiff - gameWindowWidth
-            gapInnerRight = 0 if creatureNameImg.shape[1] > 27 else math.floor(
-                (27 - creatureNameImg.shape[1]) / 2)
-            gg = 13 + gapLeft + gapInnerLeft - gapRight - gapInnerRight
-            startingX = max(0, creatureBarX - creatureNameImgHalfWidth + gg)
-            endingX = min(gameWindowWidth, creatureBarX +
-                          creatureNameImgHalfWidth + gg)
-            creatureWithDirtNameImg = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                      startingX:endingX]
-            if creatureNameImg.shape[1] != creatureWithDirtNameImg.shape[1]:
-                creatureWithDirtNameImg = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                          startingX:endingX + 1]
-            if hasMatrixInsideOther(creatureWithDirtNameImg, creatureNameImg):
-                creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            creatureNameImg2 = creaturesNamesHashes.get(creatureName)
-            creatureWithDirtNameImg2 = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                       startingX + 1:endingX + 1]
-            if creatureNameImg2.shape[1] != creatureWithDirtNameImg2.shape[1]:
-                creatureNameImg2 = creatureNameImg2[:,
-                                                    0:creatureNameImg2.shape[1] - 1]
-            if hasMatrixInsideOther(creatureWithDirtNameImg2, creatureNameImg2):
-                creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            creatureWithDirtNameImg3 = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                       startingX:endingX - 1]
-            creatureNameImg3 = creaturesNamesHashes.get(creatureName)
-            creatureNameImg3 = creatureNameImg3[:, 1:creatureNameImg3.shape[1]]
-            if creatureWithDirtNameImg3.shape[1] != creatureNameImg3.shape[1]:
-                creatureNameImg3 = creatureNameImg3[:,
-                                                    0:creatureNameImg3.shape[1] - 1]
-            if hasMatrixInsideOther(creatureWithDirtNameImg3, creatureNameImg3):
-                creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            nonCreaturesForCurrentBar[creatureName] = True
-        nonCreaturesForCurrentBar.clear()
+    battleListNames = getBattleListNames(battleListCreatures)
+    monstersSpecies = getBattleListMonstersSpecies(getBattleListSpecies(battleListCreatures))
+    for creatureBar in creaturesBars:
+        creatureBarSpecies = getCreatureBarSpecies(
+            battleListNames, getCreatureBarMonstersSpecies(gameWindowImage, creatureBar, monstersSpecies))
+        (creatureBarCreatures, discoverTarget) = makeCreatureBarCreatures(creatureBarSpecies, creatureBar, direction, gameWindowCoordinate, gameWindowImage,
+                                                                          coordinate, slotWidth, discoverTarget, beingAttackedCreatureCategory, walkedPixelsInSqm)
+        creatures.extend(creatureBarCreatures)
     return creatures
 
 
@@ -214,45 +219,40 @@ def getCreaturesByType(gameWindowCreatures: CreatureList, creatureType):
     return [gameWindowCreature for gameWindowCreature in gameWindowCreatures if gameWindowCreature['type'] == creatureType]
 
 
-# TODO: add unit tests
-# TODO: add perf
-# TODO: improve performance
+# slots are numbered row by row, the 15x11 game window fits in a single mask
+def getSlotsIndexes(slots) -> np.ndarray:
+    slots = np.asarray(slots, dtype=np.int32).reshape(-1, 2)
+    return slots[:, 1] * 15 + slots[:, 0]
+
+
+# previous creatures inside the slots whose slot is not taken by a creature of the same species anymore
 def getDifferentCreaturesBySlots(previousGameWindowCreatures: CreatureList, currentGameWindowCreatures: CreatureList, slots: List[Slot]) -> CreatureList:
-    previousGameWindowCreaturesBySlots = np.array(
-        [], dtype=Creature)
-    currentGameWindowCreaturesBySlots = np.array(
-        [], dtype=Creature)
-    differentCreatures = np.array([], dtype=Creature)
-    for previousGameWindowCreature in previousGameWindowCreatures:
-        if np.isin(previousGameWindowCreature['slot'], slots).all():
-            previousGameWindowCreaturesBySlots = np.append(
-                previousGameWindowCreaturesBySlots, [previousGameWindowCreature])
-    for currentGameWindowCreature in currentGameWindowCreatures:
-        if np.isin(currentGameWindowCreature['slot'], slots).all():
-            currentGameWindowCreaturesBySlots = np.append(
-                currentGameWindowCreaturesBySlots, [currentGameWindowCreature])
-    for previousGameWindowCreature in previousGameWindowCreaturesBySlots:
-        creatureDoesNotExists = True
-        for currentGameWindowCreature in currentGameWindowCreatures:
-            previousGameWindowCreatureHash = hashit(
-                previousGameWindowCreature)
-            currentGameWindowCreatureHash = hashit(
-                currentGameWindowCreature)
-            if previousGameWindowCreatureHash == currentGameWindowCreatureHash:
-                creatureDoesNotExists = False
-                break
-        if creatureDoesNotExists:
-            differentCreatures = np.append(
-                differentCreatures, [previousGameWindowCreature])
-    return differentCreatures
+    if len(previousGameWindowCreatures) == 0:
+        return []
+    slotsMask = np.zeros(15 * 11, dtype=np.bool_)
+    slotsMask[getSlotsIndexes(slots)] = True
+    speciesIds = {}
+    previousKeys = getCreaturesKeys(previousGameWindowCreatures, speciesIds)
+    currentKeys = getCreaturesKeys(currentGameWindowCreatures, speciesIds)
+    isDifferent = slotsMask[previousKeys % (15 * 11)] & np.isin(previousKeys, currentKeys, invert=True)
+    return [previousGameWindowCreatures[index] for index in np.flatnonzero(isDifferent)]
+
+
+# a creature key packs its species and slot in a single integer
+def getCreaturesKeys(gameWindowCreatures: CreatureList, speciesIds: Dict[str, int]) -> np.ndarray:
+    if len(gameWindowCreatures) == 0:
+        return np.zeros(0, dtype=np.int64)
+    creaturesSpeciesIds = np.fromiter((speciesIds.setdefault(
+        gameWindowCreature['name'], len(speciesIds)) for gameWindowCreature in gameWindowCreatures), dtype=np.int64, count=len(gameWindowCreatures))
+    return creaturesSpeciesIds * (15 * 11) + getSlotsIndexes([gameWindowCreature['slot'] for gameWindowCreature in gameWindowCreatures])
 
 
 # TODO: add unit tests
 # TODO: add perf
-def getGameWindowWalkableFloorsSqms(walkableFloorsSqms: np.ndarray, coordinate: Coordinate) -> np.ndarray:
+def getGameWindowWalkableFloorsSqms(packedWalkableFloorsSqms: np.ndarray, coordinate: Coordinate) -> np.ndarray:
     (xOfPixelCoordinate, yOfPixelCoordinate) = getPixelFromCoordinate(
         coordinate)
-    return walkableFloorsSqms[yOfPixelCoordinate - 5:yOfPixelCoordinate + 6, xOfPixelCoordinate - 7:xOfPixelCoordinate + 8]
+    return getWalkableSqmsWindow(packedWalkableFloorsSqms, xOfPixelCoordinate - 7, yOfPixelCoordinate - 5, coordinate[2], 15, 11)
 
 
 # TODO: add unit tests
@@ -279,20 +279,11 @@ def getTargetCreature(gameWindowCreatures):
 
 
 # TODO: add unit tests
-# TODO: add perf
 def hasTargetToCreatureBySlot(gameWindowCreatures: CreatureList, slot: Slot, coordinate: Coordinate) -> bool:
     if len(gameWindowCreatures) == 0:
         return False
-    gameWindowWalkableFloorsSqms = getGameWindowWalkableFloorsSqms(
-        walkableFloorsSqms[coordinate[2]], coordinate)
-    slots = np.array([creature['slot'] for creature in gameWindowCreatures])
-    creaturesSlots = slots[:, [1, 0]]
-    gameWindowWalkableFloorsSqms[creaturesSlots[:,
-                                                0], creaturesSlots[:, 1]] = 0
-    gameWindowWalkableFloorsSqms[slot[1], slot[0]] = 1
-    x = coordinate[0] + slot[0] - coordinate[0]
-    y = coordinate[1] + slot[1] - coordinate[1]
-    return len(tcod.path.AStar(gameWindowWalkableFloorsSqms, 0).get_path(5, 7, y, x)) > 0
+    (_, blockedDistances) = getGameWindowDistances(gameWindowCreatures, coordinate)
+    return isSlotReachable(blockedDistances, slot)
 
 
 # TODO: add unit tests
@@ -350,35 +341,9 @@ def isCreatureBeingAttacked(gameWindowImage: GrayImage, borderX: int, yOfCreatur
     return pixelsCount > 50
 
 # TODO: add unit tests
-# TODO: add perf
 def isTrappedByCreatures(gameWindowCreatures: CreatureList, radarCoordinate: Coordinate) -> bool:
-    pixelRadarCoordinate = getPixelFromCoordinate(radarCoordinate)
-    playerBox = walkableFloorsSqms[radarCoordinate[2], pixelRadarCoordinate[1] -
-                                   1: pixelRadarCoordinate[1] + 2, pixelRadarCoordinate[0] - 1: pixelRadarCoordinate[0] + 2]
-    for gameWindowCreature in gameWindowCreatures:
-        distanceOf = distance.cdist([gameWindowCreature['coordinate']], [
-                                    radarCoordinate], 'euclidean').flatten()[0]
-        if distanceOf < 1.42:
-            x = gameWindowCreature['coordinate'][0] - radarCoordinate[0] + 1
-            y = gameWindowCreature['coordinate'][1] - radarCoordinate[1] + 1
-            playerBox[y, x] = 0
-    if playerBox[0, 0] == 1:
-        return False
-    if playerBox[0, 1] == 1:
-        return False
-    if playerBox[0, 2] == 1:
-        return False
-    if playerBox[1, 0] == 1:
-        return False
-    if playerBox[1, 2] == 1:
-        return False
-    if playerBox[2, 0] == 1:
-        return False
-    if playerBox[2, 1] == 1:
-        return False
-    if playerBox[2, 2] == 1:
-        return False
-    return True
+    (_, blockedDistances) = getGameWindowDistances(gameWindowCreatures, radarCoordinate)
+    return isPlayerSlotSurrounded(blockedDistances)
 
 
 # TODO: add unit tests
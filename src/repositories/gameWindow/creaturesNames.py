@@ -0,0 +1,155 @@
+import math
+from numba import njit
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+from src.shared.typings import GrayImage
+from src.utils.image import loadFromRGBToGray
+from .config import creaturesNamesAtlas, imagesPath
+
+
+# pixels of the game window that can be drawn over a name letter, other colors reject the name
+nameLettersColors = np.zeros(256, dtype=np.bool_)
+nameLettersColors[[0, 29, 57, 91, 113, 152, 170, 192]] = True
+# names are drawn at the bar x, at its x shifted by one and with their first column cut
+nameAlignmentsCount = 3
+
+
+# names images already read from the atlas or decoded from their png
+creaturesNamesImgs: Dict[str, GrayImage] = {}
+creaturesNamesAtlasIndexes = None if creaturesNamesAtlas is None else {
+    str(creatureName): index for index, creatureName in enumerate(creaturesNamesAtlas['names'])}
+
+
+# checkouts without the atlas decode the png of a species the first time it is met
+def getCreatureNameImg(creatureName: str) -> GrayImage:
+    creatureNameImg = creaturesNamesImgs.get(creatureName, None)
+    if creatureNameImg is not None:
+        return creatureNameImg
+    index = None if creaturesNamesAtlasIndexes is None else creaturesNamesAtlasIndexes.get(creatureName, None)
+    if index is None:
+        creatureNameImg = loadFromRGBToGray(f'{imagesPath}/monsters/{creatureName}.png')
+    else:
+        offset = creaturesNamesAtlas['offsets'][index]
+        creatureNameImg = creaturesNamesAtlas['templates'][:, offset:offset + creaturesNamesAtlas['widths'][index]]
+    creaturesNamesImgs[creatureName] = creatureNameImg
+    return creatureNameImg
+
+
+# letters of a name template are its black pixels, the last alignment starts at the second column
+def getCreatureNameTemplate(creatureNameImg: GrayImage) -> dict:
+    (height, width) = creatureNameImg.shape
+    alignments = np.full((nameAlignmentsCount, height, width), 255, dtype=np.uint8)
+    alignments[0] = creatureNameImg
+    alignments[1] = creatureNameImg
+    alignments[2, :, :width - 1] = creatureNameImg[:, 1:]
+    return {
+        'alignments': alignments,
+        'width': width,
+        'columnsLettersCounts': np.count_nonzero(alignments == 0, axis=1).astype(np.int32),
+    }
+
+
+# TODO: add perf
+# packs the templates of the battle list species so a bar is matched against all of them at once
+def packCreaturesNamesTemplates(creaturesNamesTemplates: List[dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    height = creaturesNamesTemplates[0]['alignments'].shape[1]
+    maxWidth = max(creatureNameTemplate['width'] for creatureNameTemplate in creaturesNamesTemplates)
+    alignments = np.full((len(creaturesNamesTemplates), nameAlignmentsCount, height, maxWidth), 255, dtype=np.uint8)
+    columnsLettersCounts = np.zeros((len(creaturesNamesTemplates), nameAlignmentsCount, maxWidth), dtype=np.int32)
+    widths = np.zeros(len(creaturesNamesTemplates), dtype=np.int32)
+    for index, creatureNameTemplate in enumerate(creaturesNamesTemplates):
+        width = creatureNameTemplate['width']
+        alignments[index, :, :, :width] = creatureNameTemplate['alignments']
+        columnsLettersCounts[index, :, :width] = creatureNameTemplate['columnsLettersCounts']
+        widths[index] = width
+    return alignments, columnsLettersCounts, widths
+
+
+# same bounds a python slice gets for the given start and stop
+@njit(cache=True)
+def getSliceBounds(start: int, stop: int, length: int) -> Tuple[int, int]:
+    if start < 0:
+        start += length
+    if stop < 0:
+        stop += length
+    start = min(max(start, 0), length)
+    stop = min(max(stop, 0), length)
+    return start, max(stop, start)
+
+
+@njit(cache=True, fastmath=True)
+def hasNameInsideWindow(gameWindowImage: GrayImage, rowStart: int, rowStop: int, columnStart: int, columnStop: int, alignment: np.ndarray, columnsLettersCounts: np.ndarray, windowColumnsLettersCounts: np.ndarray) -> bool:
+    templateWidth = alignment.shape[1]
+    # columns without enough letter colored pixels reject the name before comparing pixel by pixel
+    if rowStop - rowStart == alignment.shape[0]:
+        for x in range(columnStart, min(columnStop, columnStart + templateWidth)):
+            if windowColumnsLettersCounts[x] == -1:
+                windowColumnsLettersCounts[x] = 0
+                for y in range(rowStart, rowStop):
+                    if nameLettersColors[gameWindowImage[y, x]]:
+                        windowColumnsLettersCounts[x] += 1
+            if windowColumnsLettersCounts[x] < columnsLettersCounts[x - columnStart]:
+                return False
+    for y in range(rowStart, rowStop):
+        for x in range(columnStart, min(columnStop, columnStart + templateWidth)):
+            if alignment[y - rowStart, x - columnStart] == 0 and not nameLettersColors[gameWindowImage[y, x]]:
+                return False
+    return True
+
+
+# TODO: add perf
+# tells which of the packed names is written above the bar, names are centered on the bar unless clipped by the game window edges
+@njit(cache=True, fastmath=True)
+def getMatchedCreaturesNames(gameWindowImage: GrayImage, creatureBarX: int, creatureBarY: int, alignments: np.ndarray, columnsLettersCounts: np.ndarray, widths: np.ndarray) -> np.ndarray:
+    (height, width) = gameWindowImage.shape
+    matches = np.zeros(len(widths), dtype=np.bool_)
+    (rowStart, rowStop) = getSliceBounds(creatureBarY - 13, creatureBarY - 2, height)
+    windowColumnsLettersCounts = np.full(width, -1, dtype=np.int32)
+    for index in range(len(widths)):
+        templateWidth = widths[index]
+        templateHalfWidth = templateWidth // 2
+        leftDiff = max(templateHalfWidth - 13, 0)
+        gapLeft = 0 if creatureBarX > leftDiff else leftDiff - creatureBarX
+        gapInnerLeft = 0 if templateWidth > 27 else math.ceil((27 - templateWidth) / 2)
+        rightDiff = max(templateWidth - templateHalfWidth - 14, 0)
+        gapRight = 0 if width > creatureBarX + 27 + rightDiff else creatureBarX + 27 + rightDiff - width
+        gapInnerRight = 0 if templateWidth > 27 else (27 - templateWidth) // 2
+        gg = 13 + gapLeft + gapInnerLeft - gapRight - gapInnerRight
+        startingX = max(0, creatureBarX - templateHalfWidth + gg)
+        endingX = min(width, creatureBarX + templateHalfWidth + gg)
+        (columnStart, columnStop) = getSliceBounds(startingX, endingX, width)
+        if columnStop - columnStart != templateWidth:
+            (columnStart, columnStop) = getSliceBounds(startingX, endingX + 1, width)
+        if hasNameInsideWindow(gameWindowImage, rowStart, rowStop, columnStart, columnStop, alignments[index, 0, :, :templateWidth], columnsLettersCounts[index, 0], windowColumnsLettersCounts):
+            matches[index] = True
+            continue
+        (columnStart, columnStop) = getSliceBounds(startingX + 1, endingX + 1, width)
+        if hasNameInsideWindow(gameWindowImage, rowStart, rowStop, columnStart, columnStop, alignments[index, 1, :, :templateWidth], columnsLettersCounts[index, 1], windowColumnsLettersCounts):
+            matches[index] = True
+            continue
+        (columnStart, columnStop) = getSliceBounds(startingX, endingX - 1, width)
+        if hasNameInsideWindow(gameWindowImage, rowStart, rowStop, columnStart, columnStop, alignments[index, 2, :, :templateWidth], columnsLettersCounts[index, 2], windowColumnsLettersCounts):
+            matches[index] = True
+    return matches
+
+
+# battle list species in order of first appearance, every species is matched once per bar
+def getBattleListSpecies(battleListCreatures) -> List[str]:
+    return list(dict.fromkeys(battleListCreature['name'] for battleListCreature in battleListCreatures))
+
+
+# templates of species seen in battle lists, built once per species
+creaturesNamesTemplates: Dict[str, dict] = {}
+creaturesNamesPackedTemplates = {'species': None, 'packed': None}
+
+
+def getPackedCreaturesNamesTemplates(species: List[str], getCreatureNameImg: Callable[[str], GrayImage] = getCreatureNameImg):
+    if creaturesNamesPackedTemplates['species'] == species:
+        return creaturesNamesPackedTemplates['packed']
+    for creatureName in species:
+        if creatureName not in creaturesNamesTemplates:
+            creaturesNamesTemplates[creatureName] = getCreatureNameTemplate(getCreatureNameImg(creatureName))
+    packed = packCreaturesNamesTemplates([creaturesNamesTemplates[creatureName] for creatureName in species])
+    creaturesNamesPackedTemplates['species'] = species
+    creaturesNamesPackedTemplates['packed'] = packed
+    return packed
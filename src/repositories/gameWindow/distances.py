@@ -0,0 +1,68 @@
+from numba import njit
+import numpy as np
+
+
+# the player is always drawn at the center slot of the 15x11 game window
+playerSlotRow = 5
+playerSlotColumn = 7
+# blocked sqms are farther than any unreachable sqm, so both never win a closest distance comparison
+blockedSlotDistance = np.iinfo(np.int32).max
+unreachableSlotDistance = blockedSlotDistance - 1
+
+
+# TODO: add perf
+# steps from the player slot to every slot of the game window, blocked slots are (x, y) pairs
+@njit(cache=True, fastmath=True)
+def getSlotsDistances(walkableSqms: np.ndarray, blockedSlots: np.ndarray) -> np.ndarray:
+    height, width = walkableSqms.shape
+    distances = np.full((height, width), unreachableSlotDistance, dtype=np.int32)
+    for y in range(height):
+        for x in range(width):
+            if walkableSqms[y, x] == 0:
+                distances[y, x] = blockedSlotDistance
+    for index in range(len(blockedSlots)):
+        (x, y) = (blockedSlots[index, 0], blockedSlots[index, 1])
+        if x >= 0 and x < width and y >= 0 and y < height:
+            distances[y, x] = blockedSlotDistance
+    # every slot is queued at most once, the window is too small for anything smarter than a bfs
+    queue = np.empty(height * width, dtype=np.int32)
+    distances[playerSlotRow, playerSlotColumn] = 0
+    queue[0] = playerSlotRow * width + playerSlotColumn
+    head = 0
+    tail = 1
+    while head < tail:
+        index = queue[head]
+        head += 1
+        currentY = index // width
+        currentX = index % width
+        nextDistance = distances[currentY, currentX] + 1
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            nextX = currentX + xOffset
+            nextY = currentY + yOffset
+            if nextX < 0 or nextX >= width or nextY < 0 or nextY >= height:
+                continue
+            if distances[nextY, nextX] != unreachableSlotDistance:
+                continue
+            distances[nextY, nextX] = nextDistance
+            queue[tail] = nextY * width + nextX
+            tail += 1
+    return distances
+
+
+# a slot can be reached when the player can step next to it, the slot itself may hold a creature
+def isSlotReachable(distances: np.ndarray, slot) -> bool:
+    (x, y) = (slot[0], slot[1])
+    if x == playerSlotColumn and y == playerSlotRow:
+        return False
+    height, width = distances.shape
+    for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+        (nextX, nextY) = (x + xOffset, y + yOffset)
+        if 0 <= nextX < width and 0 <= nextY < height and distances[nextY, nextX] < unreachableSlotDistance:
+            return True
+    return False
+
+
+# the player is trapped when none of the 8 surrounding slots can be stepped on
+def isPlayerSlotSurrounded(distances: np.ndarray) -> bool:
+    box = distances[playerSlotRow - 1:playerSlotRow + 2, playerSlotColumn - 1:playerSlotColumn + 2]
+    return int(np.count_nonzero(box == blockedSlotDistance)) == 8
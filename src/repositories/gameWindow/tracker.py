@@ -0,0 +1,158 @@
+import numpy as np
+from typing import Dict, List, Tuple, Union
+from src.shared.typings import Coordinate, GrayImage, XYCoordinate
+from .creatures import getBattleListMonstersSpecies, getBattleListNames, getCreatureBarMonstersSpecies, getCreatureBarSpecies, getSortedCreaturesBars, makeCreatureBarCreatures
+from .creaturesNames import getBattleListSpecies
+from .typings import Creature, CreatureList
+
+
+class CreaturesTracker:
+    # a creature walks a sqm between ticks while the screen scrolls up to another sqm under a walking player
+    maxDistanceInSqms = 1.5
+    # bars flicker while creatures overlap, tracks survive a few ticks without their bar
+    maxMissedTicks = 2
+
+    def __init__(self):
+        self.tracks: List[dict] = []
+        self.nextId = 1
+        self.floorLevel = None
+        self.events: List[dict] = []
+
+    def reset(self):
+        self.tracks = []
+        self.nextId = 1
+        self.floorLevel = None
+        self.events = []
+
+    # TODO: add perf
+    # same creatures getCreatures returns, bars following a track reuse its species instead of matching names again
+    def track(self, battleListCreatures, direction, gameWindowCoordinate: XYCoordinate, gameWindowImage: GrayImage, coordinate: Coordinate, beingAttackedCreatureCategory: Union[str, None] = None, walkedPixelsInSqm: int = 0) -> CreatureList:
+        self.events = []
+        if self.floorLevel != coordinate[2]:
+            self.removeTracks(list(self.tracks), 'disappeared')
+            self.floorLevel = coordinate[2]
+        creaturesBars = [] if len(battleListCreatures) == 0 else getSortedCreaturesBars(gameWindowImage)
+        slotWidth = len(gameWindowImage[1]) // 15
+        positions = [self.getPosition(creatureBar, coordinate, slotWidth) for creatureBar in creaturesBars]
+        battleListNames = getBattleListNames(battleListCreatures)
+        monstersSpecies = getBattleListMonstersSpecies(getBattleListSpecies(battleListCreatures))
+        barsTracks = self.getBarsTracks(positions, slotWidth)
+        for barIndex, creatureBar in enumerate(creaturesBars):
+            track = barsTracks.get(barIndex, None)
+            if track is not None:
+                track['monstersSpecies'] = [creatureName for creatureName in track['monstersSpecies'] if creatureName in monstersSpecies]
+                # a species never changes, names are only matched again when new species could be written above the bar
+                if len(track['monstersSpecies']) > 0 or set(monstersSpecies) <= track['matchedSpecies']:
+                    continue
+                del barsTracks[barIndex]
+            barMonstersSpecies = getCreatureBarMonstersSpecies(gameWindowImage, creatureBar, monstersSpecies)
+            track = self.getClosestFreeTrack(positions[barIndex], barMonstersSpecies, barsTracks, slotWidth)
+            if track is None:
+                track = self.addTrack(positions[barIndex])
+            track['monstersSpecies'] = barMonstersSpecies
+            track['matchedSpecies'] = set(monstersSpecies)
+            barsTracks[barIndex] = track
+        self.updateTracks(barsTracks, positions)
+        creatures = []
+        discoverTarget = beingAttackedCreatureCategory is not None
+        for barIndex, creatureBar in enumerate(creaturesBars):
+            track = barsTracks[barIndex]
+            creatureBarSpecies = getCreatureBarSpecies(battleListNames, track['monstersSpecies'])
+            (creatureBarCreatures, discoverTarget) = makeCreatureBarCreatures(creatureBarSpecies, creatureBar, direction, gameWindowCoordinate, gameWindowImage,
+                                                                              coordinate, slotWidth, discoverTarget, beingAttackedCreatureCategory, walkedPixelsInSqm)
+            for creature in creatureBarCreatures:
+                creature['id'] = track['id']
+            if track['isNew']:
+                track['isNew'] = False
+                self.events.append({'type': 'appeared', 'id': track['id'], 'creatures': creatureBarCreatures})
+            track['creatures'] = creatureBarCreatures
+            creatures.extend(creatureBarCreatures)
+        return creatures
+
+    # bars are followed in floor pixels so the screen scrolling under a walking player is not seen as creatures moving
+    def getPosition(self, creatureBar: Tuple[int, int], coordinate: Coordinate, slotWidth: int) -> np.ndarray:
+        return np.array([coordinate[0] * slotWidth + creatureBar[0], coordinate[1] * slotWidth + creatureBar[1]], dtype=np.float64)
+
+    def getPredictedPosition(self, track: dict) -> np.ndarray:
+        return track['position'] + track['velocity'] * (track['missedTicks'] + 1)
+
+    # a bar follows a track only when both are the single candidate of each other, crowded bars match names again
+    def getBarsTracks(self, positions: List[np.ndarray], slotWidth: int) -> Dict[int, dict]:
+        if len(positions) == 0 or len(self.tracks) == 0:
+            return {}
+        predictedPositions = np.array([self.getPredictedPosition(track) for track in self.tracks])
+        distances = np.linalg.norm(np.array(positions)[:, None, :] - predictedPositions[None, :, :], axis=2)
+        candidates = distances <= self.maxDistanceInSqms * slotWidth
+        barsTracks = {}
+        for barIndex, trackIndex in zip(*np.nonzero(candidates)):
+            if candidates[barIndex].sum() == 1 and candidates[:, trackIndex].sum() == 1:
+                barsTracks[int(barIndex)] = self.tracks[trackIndex]
+        return barsTracks
+
+    def getClosestFreeTrack(self, position: np.ndarray, monstersSpecies: List[str], barsTracks: Dict[int, dict], slotWidth: int) -> Union[dict, None]:
+        usedTracksIds = {track['id'] for track in barsTracks.values()}
+        closestTrack = None
+        closestDistance = self.maxDistanceInSqms * slotWidth
+        for track in self.tracks:
+            if track['id'] in usedTracksIds or track['monstersSpecies'] != monstersSpecies:
+                continue
+            distance = np.linalg.norm(position - self.getPredictedPosition(track))
+            if distance <= closestDistance:
+                closestTrack = track
+                closestDistance = distance
+        return closestTrack
+
+    def addTrack(self, position: np.ndarray) -> dict:
+        track = {
+            'id': self.nextId,
+            'position': position,
+            'velocity': np.zeros(2, dtype=np.float64),
+            'missedTicks': 0,
+            'monstersSpecies': [],
+            'matchedSpecies': set(),
+            'creatures': [],
+            'isNew': True,
+        }
+        self.nextId += 1
+        self.tracks.append(track)
+        return track
+
+    def updateTracks(self, barsTracks: Dict[int, dict], positions: List[np.ndarray]):
+        seenTracksIds = set()
+        for barIndex, track in barsTracks.items():
+            track['velocity'] = (positions[barIndex] - track['position']) / (track['missedTicks'] + 1)
+            track['position'] = positions[barIndex]
+            track['missedTicks'] = 0
+            seenTracksIds.add(track['id'])
+        missedTracks = []
+        for track in self.tracks:
+            if track['id'] in seenTracksIds:
+                continue
+            track['missedTicks'] += 1
+            if track['missedTicks'] > self.maxMissedTicks:
+                missedTracks.append(track)
+        self.removeTracks([track for track in missedTracks if self.isInsideGameWindow(track)], 'died')
+        self.removeTracks([track for track in missedTracks if not self.isInsideGameWindow(track)], 'disappeared')
+
+    # creatures only leave the game window through its border, elsewhere their bar is gone because they died
+    def isInsideGameWindow(self, track: dict) -> bool:
+        if len(track['creatures']) == 0:
+            return False
+        slot = track['creatures'][0]['slot']
+        return 0 < slot[0] < 14 and 0 < slot[1] < 10
+
+    def removeTracks(self, tracks: List[dict], eventType: str):
+        removedTracksIds = {track['id'] for track in tracks}
+        self.tracks = [track for track in self.tracks if track['id'] not in removedTracksIds]
+        for track in tracks:
+            self.events.append({'type': eventType, 'id': track['id'], 'creatures': track['creatures']})
+
+    # last creature seen of a track, its bar can be already missing
+    def getLastSeenCreature(self, creatureId: int) -> Union[Creature, None]:
+        for track in self.tracks:
+            if track['id'] == creatureId and len(track['creatures']) > 0:
+                return track['creatures'][0]
+        for event in self.events:
+            if event['id'] == creatureId and len(event['creatures']) > 0:
+                return event['creatures'][0]
+        return None
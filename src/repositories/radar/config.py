@@ -1,11 +1,21 @@
 import numpy as np
 import pathlib
-from src.utils.core import hashit
-from src.utils.image import loadFromRGBToGray
+from typing import Dict
+from src.utils.assetsBundle import openAssetsBundle
+from src.utils.core import downsample, hashit
+from src.utils.image import load, loadFromRGBToGray
+from .radarImagesCoordinates import openRadarImagesCoordinates
+from .walkableSqms import packWalkableFloorsSqms
 
 
 currentPath = pathlib.Path(__file__).parent.resolve()
-coordinates = {}
+# built by builders/repositories/radar/buildRadarImagesCoordinates.py
+radarImagesCoordinates = openRadarImagesCoordinates(
+    f'{currentPath}/npys/radarImagesCoordinates.npy')
+learnedCoordinatesPath = f'{currentPath}/npys/learnedCoordinates.npy'
+learnedCoordinatesCapacity = 2 ** 20
+# built by builders/repositories/radar/buildRoutesGraph.py, it is only mapped on the first route
+routesGraphPath = f'{currentPath}/npys/routesGraph.bin'
 dimensions = {
     'width': 106,
     'height': 109,
@@ -15,75 +25,34 @@ dimensions = {
 floors = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
 floorsConfidence = [0.85, 0.85, 0.9, 0.95, 0.95, 0.95,
                     0.95, 0.85, 0.95, 0.95, 0.95, 0.95, 0.95, 0.9, 0.85, 0.85]
-floorsImgs = [
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-0.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-1.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-2.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-3.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-4.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-5.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-6.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-7.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-8.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-9.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-10.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-11.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-12.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-13.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-14.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-15.png'),
-]
-floorsPathsImgs = [
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-0.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-1.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-2.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-3.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-4.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-5.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-6.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-7.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-8.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-9.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-10.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-11.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-12.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-13.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-14.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-15.png'),
-]
-floorsPathsSqms = np.load(f'{currentPath}/npys/floorsPathsSqms.npy')
+# coarse level used to propose candidates when the player position is unknown
+floorsPyramidFactor = 4
+
+
+# TODO: add unit tests
+# fallback for checkouts without the bundle, every floor is decoded upfront
+def decodeRadarAssets() -> Dict[str, np.ndarray]:
+    floorsImgs = np.array([loadFromRGBToGray(
+        f'{currentPath}/images/floor-{floor}.png') for floor in floors])
+    floorsPathsImgs = [loadFromRGBToGray(
+        f'{currentPath}/images/paths/floor-{floor}.png') for floor in floors]
+    return {
+        'floors': floorsImgs,
+        'floorsCoarse': np.array([downsample(floorImg, floorsPyramidFactor) for floorImg in floorsImgs]),
+        'floorsPathsSqms': np.array([load(f'{currentPath}/images/paths/floor-{floor}.png')[:, :, 0] for floor in floors]),
+        'packedWalkableFloorsSqms': np.array([packWalkableFloorsSqms(np.where(np.isin(floorPathsImg, [105, 226]), 0, 1)) for floorPathsImg in floorsPathsImgs]),
+    }
+
+
+# built by builders/repositories/radar/buildRadarAssets.py, floors are only paged in when they are sliced
+radarAssets = openAssetsBundle(f'{currentPath}/npys/radarAssets.bin')
+if radarAssets is None:
+    radarAssets = decodeRadarAssets()
+floorsImgs = radarAssets['floors']
+floorsCoarseImgs = radarAssets['floorsCoarse']
+floorsPathsSqms = radarAssets['floorsPathsSqms']
+# bitset of 8 sqms per byte, read through the kernels of walkableSqms.py
+packedWalkableFloorsSqms = radarAssets['packedWalkableFloorsSqms']
 images = {
     'tools': loadFromRGBToGray(f'{currentPath}/images/buttons/radarTools.png')
 }
@@ -149,7 +118,6 @@ nonWalkablePixelsColors = [
     pixelsColorsValues['water'],
     pixelsColorsValues['vacuumOrUndiscoveredArea'],
 ]
-walkableFloorsSqms = np.ndarray(shape=(16, 2048, 2560), dtype=np.uint8)
 availableTilesFrictions = np.array(
     [70, 90, 95, 100, 110, 125, 140, 150, 160, 200, 250])
 breakpointTileMovementSpeed = {
@@ -184,9 +152,14 @@ tilesFrictionsWithBreakpoints = {
     200: np.array([0, 0, 0, 114, 124, 135, 149, 167, 190, 219, 261, 322, 419, 597, 998, 2444, 25761]),
     250: np.array([117, 126, 135, 146, 160, 175, 195, 220, 252, 295, 356, 446, 598, 884, 1591, 4557, 81351]),
 }
+# step durations by char speed and friction column, speeds above the last breakpoint take its row.
+# Frictions without breakpoints take the column of the next slower friction, as getBreakpointTileMovementSpeed
+frictionsColumns = np.minimum(np.searchsorted(availableTilesFrictions, np.arange(256)), len(availableTilesFrictions) - 1)
+breakpointsStepDurations = np.array([breakpointTileMovementSpeed[1]] + list(breakpointTileMovementSpeed.values()), dtype=np.uint16)
+charSpeeds = np.arange(max(breakpoints[-1] for breakpoints in tilesFrictionsWithBreakpoints.values()) + 1)
+tilesStepDurations = np.stack([breakpointsStepDurations[np.searchsorted(tilesFrictionsWithBreakpoints[tileFriction], charSpeeds, side='right')]
+                               for tileFriction in availableTilesFrictions], axis=1)
 
 for floor in floors:
     floorHash = hashit(floorsLevelsImgs[floor])
     floorsLevelsImgsHashes[floorHash] = floor
-    walkableFloorsSqms[floor] = np.where(
-        np.isin(floorsPathsImgs[floor], [105, 226]), 0, 1)
@@ -1,31 +1,77 @@
 from numba import njit
 import numpy as np
 from scipy.spatial import distance
-from typing import Union
+from time import time
+from typing import Dict, Union
 from src.shared.typings import Coordinate, GrayImage, GrayPixel, WaypointList
-from src.utils.core import hashit, locate
+from src.utils.assetsBundle import openAssetsBundle
+from src.utils.core import hashit, locate, locateByPyramid
 from src.utils.coordinate import getCoordinateFromPixel, getPixelFromCoordinate
-from .config import availableTilesFrictions, breakpointTileMovementSpeed, coordinates, dimensions, floorsImgs, floorsLevelsImgsHashes, floorsPathsSqms, nonWalkablePixelsColors, tilesFrictionsWithBreakpoints, walkableFloorsSqms
+from .config import availableTilesFrictions, breakpointTileMovementSpeed, dimensions, floorsCoarseImgs, floorsConfidence, floorsImgs, floorsLevelsImgsHashes, floorsPyramidFactor, floorsPathsSqms, frictionsColumns, learnedCoordinatesCapacity, learnedCoordinatesPath, nonWalkablePixelsColors, packedWalkableFloorsSqms, radarImagesCoordinates, routesGraphPath, tilesFrictionsWithBreakpoints, tilesStepDurations
 from .extractors import getRadarImage
+from .learnedCoordinates import getLearnedCoordinate, learnCoordinate, openLearnedCoordinates
+from .radarImagesCoordinates import getRadarImageCoordinate
 from .locators import getRadarToolsPosition
 from .typings import FloorLevel, TileFriction
+from .walkableSqms import isSqmWalkable
+
+
+learnedCoordinates = None
+routesGraph = None
+
+
+def getLearnedCoordinates() -> np.ndarray:
+    global learnedCoordinates
+    if learnedCoordinates is None:
+        learnedCoordinates = openLearnedCoordinates(
+            learnedCoordinatesPath, learnedCoordinatesCapacity)
+    return learnedCoordinates
+
+
+def getRoutesGraph() -> Union[Dict[str, np.ndarray], None]:
+    global routesGraph
+    if routesGraph is None:
+        routesGraph = openAssetsBundle(routesGraphPath)
+    return routesGraph
 
 
 # TODO: add unit tests
 # TODO: add perf
-# TODO: get by cached images coordinates hashes
 def getCoordinate(screenshot: GrayImage, previousCoordinate: Coordinate = None) -> Coordinate | None:
     radarToolsPosition = getRadarToolsPosition(screenshot)
     if radarToolsPosition is None:
         return None
     radarImage = getRadarImage(screenshot, radarToolsPosition)
     radarHashedImg = hashit(radarImage)
-    hashedCoordinate = coordinates.get(radarHashedImg, None)
+    hashedCoordinate = getHashedCoordinate(radarHashedImg)
     if hashedCoordinate is not None:
         return hashedCoordinate
     floorLevel = getFloorLevel(screenshot)
     if floorLevel is None:
         return None
+    drawPlayerCross(radarImage)
+    if previousCoordinate is not None:
+        coordinate = locateAroundCoordinate(
+            radarImage, (previousCoordinate[0], previousCoordinate[1], floorLevel), 5)
+        if coordinate is not None:
+            # only matches confirmed around the previous coordinate are learned,
+            # a wrong full floor match would otherwise be persisted
+            learnCoordinate(getLearnedCoordinates(),
+                            radarHashedImg, coordinate, int(time()))
+            return coordinate
+    return locateOnFloor(radarImage, floorLevel)
+
+
+def getHashedCoordinate(radarHash: int) -> Union[Coordinate, None]:
+    hashedCoordinate = getRadarImageCoordinate(
+        radarImagesCoordinates, radarHash)
+    if hashedCoordinate is not None:
+        return hashedCoordinate
+    return getLearnedCoordinate(getLearnedCoordinates(), radarHash, int(time()))
+
+
+# the player cross is not drawn on the floors images
+def drawPlayerCross(radarImage: GrayImage):
     radarImage[52, 53] = 128
     radarImage[52, 54] = 128
     radarImage[53, 53] = 128
@@ -46,29 +92,36 @@ def getCoordinate(screenshot: GrayImage, previousCoordinate: Coordinate = None)
     radarImage[56, 54] = 128
     radarImage[57, 53] = 128
     radarImage[57, 54] = 128
-    if previousCoordinate is not None:
-        (previousCoordinateXPixel, previousCoordinateYPixel) = getPixelFromCoordinate(
-            previousCoordinate)
-        paddingSize = 5
-        yStart = previousCoordinateYPixel - \
-            (dimensions['halfHeight'] + paddingSize)
-        yEnd = previousCoordinateYPixel + \
-            (dimensions['halfHeight'] + 1 + paddingSize)
-        xStart = previousCoordinateXPixel - \
-            (dimensions['halfWidth'] + paddingSize)
-        xEnd = previousCoordinateXPixel + \
-            (dimensions['halfWidth'] + paddingSize)
-        areaImgToCompare = floorsImgs[floorLevel][yStart:yEnd, xStart:xEnd]
-        areaFoundImg = locate(areaImgToCompare, radarImage, confidence=0.9)
-        if areaFoundImg:
-            currentCoordinateXPixel = previousCoordinateXPixel - \
-                paddingSize + areaFoundImg[0]
-            currentCoordinateYPixel = previousCoordinateYPixel - \
-                paddingSize + areaFoundImg[1]
-            (currentCoordinateX, currentCoordinateY) = getCoordinateFromPixel(
-                (currentCoordinateXPixel, currentCoordinateYPixel))
-            return (currentCoordinateX, currentCoordinateY, floorLevel)
-    imgCoordinate = locate(floorsImgs[floorLevel], radarImage, confidence=0.75)
+
+
+# TODO: add unit tests
+# searches only paddingSize sqms around the coordinate
+def locateAroundCoordinate(radarImage: GrayImage, coordinate: Coordinate, paddingSize: int, confidence: float = 0.9) -> Union[Coordinate, None]:
+    (coordinateXPixel, coordinateYPixel) = getPixelFromCoordinate(coordinate)
+    yStart = coordinateYPixel - (dimensions['halfHeight'] + paddingSize)
+    yEnd = coordinateYPixel + (dimensions['halfHeight'] + 1 + paddingSize)
+    xStart = coordinateXPixel - (dimensions['halfWidth'] + paddingSize)
+    xEnd = coordinateXPixel + (dimensions['halfWidth'] + paddingSize)
+    if yStart < 0 or xStart < 0:
+        return None
+    areaImgToCompare = floorsImgs[coordinate[2]][yStart:yEnd, xStart:xEnd]
+    if len(areaImgToCompare) < len(radarImage) or len(areaImgToCompare[0]) < len(radarImage[0]):
+        return None
+    areaFoundImg = locate(areaImgToCompare, radarImage, confidence=confidence)
+    if areaFoundImg is None:
+        return None
+    (currentCoordinateX, currentCoordinateY) = getCoordinateFromPixel(
+        (coordinateXPixel - paddingSize + areaFoundImg[0], coordinateYPixel - paddingSize + areaFoundImg[1]))
+    return (currentCoordinateX, currentCoordinateY, coordinate[2])
+
+
+# TODO: add unit tests
+def locateOnFloor(radarImage: GrayImage, floorLevel: FloorLevel) -> Union[Coordinate, None]:
+    imgCoordinate = locateByPyramid(floorsImgs[floorLevel], floorsCoarseImgs[floorLevel],
+                                    radarImage, floorsPyramidFactor, confidence=floorsConfidence[floorLevel])
+    if imgCoordinate is None:
+        imgCoordinate = locate(
+            floorsImgs[floorLevel], radarImage, confidence=0.75)
     if imgCoordinate is None:
         return None
     xImgCoordinate = imgCoordinate[0] + dimensions['halfWidth']
@@ -138,6 +191,21 @@ def getTileFrictionByCoordinate(coordinate: Coordinate) -> TileFriction:
     return tileFriction
 
 
+# same as getBreakpointTileMovementSpeed for every friction, read from the table built by the config
+def getTilesStepDurations(charSpeed: int, tilesFrictions: np.ndarray) -> np.ndarray:
+    return tilesStepDurations[min(max(charSpeed, 0), len(tilesStepDurations) - 1), frictionsColumns[tilesFrictions]]
+
+
+# coordinates are an (N, 3) array
+def getPathStepDurations(charSpeed: int, coordinates: np.ndarray) -> np.ndarray:
+    return getTilesStepDurations(charSpeed, getTilesFrictionsByCoordinates(coordinates))
+
+
+# coordinates are an (N, 3) array, shifted to pixels as getPixelFromCoordinate does
+def getTilesFrictionsByCoordinates(coordinates: np.ndarray) -> np.ndarray:
+    return floorsPathsSqms[coordinates[:, 2], coordinates[:, 1] - 30976, coordinates[:, 0] - 31744]
+
+
 # TODO: add unit tests
 # TODO: add perf
 def isCloseToCoordinate(currentCoordinate: Coordinate, possibleCloseCoordinate: Coordinate, distanceTolerance: int = 10) -> bool:
@@ -154,10 +222,9 @@ def isCloseToCoordinate(currentCoordinate: Coordinate, possibleCloseCoordinate:
 # TODO: add unit tests
 # TODO: add perf
 # TODO: 2 coordinates was tested. Is very hard too test all coordinates(16 floors * 2560 mapWidth * 2048 mapHeight = 83.886.080 pixels)
-# NumbaWarning: Cannot cache compiled function "isCoordinateWalkable" as it uses dynamic globals (such as ctypes pointers and large global arrays)
 def isCoordinateWalkable(coordinate: Coordinate) -> bool:
     (xOfPixel, yOfPixel) = getPixelFromCoordinate(coordinate)
-    return (walkableFloorsSqms[coordinate[2], yOfPixel, xOfPixel]) == 1
+    return isSqmWalkable(packedWalkableFloorsSqms, xOfPixel, yOfPixel, coordinate[2])
 
 
 # TODO: add unit tests
@@ -0,0 +1,286 @@
+from numba import njit
+import numpy as np
+from time import perf_counter, time
+from typing import Set, Union
+from src.shared.typings import BBox, Coordinate, CoordinateList
+from src.utils.coordinate import getCoordinateFromPixel, getPixelFromCoordinate
+from .routes import unreachableDistance
+
+
+# D* Lite searches from the goal to the player, so creatures moving around only repair the
+# distances they change and the player moving only shifts the keys of the queue by km
+
+
+@njit(cache=True, fastmath=True)
+def isKeyLess(key1: int, key2: int, otherKey1: int, otherKey2: int) -> bool:
+    return key1 < otherKey1 or (key1 == otherKey1 and key2 < otherKey2)
+
+
+@njit(cache=True, fastmath=True)
+def siftDown(heapKeys: np.ndarray, heapNodes: np.ndarray, index: int, heapSize: int):
+    while True:
+        smallest = index
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < heapSize and isKeyLess(heapKeys[child, 0], heapKeys[child, 1], heapKeys[smallest, 0], heapKeys[smallest, 1]):
+                smallest = child
+        if smallest == index:
+            return
+        for column in range(2):
+            (heapKeys[index, column], heapKeys[smallest, column]) = (heapKeys[smallest, column], heapKeys[index, column])
+        (heapNodes[index], heapNodes[smallest]) = (heapNodes[smallest], heapNodes[index])
+        index = smallest
+
+
+@njit(cache=True, fastmath=True)
+def isHeapEntryValid(heapKeys: np.ndarray, heapNodes: np.ndarray, index: int, nodesKeys: np.ndarray, isNodeQueued: np.ndarray) -> bool:
+    node = heapNodes[index]
+    return isNodeQueued[node] and nodesKeys[node, 0] == heapKeys[index, 0] and nodesKeys[node, 1] == heapKeys[index, 1]
+
+
+# nodes are never removed from the heap, their entries are left behind and skipped when stale.
+# The heap holds twice the nodes, when it is full the stale entries are dropped
+@njit(cache=True, fastmath=True)
+def pushNode(heapKeys: np.ndarray, heapNodes: np.ndarray, heapSize: np.ndarray, nodesKeys: np.ndarray, isNodeQueued: np.ndarray, node: int, key1: int, key2: int):
+    if heapSize[0] == len(heapNodes):
+        size = 0
+        for index in range(heapSize[0]):
+            if isHeapEntryValid(heapKeys, heapNodes, index, nodesKeys, isNodeQueued):
+                heapKeys[size] = heapKeys[index]
+                heapNodes[size] = heapNodes[index]
+                size += 1
+        for index in range(size // 2 - 1, -1, -1):
+            siftDown(heapKeys, heapNodes, index, size)
+        heapSize[0] = size
+    nodesKeys[node, 0] = key1
+    nodesKeys[node, 1] = key2
+    isNodeQueued[node] = True
+    index = heapSize[0]
+    heapSize[0] += 1
+    while index > 0:
+        parent = (index - 1) >> 1
+        if not isKeyLess(key1, key2, heapKeys[parent, 0], heapKeys[parent, 1]):
+            break
+        heapKeys[index] = heapKeys[parent]
+        heapNodes[index] = heapNodes[parent]
+        index = parent
+    heapKeys[index, 0] = key1
+    heapKeys[index, 1] = key2
+    heapNodes[index] = node
+
+
+@njit(cache=True, fastmath=True)
+def popStaleEntries(heapKeys: np.ndarray, heapNodes: np.ndarray, heapSize: np.ndarray, nodesKeys: np.ndarray, isNodeQueued: np.ndarray):
+    while heapSize[0] > 0 and not isHeapEntryValid(heapKeys, heapNodes, 0, nodesKeys, isNodeQueued):
+        popEntry(heapKeys, heapNodes, heapSize)
+
+
+@njit(cache=True, fastmath=True)
+def popEntry(heapKeys: np.ndarray, heapNodes: np.ndarray, heapSize: np.ndarray):
+    heapSize[0] -= 1
+    heapKeys[0] = heapKeys[heapSize[0]]
+    heapNodes[0] = heapNodes[heapSize[0]]
+    siftDown(heapKeys, heapNodes, 0, heapSize[0])
+
+
+@njit(cache=True, fastmath=True)
+def getHeuristic(node: int, otherNode: int, width: int, minCost: int) -> int:
+    return (abs(node % width - otherNode % width) + abs(node // width - otherNode // width)) * minCost
+
+
+@njit(cache=True, fastmath=True)
+def updateNode(costs: np.ndarray, g: np.ndarray, rhs: np.ndarray, nodesKeys: np.ndarray, isNodeQueued: np.ndarray, heapKeys: np.ndarray, heapNodes: np.ndarray, heapSize: np.ndarray, width: int, height: int, node: int, startNode: int, goalNode: int, km: int, minCost: int):
+    if node != goalNode:
+        nodeRhs = unreachableDistance
+        if costs[node] > 0:
+            x = node % width
+            y = node // width
+            for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+                if x + xOffset < 0 or x + xOffset >= width or y + yOffset < 0 or y + yOffset >= height:
+                    continue
+                neighbour = node + yOffset * width + xOffset
+                if costs[neighbour] > 0 and g[neighbour] < unreachableDistance:
+                    nodeRhs = min(nodeRhs, g[neighbour] + costs[neighbour])
+        rhs[node] = nodeRhs
+    if g[node] == rhs[node]:
+        isNodeQueued[node] = False
+        return
+    distance = min(g[node], rhs[node])
+    pushNode(heapKeys, heapNodes, heapSize, nodesKeys, isNodeQueued, node,
+             distance + getHeuristic(startNode, node, width, minCost) + km, distance)
+
+
+# returns how many nodes were expanded
+@njit(cache=True, fastmath=True)
+def computeShortestPath(costs: np.ndarray, g: np.ndarray, rhs: np.ndarray, nodesKeys: np.ndarray, isNodeQueued: np.ndarray, heapKeys: np.ndarray, heapNodes: np.ndarray, heapSize: np.ndarray, width: int, height: int, startNode: int, goalNode: int, km: int, minCost: int) -> int:
+    expandedNodes = 0
+    while True:
+        popStaleEntries(heapKeys, heapNodes, heapSize, nodesKeys, isNodeQueued)
+        if heapSize[0] == 0:
+            break
+        startDistance = min(g[startNode], rhs[startNode])
+        startKey1 = startDistance + km if startDistance < unreachableDistance else unreachableDistance
+        if not isKeyLess(heapKeys[0, 0], heapKeys[0, 1], startKey1, startDistance) and rhs[startNode] <= g[startNode]:
+            break
+        node = heapNodes[0]
+        (key1, key2) = (heapKeys[0, 0], heapKeys[0, 1])
+        popEntry(heapKeys, heapNodes, heapSize)
+        isNodeQueued[node] = False
+        expandedNodes += 1
+        distance = min(g[node], rhs[node])
+        newKey1 = distance + getHeuristic(startNode, node, width, minCost) + km
+        if isKeyLess(key1, key2, newKey1, distance):
+            pushNode(heapKeys, heapNodes, heapSize, nodesKeys, isNodeQueued, node, newKey1, distance)
+            continue
+        if g[node] > rhs[node]:
+            g[node] = rhs[node]
+        else:
+            g[node] = unreachableDistance
+            updateNode(costs, g, rhs, nodesKeys, isNodeQueued, heapKeys, heapNodes,
+                       heapSize, width, height, node, startNode, goalNode, km, minCost)
+        x = node % width
+        y = node // width
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            if x + xOffset < 0 or x + xOffset >= width or y + yOffset < 0 or y + yOffset >= height:
+                continue
+            updateNode(costs, g, rhs, nodesKeys, isNodeQueued, heapKeys, heapNodes, heapSize,
+                       width, height, node + yOffset * width + xOffset, startNode, goalNode, km, minCost)
+    return expandedNodes
+
+
+# a changed sqm changes the edges from and to its neighbours
+@njit(cache=True, fastmath=True)
+def updateChangedNodes(costs: np.ndarray, g: np.ndarray, rhs: np.ndarray, nodesKeys: np.ndarray, isNodeQueued: np.ndarray, heapKeys: np.ndarray, heapNodes: np.ndarray, heapSize: np.ndarray, width: int, height: int, changedNodes: np.ndarray, startNode: int, goalNode: int, km: int, minCost: int):
+    for node in changedNodes:
+        updateNode(costs, g, rhs, nodesKeys, isNodeQueued, heapKeys, heapNodes,
+                   heapSize, width, height, node, startNode, goalNode, km, minCost)
+        x = node % width
+        y = node // width
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            if x + xOffset < 0 or x + xOffset >= width or y + yOffset < 0 or y + yOffset >= height:
+                continue
+            updateNode(costs, g, rhs, nodesKeys, isNodeQueued, heapKeys, heapNodes, heapSize,
+                       width, height, node + yOffset * width + xOffset, startNode, goalNode, km, minCost)
+
+
+# nodes from the first step to the goal, every step goes to the neighbour closest to the goal
+@njit(cache=True, fastmath=True)
+def getNodesPath(costs: np.ndarray, g: np.ndarray, rhs: np.ndarray, width: int, height: int, startNode: int, goalNode: int) -> np.ndarray:
+    path = np.zeros(256, dtype=np.int64)
+    pathLength = 0
+    node = startNode
+    # the search stops once the player sqm is overconsistent, only its rhs is up to date
+    if rhs[node] >= unreachableDistance:
+        return path[:0]
+    while node != goalNode and pathLength < len(costs):
+        x = node % width
+        y = node // width
+        nextNode = -1
+        nextDistance = unreachableDistance
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            if x + xOffset < 0 or x + xOffset >= width or y + yOffset < 0 or y + yOffset >= height:
+                continue
+            neighbour = node + yOffset * width + xOffset
+            if costs[neighbour] > 0 and g[neighbour] < unreachableDistance and g[neighbour] + costs[neighbour] < nextDistance:
+                nextNode = neighbour
+                nextDistance = g[neighbour] + costs[neighbour]
+        if nextNode == -1:
+            return path[:0]
+        if pathLength == len(path):
+            grownPath = np.zeros(len(path) * 2, dtype=np.int64)
+            grownPath[:pathLength] = path
+            path = grownPath
+        path[pathLength] = nextNode
+        pathLength += 1
+        node = nextNode
+    return path[:pathLength].copy()
+
+
+class DStarLitePlanner:
+    # distances to the goal without creatures, as flow fields keep them, spare the first search
+    def __init__(self, goalCoordinate: Coordinate, region: BBox, costs: np.ndarray, minCost: int, distances: Union[np.ndarray, None] = None):
+        self.goalCoordinate = goalCoordinate
+        self.region = region
+        self.minCost = minCost
+        (self.width, self.height) = (region[2], region[3])
+        self.baseCosts = costs.astype(np.int64).ravel()
+        self.costs = self.baseCosts.copy()
+        nodesCount = len(self.costs)
+        self.goalNode = self.getNode(goalCoordinate)
+        self.startNode = self.goalNode
+        self.lastStartNode = self.goalNode
+        self.km = 0
+        self.nodesKeys = np.zeros((nodesCount, 2), dtype=np.int64)
+        self.isNodeQueued = np.zeros(nodesCount, dtype=np.bool_)
+        self.heapKeys = np.zeros((nodesCount * 2 + 16, 2), dtype=np.int64)
+        self.heapNodes = np.zeros(nodesCount * 2 + 16, dtype=np.int64)
+        self.heapSize = np.zeros(1, dtype=np.int64)
+        if distances is None:
+            self.g = np.full(nodesCount, unreachableDistance, dtype=np.int64)
+            self.rhs = self.g.copy()
+            self.rhs[self.goalNode] = 0
+            pushNode(self.heapKeys, self.heapNodes, self.heapSize, self.nodesKeys, self.isNodeQueued, self.goalNode, 0, 0)
+        else:
+            self.g = np.where(distances.ravel() == np.iinfo(distances.dtype).max, unreachableDistance, distances.ravel()).astype(np.int64)
+            self.rhs = self.g.copy()
+        self.nonWalkableCoordinates: Set[Coordinate] = set()
+        self.createdAt = time()
+        self.replansCount = 0
+        self.expandedNodesCount = 0
+        self.repairsDuration = 0
+
+    def getNode(self, coordinate: Coordinate) -> int:
+        (x, y) = getPixelFromCoordinate(coordinate)
+        return int((y - self.region[1]) * self.width + x - self.region[0])
+
+    def isInside(self, coordinate: Coordinate) -> bool:
+        (x, y) = getPixelFromCoordinate(coordinate)
+        return coordinate[2] == self.goalCoordinate[2] and self.region[0] <= x < self.region[0] + self.width and self.region[1] <= y < self.region[1] + self.height
+
+    # the creatures are compared with the previous ones, only the sqms they left or entered are repaired.
+    # Returns the sqms blocked since the last update
+    def updateNonWalkableCoordinates(self, coordinate: Coordinate, nonWalkableCoordinates: CoordinateList) -> Set[Coordinate]:
+        startNode = self.getNode(coordinate)
+        nonWalkableCoordinates = set(tuple(nonWalkableCoordinate) for nonWalkableCoordinate in nonWalkableCoordinates
+                                     if tuple(nonWalkableCoordinate) != tuple(coordinate) and self.isInside(nonWalkableCoordinate))
+        blockedCoordinates = nonWalkableCoordinates - self.nonWalkableCoordinates
+        releasedCoordinates = self.nonWalkableCoordinates - nonWalkableCoordinates
+        self.nonWalkableCoordinates = nonWalkableCoordinates
+        changedNodes = np.array([self.getNode(changedCoordinate) for changedCoordinate in blockedCoordinates | releasedCoordinates], dtype=np.int64)
+        for blockedCoordinate in blockedCoordinates:
+            self.costs[self.getNode(blockedCoordinate)] = 0
+        for releasedCoordinate in releasedCoordinates:
+            node = self.getNode(releasedCoordinate)
+            self.costs[node] = self.baseCosts[node]
+        # keys queued from the previous sqm stay lower bounds when km grows by the distance walked
+        self.km += int(getHeuristic(self.lastStartNode, startNode, self.width, self.minCost))
+        self.lastStartNode = startNode
+        self.startNode = startNode
+        if len(changedNodes) > 0:
+            updateChangedNodes(self.costs, self.g, self.rhs, self.nodesKeys, self.isNodeQueued, self.heapKeys, self.heapNodes, self.heapSize,
+                               self.width, self.height, changedNodes, self.startNode, self.goalNode, self.km, self.minCost)
+        self.computeShortestPath()
+        return blockedCoordinates
+
+    def computeShortestPath(self):
+        startTime = perf_counter()
+        expandedNodesCount = computeShortestPath(self.costs, self.g, self.rhs, self.nodesKeys, self.isNodeQueued, self.heapKeys, self.heapNodes,
+                                                 self.heapSize, self.width, self.height, self.startNode, self.goalNode, self.km, self.minCost)
+        if expandedNodesCount > 0:
+            self.replansCount += 1
+            self.expandedNodesCount += expandedNodesCount
+            self.repairsDuration += perf_counter() - startTime
+
+    def getWalkpoints(self, coordinate: Coordinate) -> CoordinateList:
+        if self.getNode(coordinate) != self.startNode:
+            self.updateNonWalkableCoordinates(coordinate, list(self.nonWalkableCoordinates))
+        nodes = getNodesPath(self.costs, self.g, self.rhs, self.width, self.height, self.startNode, self.goalNode)
+        return [list(getCoordinateFromPixel((int(node % self.width) + self.region[0], int(node // self.width) + self.region[1]))) + [coordinate[2]] for node in nodes]
+
+    # the repair cost is the mean of nodes expanded by the searches that expanded any
+    def getMetrics(self) -> dict:
+        elapsedTime = max(time() - self.createdAt, 1e-9)
+        return {
+            'replansPerSecond': self.replansCount / elapsedTime,
+            'meanRepairCost': self.expandedNodesCount / self.replansCount if self.replansCount > 0 else 0,
+            'meanRepairDuration': self.repairsDuration / self.replansCount if self.replansCount > 0 else 0,
+        }
@@ -1,5 +1,7 @@
+from typing import Union
 from src.repositories.radar import config
 from src.shared.typings import BBox, GrayImage
+from .locators import getRadarToolsPosition
 
 
 # TODO: add unit tests
@@ -9,4 +11,18 @@ def getRadarImage(screenshot: GrayImage, radarToolsPosition: BBox) -> GrayImage:
     x1 = x0 + config.dimensions['width']
     y0 = radarToolsPosition[1] - 50
     y1 = y0 + config.dimensions['height']
-    return screenshot[y0:y1, x0:x1]
\ No newline at end of file
+    return screenshot[y0:y1, x0:x1]
+
+
+# TODO: add unit tests
+# covers the radar image, the floor level column and the tools anchor
+def getRadarRegion(screenshot: GrayImage) -> Union[BBox, None]:
+    radarToolsPosition = getRadarToolsPosition(screenshot)
+    if radarToolsPosition is None:
+        return None
+    x0 = radarToolsPosition[0] - config.dimensions['width'] - 11
+    y0 = radarToolsPosition[1] - 50
+    x1 = radarToolsPosition[0] + radarToolsPosition[2] + 10
+    y1 = max(y0 + config.dimensions['height'], radarToolsPosition[1] + 60,
+             radarToolsPosition[1] + radarToolsPosition[3])
+    return (x0, y0, x1 - x0, y1 - y0)
\ No newline at end of file
@@ -0,0 +1,175 @@
+import heapq
+from numba import njit
+import numpy as np
+from typing import List, Tuple, Union
+from src.shared.typings import BBox, Coordinate, CoordinateList
+from src.utils.coordinate import getCoordinateFromPixel, getPixelFromCoordinate
+from .routes import getGridDistances, getGridPath, getSqmsCosts, unreachableDistance
+from .walkableSqms import getWalkableSqmsWindow
+
+
+# regions are padded by half of the radar, so walks around obstacles between waypoints stay inside
+regionPadding = (53, 54)
+# creatures are only avoided this many sqms around the player, farther steps follow the flow field
+repairRadius = 8
+unreachableFlowDistance = np.iinfo(np.uint32).max
+
+
+# the distance of a sqm is the cost to walk from it to the goal, a sqm costs its friction when entered
+@njit(cache=True, fastmath=True)
+def getGridDistancesToGoal(costs: np.ndarray, x: int, y: int) -> np.ndarray:
+    height, width = costs.shape
+    distances = np.full((height, width), unreachableDistance, dtype=np.int64)
+    distances[y, x] = 0
+    heap = [(np.int64(0), np.int64(y * width + x))]
+    while len(heap) > 0:
+        distance, index = heapq.heappop(heap)
+        currentY = index // width
+        currentX = index % width
+        if distance > distances[currentY, currentX]:
+            continue
+        nextDistance = distance + costs[currentY, currentX]
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            nextX = currentX + xOffset
+            nextY = currentY + yOffset
+            if nextX < 0 or nextX >= width or nextY < 0 or nextY >= height or costs[nextY, nextX] == 0:
+                continue
+            if nextDistance < distances[nextY, nextX]:
+                distances[nextY, nextX] = nextDistance
+                heapq.heappush(heap, (nextDistance, np.int64(nextY * width + nextX)))
+    return distances
+
+
+# sqms from the first step to the goal, every step goes to the neighbour closest to the goal
+@njit(cache=True, fastmath=True)
+def followFlowField(distances: np.ndarray, x: int, y: int) -> np.ndarray:
+    height, width = distances.shape
+    # regions can span the whole floor, the path grows instead of being allocated for every sqm
+    path = np.zeros((256, 2), dtype=np.int32)
+    pathLength = 0
+    while distances[y, x] > 0 and distances[y, x] != unreachableFlowDistance:
+        nextX = x
+        nextY = y
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            neighbourX = x + xOffset
+            neighbourY = y + yOffset
+            if neighbourX >= 0 and neighbourX < width and neighbourY >= 0 and neighbourY < height and distances[neighbourY, neighbourX] < distances[nextY, nextX]:
+                nextX = neighbourX
+                nextY = neighbourY
+        if nextX == x and nextY == y:
+            break
+        x = nextX
+        y = nextY
+        if pathLength == len(path):
+            grownPath = np.zeros((len(path) * 2, 2), dtype=np.int32)
+            grownPath[:pathLength] = path
+            path = grownPath
+        path[pathLength, 0] = x
+        path[pathLength, 1] = y
+        pathLength += 1
+    return path[:pathLength].copy()
+
+
+def getFlowFieldRegion(goalCoordinate: Coordinate, previousCoordinate: Union[Coordinate, None], floorHeight: int, floorWidth: int) -> BBox:
+    (goalX, goalY) = getPixelFromCoordinate(goalCoordinate)
+    (previousX, previousY) = (goalX, goalY)
+    if previousCoordinate is not None and previousCoordinate[2] == goalCoordinate[2]:
+        (previousX, previousY) = getPixelFromCoordinate(previousCoordinate)
+    x = max(min(goalX, previousX) - regionPadding[0], 0)
+    y = max(min(goalY, previousY) - regionPadding[1], 0)
+    width = min(max(goalX, previousX) + regionPadding[0] + 1, floorWidth) - x
+    height = min(max(goalY, previousY) + regionPadding[1] + 1, floorHeight) - y
+    return (int(x), int(y), int(width), int(height))
+
+
+# a goal walked from several waypoints gets one flow field over the regions of all of them
+def getFlowFieldsGoalsRegions(goals: CoordinateList, previousCoordinates: CoordinateList, floorHeight: int, floorWidth: int) -> Tuple[CoordinateList, List[BBox]]:
+    goalsRegions = {}
+    for goal, previousCoordinate in zip(goals, previousCoordinates):
+        (x, y, width, height) = getFlowFieldRegion(goal, previousCoordinate, floorHeight, floorWidth)
+        if goal in goalsRegions:
+            (goalX, goalY, goalWidth, goalHeight) = goalsRegions[goal]
+            (width, height) = (max(x + width, goalX + goalWidth), max(y + height, goalY + goalHeight))
+            (x, y) = (min(x, goalX), min(y, goalY))
+            (width, height) = (width - x, height - y)
+        goalsRegions[goal] = (x, y, width, height)
+    return (list(goalsRegions.keys()), list(goalsRegions.values()))
+
+
+def getRegionCosts(packedWalkableFloorsSqms: np.ndarray, floorsPathsSqms: np.ndarray, region: BBox, z: int, minCost: int) -> np.ndarray:
+    (x, y, width, height) = region
+    walkableSqms = getWalkableSqmsWindow(packedWalkableFloorsSqms, x, y, z, width, height)
+    return getSqmsCosts(walkableSqms, floorsPathsSqms[z, y:y + height, x:x + width], minCost)
+
+
+# TODO: add perf
+def buildFlowField(packedWalkableFloorsSqms: np.ndarray, floorsPathsSqms: np.ndarray, goalCoordinate: Coordinate, region: BBox, minCost: int) -> np.ndarray:
+    costs = getRegionCosts(packedWalkableFloorsSqms, floorsPathsSqms, region, goalCoordinate[2], minCost)
+    (goalX, goalY) = getPixelFromCoordinate(goalCoordinate)
+    distances = getGridDistancesToGoal(costs, goalX - region[0], goalY - region[1])
+    return np.minimum(distances, unreachableFlowDistance).astype(np.uint32)
+
+
+def isInsideFlowField(region: BBox, goalCoordinate: Coordinate, coordinate: Coordinate) -> bool:
+    (x, y) = getPixelFromCoordinate(coordinate)
+    return coordinate[2] == goalCoordinate[2] and region[0] <= x < region[0] + region[2] and region[1] <= y < region[1] + region[3]
+
+
+# TODO: add perf
+# the sqms around the player are searched again without the creatures, the search ends at the goal or at
+# the window border sqm whose walked cost plus its flow distance is the lowest, the flow field is followed from there
+def getFlowFieldWalkpoints(distances: np.ndarray, region: BBox, packedWalkableFloorsSqms: np.ndarray, floorsPathsSqms: np.ndarray, coordinate: Coordinate, nonWalkableCoordinates: CoordinateList, minCost: int) -> CoordinateList:
+    (x, y) = getPixelFromCoordinate(coordinate)
+    (x, y) = (x - region[0], y - region[1])
+    if distances[y, x] == 0:
+        return []
+    windowX = max(x - repairRadius, 0)
+    windowY = max(y - repairRadius, 0)
+    window = (windowX, windowY, min(x + repairRadius + 1, region[2]) - windowX, min(y + repairRadius + 1, region[3]) - windowY)
+    windowCosts = getRegionCosts(packedWalkableFloorsSqms, floorsPathsSqms,
+                                 (region[0] + window[0], region[1] + window[1], window[2], window[3]), coordinate[2], minCost)
+    for nonWalkableCoordinate in nonWalkableCoordinates:
+        if nonWalkableCoordinate[2] != coordinate[2]:
+            continue
+        (nonWalkableX, nonWalkableY) = getPixelFromCoordinate(nonWalkableCoordinate)
+        nonWalkableX -= region[0] + windowX
+        nonWalkableY -= region[1] + windowY
+        if 0 <= nonWalkableX < window[2] and 0 <= nonWalkableY < window[3]:
+            windowCosts[nonWalkableY, nonWalkableX] = 0
+    windowDistances = getGridDistances(windowCosts, x - windowX, y - windowY)
+    windowFlowDistances = distances[windowY:windowY + window[3], windowX:windowX + window[2]].astype(np.int64)
+    isExit = np.zeros(windowCosts.shape, dtype=np.bool_)
+    isExit[[0, -1], :] = True
+    isExit[:, [0, -1]] = True
+    isExit |= windowFlowDistances == 0
+    isExit[y - windowY, x - windowX] = False
+    isReachable = isExit & (windowDistances < unreachableDistance) & (windowFlowDistances < unreachableFlowDistance) & (windowCosts > 0)
+    if not np.any(isReachable):
+        return []
+    totalDistances = np.where(isReachable, windowDistances + windowFlowDistances, unreachableDistance)
+    (exitY, exitX) = np.unravel_index(np.argmin(totalDistances), totalDistances.shape)
+    path = [(int(pathX) + windowX, int(pathY) + windowY) for (pathX, pathY) in getGridPath(windowCosts, windowDistances, exitX, exitY)]
+    path.extend((int(pathX), int(pathY)) for (pathX, pathY) in followFlowField(distances, exitX + windowX, exitY + windowY))
+    return [list(getCoordinateFromPixel((pathX + region[0], pathY + region[1]))) + [coordinate[2]] for (pathX, pathY) in path]
+
+
+def getFlowFieldsLayout(regions: np.ndarray) -> dict:
+    layout = {
+        'goals': ((len(regions), 3), 'int32'),
+        'regions': ((len(regions), 4), 'int32'),
+    }
+    for index, region in enumerate(regions):
+        layout[f'distances{index}'] = ((int(region[3]), int(region[2])), 'uint32')
+    return layout
+
+
+# returns the goal and the previous coordinate of every walk waypoint, scripts are walked in loop
+def getWalkWaypointsGoals(waypoints: list) -> Tuple[CoordinateList, CoordinateList]:
+    goals = []
+    previousCoordinates = []
+    for index, waypoint in enumerate(waypoints):
+        if waypoint['type'] != 'walk':
+            continue
+        goals.append(tuple(waypoint['coordinate']))
+        previousCoordinates.append(tuple(waypoints[index - 1]['coordinate']))
+    return goals, previousCoordinates
@@ -0,0 +1,62 @@
+import numpy as np
+import os
+from typing import Union
+from src.shared.typings import Coordinate
+from .typings import LearnedCoordinate
+
+
+# open addressing over a fixed amount of slots, so the file never grows
+probesCount = 16
+
+
+# TODO: add perf
+def openLearnedCoordinates(path: str, capacity: int) -> np.ndarray:
+    if os.path.exists(path):
+        learnedCoordinates = np.load(path, mmap_mode='r+')
+        if learnedCoordinates.dtype == LearnedCoordinate and len(learnedCoordinates) > 0:
+            return learnedCoordinates
+        del learnedCoordinates
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return np.lib.format.open_memmap(path, mode='w+', dtype=LearnedCoordinate, shape=(capacity,))
+
+
+def getProbedSlots(learnedCoordinates: np.ndarray, radarHash: int) -> np.ndarray:
+    return (radarHash + np.arange(probesCount, dtype=np.uint64)) % np.uint64(len(learnedCoordinates))
+
+
+# TODO: add perf
+def getLearnedCoordinate(learnedCoordinates: np.ndarray, radarHash: int, usedAt: int) -> Union[Coordinate, None]:
+    radarHash = np.uint64(radarHash)
+    slots = getProbedSlots(learnedCoordinates, radarHash)
+    probedCoordinates = learnedCoordinates[slots]
+    foundIndexes = np.flatnonzero((probedCoordinates['usedAt'] > 0) & (
+        probedCoordinates['hash'] == radarHash))
+    if len(foundIndexes) == 0:
+        return None
+    slot = slots[foundIndexes[0]]
+    learnedCoordinates['usedAt'][slot] = usedAt
+    if learnedCoordinates['isAmbiguous'][slot]:
+        return None
+    return (int(learnedCoordinates['x'][slot]), int(learnedCoordinates['y'][slot]), int(learnedCoordinates['z'][slot]))
+
+
+# when every probed slot is taken, the least recently used one is evicted
+# TODO: add perf
+def learnCoordinate(learnedCoordinates: np.ndarray, radarHash: int, coordinate: Coordinate, usedAt: int):
+    radarHash = np.uint64(radarHash)
+    slots = getProbedSlots(learnedCoordinates, radarHash)
+    probedCoordinates = learnedCoordinates[slots]
+    isUsed = probedCoordinates['usedAt'] > 0
+    foundIndexes = np.flatnonzero(isUsed & (probedCoordinates['hash'] == radarHash))
+    if len(foundIndexes) > 0:
+        slot = slots[foundIndexes[0]]
+        learnedCoordinate = learnedCoordinates[slot]
+        # a radar image seen at another coordinate is ambiguous, it is kept marked so it is never served nor learned again
+        if learnedCoordinate['isAmbiguous'] or (int(learnedCoordinate['x']), int(learnedCoordinate['y']), int(learnedCoordinate['z'])) != tuple(coordinate):
+            learnedCoordinates['isAmbiguous'][slot] = True
+            learnedCoordinates['usedAt'][slot] = usedAt
+            return
+    else:
+        emptyIndexes = np.flatnonzero(~isUsed)
+        slot = slots[emptyIndexes[0]] if len(emptyIndexes) > 0 else slots[np.argmin(probedCoordinates['usedAt'])]
+    learnedCoordinates[slot] = (radarHash, coordinate[0], coordinate[1], coordinate[2], usedAt, False)
@@ -0,0 +1,22 @@
+import numpy as np
+import os
+from typing import Union
+from src.shared.typings import Coordinate
+from .typings import CoordinateHash
+
+
+# the file is only memory mapped, lookups touch a few pages of the binary search
+def openRadarImagesCoordinates(path: str) -> np.ndarray:
+    if not os.path.exists(path):
+        return np.array([], dtype=CoordinateHash)
+    return np.load(path, mmap_mode='r')
+
+
+# TODO: add perf
+def getRadarImageCoordinate(radarImagesCoordinates: np.ndarray, radarHash: int) -> Union[Coordinate, None]:
+    radarHash = np.uint64(radarHash)
+    hashes = radarImagesCoordinates['hash']
+    index = np.searchsorted(hashes, radarHash)
+    if index == len(hashes) or hashes[index] != radarHash:
+        return None
+    return (int(radarImagesCoordinates['x'][index]), int(radarImagesCoordinates['y'][index]), int(radarImagesCoordinates['z'][index]))
@@ -0,0 +1,341 @@
+import heapq
+from numba import njit
+import numpy as np
+from typing import Dict, List, Tuple, Union
+from src.shared.typings import Coordinate, CoordinateList
+from src.utils.coordinate import getCoordinateFromPixel, getPixelFromCoordinate
+from .walkableSqms import getWalkableSqmsWindow, isSqmWalkable
+
+
+# floors are split in square clusters, routes are searched over the portals between them
+# and only refined sqm by sqm inside the clusters they cross
+clusterSize = 32
+intraClusterEdgeKind = 0
+stepEdgeKind = 1
+# walking into a stair, hole or ladder is charged as the slowest ground
+floorChangeCost = 250
+unreachableDistance = 2 ** 62
+
+
+# costs are the frictions of the walkable sqms, 0 blocks the sqm
+def getSqmsCosts(walkableSqms: np.ndarray, frictions: np.ndarray, minCost: int) -> np.ndarray:
+    return np.where(walkableSqms == 1, np.maximum(frictions, minCost), 0).astype(np.uint16)
+
+
+# floor changes are drawn as access points on the floor images and are not walkable
+def getFloorChangeSqms(floorImg: np.ndarray, walkableSqms: np.ndarray, accessPointColor: int) -> np.ndarray:
+    return (floorImg == accessPointColor) & (walkableSqms == 0)
+
+
+# PERF: ~20us for a 32x32 cluster
+@njit(cache=True, fastmath=True)
+def getGridDistances(costs: np.ndarray, x: int, y: int) -> np.ndarray:
+    height, width = costs.shape
+    distances = np.full((height, width), unreachableDistance, dtype=np.int64)
+    distances[y, x] = 0
+    heap = [(np.int64(0), np.int64(y * width + x))]
+    while len(heap) > 0:
+        distance, index = heapq.heappop(heap)
+        currentY = index // width
+        currentX = index % width
+        if distance > distances[currentY, currentX]:
+            continue
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            nextX = currentX + xOffset
+            nextY = currentY + yOffset
+            if nextX < 0 or nextX >= width or nextY < 0 or nextY >= height or costs[nextY, nextX] == 0:
+                continue
+            nextDistance = distance + costs[nextY, nextX]
+            if nextDistance < distances[nextY, nextX]:
+                distances[nextY, nextX] = nextDistance
+                heapq.heappush(heap, (nextDistance, np.int64(nextY * width + nextX)))
+    return distances
+
+
+# sqms from the first step to (x, y), the origin of the distances is not included
+@njit(cache=True, fastmath=True)
+def getGridPath(costs: np.ndarray, distances: np.ndarray, x: int, y: int) -> np.ndarray:
+    height, width = costs.shape
+    if distances[y, x] >= unreachableDistance:
+        return np.zeros((0, 2), dtype=np.int32)
+    path = np.zeros((height * width, 2), dtype=np.int32)
+    pathLength = 0
+    while distances[y, x] > 0:
+        path[pathLength, 0] = x
+        path[pathLength, 1] = y
+        pathLength += 1
+        for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1)):
+            previousX = x + xOffset
+            previousY = y + yOffset
+            if previousX >= 0 and previousX < width and previousY >= 0 and previousY < height and distances[previousY, previousX] + costs[y, x] == distances[y, x]:
+                x = previousX
+                y = previousY
+                break
+    return path[:pathLength][::-1].copy()
+
+
+# A* from a set of start nodes to a set of goal nodes, floorLevel -1 allows every floor
+@njit(cache=True, fastmath=True)
+def searchRoutesGraph(edgesOffsets: np.ndarray, edgesTargets: np.ndarray, edgesCosts: np.ndarray, nodesX: np.ndarray, nodesY: np.ndarray, nodesZ: np.ndarray, startNodes: np.ndarray, startNodesCosts: np.ndarray, goalNodes: np.ndarray, goalNodesCosts: np.ndarray, goalX: int, goalY: int, minCost: int, floorLevel: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    nodesCount = len(nodesX)
+    distances = np.full(nodesCount, unreachableDistance, dtype=np.int64)
+    previousNodes = np.full(nodesCount, -1, dtype=np.int64)
+    previousEdges = np.full(nodesCount, -1, dtype=np.int64)
+    heap = [(np.int64(0), np.int64(0))]
+    heap.pop()
+    for index in range(len(startNodes)):
+        node = startNodes[index]
+        if startNodesCosts[index] < distances[node]:
+            distances[node] = startNodesCosts[index]
+            heuristic = (abs(np.int64(nodesX[node]) - goalX) + abs(np.int64(nodesY[node]) - goalY)) * minCost
+            heapq.heappush(heap, (np.int64(startNodesCosts[index] + heuristic), np.int64(node)))
+    bestCost = unreachableDistance
+    bestNode = -1
+    while len(heap) > 0:
+        priority, node = heapq.heappop(heap)
+        if priority >= bestCost:
+            break
+        heuristic = (abs(np.int64(nodesX[node]) - goalX) + abs(np.int64(nodesY[node]) - goalY)) * minCost
+        if priority > distances[node] + heuristic:
+            continue
+        for index in range(len(goalNodes)):
+            if goalNodes[index] == node and distances[node] + goalNodesCosts[index] < bestCost:
+                bestCost = distances[node] + goalNodesCosts[index]
+                bestNode = node
+        for edge in range(edgesOffsets[node], edgesOffsets[node + 1]):
+            target = edgesTargets[edge]
+            if floorLevel >= 0 and nodesZ[target] != floorLevel:
+                continue
+            nextDistance = distances[node] + edgesCosts[edge]
+            if nextDistance < distances[target]:
+                distances[target] = nextDistance
+                previousNodes[target] = node
+                previousEdges[target] = edge
+                targetHeuristic = (abs(np.int64(nodesX[target]) - goalX) + abs(np.int64(nodesY[target]) - goalY)) * minCost
+                heapq.heappush(heap, (np.int64(nextDistance + targetHeuristic), np.int64(target)))
+    if bestNode == -1:
+        return unreachableDistance, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    routeLength = 1
+    node = bestNode
+    while previousNodes[node] != -1:
+        node = previousNodes[node]
+        routeLength += 1
+    routeNodes = np.zeros(routeLength, dtype=np.int64)
+    routeEdges = np.zeros(routeLength - 1, dtype=np.int64)
+    node = bestNode
+    for index in range(routeLength - 1, -1, -1):
+        routeNodes[index] = node
+        if index > 0:
+            routeEdges[index - 1] = previousEdges[node]
+            node = previousNodes[node]
+    return bestCost, routeNodes, routeEdges
+
+
+def getClusterIndex(x: int, y: int, z: int, floorHeight: int, floorWidth: int) -> int:
+    clustersRowsCount = -(-floorHeight // clusterSize)
+    clustersColumnsCount = -(-floorWidth // clusterSize)
+    return (z * clustersRowsCount + y // clusterSize) * clustersColumnsCount + x // clusterSize
+
+
+# one or two portals for every run of sqms walkable on both sides of a cluster border
+def getBorderPortals(costs: np.ndarray, otherCosts: np.ndarray) -> List[int]:
+    portals = []
+    isOpen = (costs > 0) & (otherCosts > 0)
+    start = None
+    for index in range(len(isOpen) + 1):
+        if index < len(isOpen) and isOpen[index]:
+            if start is None:
+                start = index
+            continue
+        if start is None:
+            continue
+        if index - start < 6:
+            portals.append((start + index - 1) // 2)
+        else:
+            portals.append(start)
+            portals.append(index - 1)
+        start = None
+    return portals
+
+
+# the sqm the player walks from, and lands on, when using a floor change
+def getFloorChangeNeighbour(costs: np.ndarray, x: int, y: int) -> Union[Tuple[int, int], None]:
+    for (xOffset, yOffset) in ((0, -1), (-1, 0), (1, 0), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)):
+        neighbourX = x + xOffset
+        neighbourY = y + yOffset
+        if 0 <= neighbourY < costs.shape[0] and 0 <= neighbourX < costs.shape[1] and costs[neighbourY, neighbourX] > 0:
+            return (int(neighbourX), int(neighbourY))
+    return None
+
+
+# nodes and edges are returned in pixels, floor changes are paired with the floor changes
+# of the floors above and below that are at most 1 sqm aside
+def buildFloorRoutesGraph(floorLevel: int, floorsCosts: Dict[int, np.ndarray], floorsChangesSqms: Dict[int, np.ndarray]) -> Tuple[set, list]:
+    costs = floorsCosts[floorLevel]
+    (floorHeight, floorWidth) = costs.shape
+    walkableNodes = set()
+    floorChangesNodes = set()
+    edges = []
+    for clusterY in range(0, floorHeight, clusterSize):
+        for clusterX in range(0, floorWidth, clusterSize):
+            if clusterX + clusterSize < floorWidth:
+                x = clusterX + clusterSize - 1
+                for portal in getBorderPortals(costs[clusterY:clusterY + clusterSize, x], costs[clusterY:clusterY + clusterSize, x + 1]):
+                    y = clusterY + portal
+                    walkableNodes.update([(x, y, floorLevel), (x + 1, y, floorLevel)])
+                    edges.append(((x, y, floorLevel), (x + 1, y, floorLevel), int(costs[y, x + 1]), stepEdgeKind))
+                    edges.append(((x + 1, y, floorLevel), (x, y, floorLevel), int(costs[y, x]), stepEdgeKind))
+            if clusterY + clusterSize < floorHeight:
+                y = clusterY + clusterSize - 1
+                for portal in getBorderPortals(costs[y, clusterX:clusterX + clusterSize], costs[y + 1, clusterX:clusterX + clusterSize]):
+                    x = clusterX + portal
+                    walkableNodes.update([(x, y, floorLevel), (x, y + 1, floorLevel)])
+                    edges.append(((x, y, floorLevel), (x, y + 1, floorLevel), int(costs[y + 1, x]), stepEdgeKind))
+                    edges.append(((x, y + 1, floorLevel), (x, y, floorLevel), int(costs[y, x]), stepEdgeKind))
+    for (y, x) in zip(*np.nonzero(floorsChangesSqms[floorLevel])):
+        entry = getFloorChangeNeighbour(costs, x, y)
+        if entry is None:
+            continue
+        for otherFloorLevel in (floorLevel - 1, floorLevel + 1):
+            if otherFloorLevel not in floorsChangesSqms:
+                continue
+            otherFloorChangesSqms = floorsChangesSqms[otherFloorLevel][max(y - 1, 0):y + 2, max(x - 1, 0):x + 2]
+            for (otherY, otherX) in zip(*np.nonzero(otherFloorChangesSqms)):
+                landing = getFloorChangeNeighbour(
+                    floorsCosts[otherFloorLevel], max(x - 1, 0) + otherX, max(y - 1, 0) + otherY)
+                if landing is None:
+                    continue
+                floorChange = (int(x), int(y), floorLevel)
+                walkableNodes.add((entry[0], entry[1], floorLevel))
+                floorChangesNodes.add(floorChange)
+                edges.append(((entry[0], entry[1], floorLevel), floorChange, floorChangeCost, stepEdgeKind))
+                edges.append((floorChange, (landing[0], landing[1], otherFloorLevel), 0, stepEdgeKind))
+    clustersNodes = {}
+    for node in walkableNodes:
+        clustersNodes.setdefault((node[0] // clusterSize, node[1] // clusterSize), []).append(node)
+    for (clusterColumn, clusterRow), clusterNodes in clustersNodes.items():
+        clusterX = clusterColumn * clusterSize
+        clusterY = clusterRow * clusterSize
+        clusterCosts = costs[clusterY:clusterY + clusterSize, clusterX:clusterX + clusterSize]
+        for node in clusterNodes:
+            distances = getGridDistances(clusterCosts, node[0] - clusterX, node[1] - clusterY)
+            for otherNode in clusterNodes:
+                distance = distances[otherNode[1] - clusterY, otherNode[0] - clusterX]
+                if otherNode != node and distance < unreachableDistance:
+                    edges.append((node, otherNode, int(distance), intraClusterEdgeKind))
+    return walkableNodes | floorChangesNodes, edges
+
+
+# nodes are sorted by cluster so the nodes of a cluster are a contiguous slice
+def mergeRoutesGraphs(floorsRoutesGraphs: List[Tuple[set, list]], floorHeight: int, floorWidth: int, floorsCount: int, minCost: int) -> Dict[str, np.ndarray]:
+    nodes = set()
+    for (floorNodes, _) in floorsRoutesGraphs:
+        nodes.update(floorNodes)
+    nodes = sorted(nodes, key=lambda node: (getClusterIndex(node[0], node[1], node[2], floorHeight, floorWidth), node[1], node[0]))
+    nodesIndexes = {node: index for index, node in enumerate(nodes)}
+    nodesClusters = np.array([getClusterIndex(node[0], node[1], node[2], floorHeight, floorWidth) for node in nodes], dtype=np.int64)
+    clustersCount = getClusterIndex(0, 0, floorsCount, floorHeight, floorWidth)
+    edges = sorted({(nodesIndexes[source], nodesIndexes[target], cost, kind) for (_, floorEdges) in floorsRoutesGraphs
+                    for (source, target, cost, kind) in floorEdges if source in nodesIndexes and target in nodesIndexes})
+    edgesSources = np.array([edge[0] for edge in edges], dtype=np.int64)
+    return {
+        'nodesX': np.array([node[0] for node in nodes], dtype=np.uint16),
+        'nodesY': np.array([node[1] for node in nodes], dtype=np.uint16),
+        'nodesZ': np.array([node[2] for node in nodes], dtype=np.uint8),
+        'clustersNodesOffsets': np.searchsorted(nodesClusters, np.arange(clustersCount + 1)).astype(np.int64),
+        'edgesOffsets': np.searchsorted(edgesSources, np.arange(len(nodes) + 1)).astype(np.int64),
+        'edgesTargets': np.array([edge[1] for edge in edges], dtype=np.int64),
+        'edgesCosts': np.array([edge[2] for edge in edges], dtype=np.int64),
+        'edgesKinds': np.array([edge[3] for edge in edges], dtype=np.uint8),
+        'minCost': np.array([minCost], dtype=np.int64),
+    }
+
+
+def getClusterCosts(packedWalkableFloorsSqms: np.ndarray, floorsPathsSqms: np.ndarray, x: int, y: int, z: int, minCost: int) -> Tuple[np.ndarray, int, int]:
+    clusterX = x // clusterSize * clusterSize
+    clusterY = y // clusterSize * clusterSize
+    walkableSqms = getWalkableSqmsWindow(packedWalkableFloorsSqms, clusterX, clusterY, z, clusterSize, clusterSize)
+    frictions = np.zeros((clusterSize, clusterSize), dtype=np.uint8)
+    clusterFrictions = floorsPathsSqms[z, clusterY:clusterY + clusterSize, clusterX:clusterX + clusterSize]
+    frictions[:clusterFrictions.shape[0], :clusterFrictions.shape[1]] = clusterFrictions
+    return getSqmsCosts(walkableSqms, frictions, minCost), clusterX, clusterY
+
+
+def getClusterNodes(routesGraph: Dict[str, np.ndarray], x: int, y: int, z: int, floorHeight: int, floorWidth: int) -> np.ndarray:
+    clusterIndex = getClusterIndex(x, y, z, floorHeight, floorWidth)
+    return np.arange(routesGraph['clustersNodesOffsets'][clusterIndex], routesGraph['clustersNodesOffsets'][clusterIndex + 1])
+
+
+# TODO: add perf
+# coordinates from the first step to the goal, as generateFloorWalkpoints. A floor change
+# is walked into and is followed by the sqm the player lands on
+def getRoute(routesGraph: Dict[str, np.ndarray], packedWalkableFloorsSqms: np.ndarray, floorsPathsSqms: np.ndarray, coordinate: Coordinate, goalCoordinate: Coordinate, allowFloorChanges: bool = True) -> CoordinateList:
+    (x, y) = getPixelFromCoordinate(coordinate)
+    (goalX, goalY) = getPixelFromCoordinate(goalCoordinate)
+    (z, goalZ) = (coordinate[2], goalCoordinate[2])
+    if not allowFloorChanges and z != goalZ:
+        return []
+    if not isSqmWalkable(packedWalkableFloorsSqms, goalX, goalY, goalZ):
+        return []
+    floorHeight = packedWalkableFloorsSqms.shape[1]
+    floorWidth = packedWalkableFloorsSqms.shape[2] * 8
+    if not (0 <= x < floorWidth and 0 <= y < floorHeight):
+        return []
+    minCost = int(routesGraph['minCost'][0])
+    (startCosts, startClusterX, startClusterY) = getClusterCosts(
+        packedWalkableFloorsSqms, floorsPathsSqms, x, y, z, minCost)
+    startDistances = getGridDistances(startCosts, x - startClusterX, y - startClusterY)
+    (goalCosts, goalClusterX, goalClusterY) = getClusterCosts(
+        packedWalkableFloorsSqms, floorsPathsSqms, goalX, goalY, goalZ, minCost)
+    bestCost = unreachableDistance
+    isInsideStartCluster = z == goalZ and startClusterX == goalClusterX and startClusterY == goalClusterY
+    if isInsideStartCluster:
+        bestCost = startDistances[goalY - startClusterY, goalX - startClusterX]
+    nodesX = routesGraph['nodesX']
+    nodesY = routesGraph['nodesY']
+    startNodes = getClusterNodes(routesGraph, x, y, z, floorHeight, floorWidth)
+    startNodesCosts = startDistances[nodesY[startNodes].astype(np.int64) - startClusterY, nodesX[startNodes].astype(np.int64) - startClusterX]
+    startNodes = startNodes[startNodesCosts < unreachableDistance]
+    startNodesCosts = startNodesCosts[startNodesCosts < unreachableDistance]
+    # costs are paid when entering a sqm, so the reversed distances swap the node cost by the goal cost
+    goalDistances = getGridDistances(goalCosts, goalX - goalClusterX, goalY - goalClusterY)
+    goalNodes = getClusterNodes(routesGraph, goalX, goalY, goalZ, floorHeight, floorWidth)
+    goalNodesYs = nodesY[goalNodes].astype(np.int64) - goalClusterY
+    goalNodesXs = nodesX[goalNodes].astype(np.int64) - goalClusterX
+    goalNodesCosts = goalDistances[goalNodesYs, goalNodesXs]
+    isReachableGoalNode = goalNodesCosts < unreachableDistance
+    goalNodesCosts = goalNodesCosts[isReachableGoalNode] - goalCosts[goalNodesYs, goalNodesXs][isReachableGoalNode] + \
+        goalCosts[goalY - goalClusterY, goalX - goalClusterX]
+    goalNodes = goalNodes[isReachableGoalNode]
+    routeNodes = None
+    if len(startNodes) > 0 and len(goalNodes) > 0:
+        (routeCost, routeNodes, routeEdges) = searchRoutesGraph(routesGraph['edgesOffsets'], routesGraph['edgesTargets'], routesGraph['edgesCosts'], nodesX, nodesY, routesGraph['nodesZ'], startNodes,
+                                                                startNodesCosts, goalNodes, goalNodesCosts, goalX, goalY, minCost, -1 if allowFloorChanges else z)
+        if routeCost >= bestCost:
+            routeNodes = None
+    if routeNodes is None:
+        if bestCost >= unreachableDistance:
+            return []
+        return getClusterRoute(startCosts, startDistances, startClusterX, startClusterY, goalX, goalY, z)
+    firstNode = routeNodes[0]
+    route = getClusterRoute(startCosts, startDistances, startClusterX, startClusterY, int(nodesX[firstNode]), int(nodesY[firstNode]), z)
+    for (index, edge) in enumerate(routeEdges):
+        (node, nextNode) = (routeNodes[index], routeNodes[index + 1])
+        if routesGraph['edgesKinds'][edge] == stepEdgeKind:
+            route.append(getCoordinateFromPixel((int(nodesX[nextNode]), int(nodesY[nextNode]))) + (int(routesGraph['nodesZ'][nextNode]),))
+            continue
+        route.extend(getNodesRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, node, int(nodesX[nextNode]), int(nodesY[nextNode]), minCost))
+    route.extend(getNodesRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, routeNodes[-1], goalX, goalY, minCost))
+    return route
+
+
+def getNodesRoute(routesGraph: Dict[str, np.ndarray], packedWalkableFloorsSqms: np.ndarray, floorsPathsSqms: np.ndarray, node: int, goalX: int, goalY: int, minCost: int) -> CoordinateList:
+    (x, y, z) = (int(routesGraph['nodesX'][node]), int(routesGraph['nodesY'][node]), int(routesGraph['nodesZ'][node]))
+    (costs, clusterX, clusterY) = getClusterCosts(packedWalkableFloorsSqms, floorsPathsSqms, x, y, z, minCost)
+    distances = getGridDistances(costs, x - clusterX, y - clusterY)
+    return getClusterRoute(costs, distances, clusterX, clusterY, goalX, goalY, z)
+
+
+def getClusterRoute(costs: np.ndarray, distances: np.ndarray, clusterX: int, clusterY: int, goalX: int, goalY: int, z: int) -> CoordinateList:
+    return [getCoordinateFromPixel((int(pathX) + clusterX, int(pathY) + clusterY)) + (z,)
+            for (pathX, pathY) in getGridPath(costs, distances, goalX - clusterX, goalY - clusterY)]
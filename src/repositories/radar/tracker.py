@@ -0,0 +1,130 @@
+from time import time
+from typing import List, Union
+from src.shared.typings import Coordinate, GrayImage
+from src.utils.core import hashit
+from .core import drawPlayerCross, getFloorLevel, getHashedCoordinate, getLearnedCoordinates, locateAroundCoordinate, locateOnFloor
+from .extractors import getRadarImage
+from .learnedCoordinates import learnCoordinate
+from .locators import getRadarToolsPosition
+
+
+class CoordinateTracker:
+    # steps of tolerance over the fastest possible walk, it absorbs ticks jitter and diagonals
+    jumpToleranceInSqms = 2
+    # a jump found only by the floor correlation is accepted once this many different radar images agree on it,
+    # a wrong match repeated by the same radar image never confirms itself
+    jumpConfirmationsCount = 3
+
+    def __init__(self):
+        self.coordinate = None
+        self.coordinateAt = None
+        self.step = None
+        self.jumpCoordinate = None
+        self.jumpAt = None
+        self.jumpRadarHashes = set()
+
+    def reset(self):
+        self.coordinate = None
+        self.coordinateAt = None
+        self.step = None
+        self.jumpCoordinate = None
+        self.jumpAt = None
+        self.jumpRadarHashes = set()
+
+    # TODO: add perf
+    # stepDuration is the fastest time in seconds the player can walk a sqm
+    def track(self, screenshot: GrayImage, stepDuration: float, walkpoint: Union[Coordinate, None] = None) -> Union[Coordinate, None]:
+        now = time()
+        radarToolsPosition = getRadarToolsPosition(screenshot)
+        if radarToolsPosition is None:
+            return None
+        radarImage = getRadarImage(screenshot, radarToolsPosition)
+        radarHash = hashit(radarImage)
+        hashedCoordinate = getHashedCoordinate(radarHash)
+        if hashedCoordinate is not None and self.isReachable(hashedCoordinate, now, stepDuration):
+            return self.accept(hashedCoordinate, now)
+        # an unreachable hashed coordinate is a wrong match until the searches below agree with it
+        floorLevel = getFloorLevel(screenshot)
+        if floorLevel is None:
+            return None
+        drawPlayerCross(radarImage)
+        if self.coordinate is not None and self.coordinate[2] == floorLevel:
+            # a single small correlation around each prediction before widening the search
+            for predictedCoordinate in self.getPredictedCoordinates(now, stepDuration, walkpoint):
+                coordinate = locateAroundCoordinate(
+                    radarImage, predictedCoordinate, 1)
+                if coordinate is not None:
+                    learnCoordinate(getLearnedCoordinates(),
+                                    radarHash, coordinate, int(now))
+                    return self.accept(coordinate, now)
+            coordinate = locateAroundCoordinate(
+                radarImage, self.coordinate, 5)
+            if coordinate is not None:
+                learnCoordinate(getLearnedCoordinates(),
+                                radarHash, coordinate, int(now))
+                return self.accept(coordinate, now)
+        coordinate = locateOnFloor(radarImage, floorLevel)
+        if coordinate is None:
+            return None
+        if self.isReachable(coordinate, now, stepDuration):
+            return self.accept(coordinate, now)
+        # the radar hash and the floor correlation are independent, a jump both of them find is real
+        if hashedCoordinate is not None and tuple(hashedCoordinate) == tuple(coordinate):
+            return self.accept(coordinate, now)
+        return self.confirmJump(coordinate, radarHash, now, stepDuration)
+
+    def getPredictedCoordinates(self, now: float, stepDuration: float, walkpoint: Union[Coordinate, None] = None) -> List[Coordinate]:
+        predictedCoordinates = []
+        if walkpoint is not None and walkpoint[2] == self.coordinate[2] and self.getDistance(walkpoint) <= 1:
+            predictedCoordinates.append(
+                (int(walkpoint[0]), int(walkpoint[1]), int(walkpoint[2])))
+        if self.step is not None:
+            stepsCount = max(round((now - self.coordinateAt) / stepDuration), 1)
+            predictedCoordinates.append(
+                (self.coordinate[0] + self.step[0] * stepsCount, self.coordinate[1] + self.step[1] * stepsCount, self.coordinate[2]))
+        predictedCoordinates.append(self.coordinate)
+        return list(dict.fromkeys(predictedCoordinates))
+
+    def getDistance(self, coordinate: Coordinate) -> int:
+        return getSqmsDistance(self.coordinate, coordinate)
+
+    def isReachable(self, coordinate: Coordinate, now: float, stepDuration: float) -> bool:
+        if self.coordinate is None:
+            return True
+        return self.isReachableFrom(self.coordinate, self.coordinateAt, coordinate, now, stepDuration)
+
+    def isReachableFrom(self, fromCoordinate: Coordinate, fromAt: float, coordinate: Coordinate, now: float, stepDuration: float) -> bool:
+        # stairs, holes and ropes only move the player a sqm aside
+        if coordinate[2] != fromCoordinate[2]:
+            return getSqmsDistance(fromCoordinate, coordinate) <= self.jumpToleranceInSqms
+        maxSqms = (now - fromAt) / stepDuration
+        return getSqmsDistance(fromCoordinate, coordinate) <= maxSqms + self.jumpToleranceInSqms
+
+    # teleports and deaths are real jumps, candidates of consecutive frames must be reachable from each other
+    def confirmJump(self, coordinate: Coordinate, radarHash: int, now: float, stepDuration: float) -> Union[Coordinate, None]:
+        if self.jumpCoordinate is None or not self.isReachableFrom(self.jumpCoordinate, self.jumpAt, coordinate, now, stepDuration):
+            self.jumpRadarHashes = set()
+        self.jumpCoordinate = coordinate
+        self.jumpAt = now
+        self.jumpRadarHashes.add(radarHash)
+        if len(self.jumpRadarHashes) < self.jumpConfirmationsCount:
+            return None
+        return self.accept(coordinate, now)
+
+    def accept(self, coordinate: Coordinate, now: float) -> Coordinate:
+        coordinate = (int(coordinate[0]), int(coordinate[1]), int(coordinate[2]))
+        if self.coordinate is not None and self.coordinate[2] == coordinate[2] and coordinate != self.coordinate:
+            self.step = (max(min(coordinate[0] - self.coordinate[0], 1), -1),
+                         max(min(coordinate[1] - self.coordinate[1], 1), -1))
+        elif self.coordinate is None or self.coordinate[2] != coordinate[2]:
+            self.step = None
+        self.coordinate = coordinate
+        self.coordinateAt = now
+        self.jumpCoordinate = None
+        self.jumpAt = None
+        self.jumpRadarHashes = set()
+        return coordinate
+
+
+def getSqmsDistance(coordinate: Coordinate, otherCoordinate: Coordinate) -> int:
+    return max(abs(otherCoordinate[0] - coordinate[0]), abs(otherCoordinate[1] - coordinate[1]))
@@ -2,9 +2,12 @@ import numpy as np
 
 
 Coordinate = np.dtype([('x', np.uint16), ('y', np.uint16), ('z', np.uint16)])
-CoordinateHash = np.dtype([('hash', str, 16), ('coordinate', np.uint16, (3,))])
+# records of radarImagesCoordinates.npy, sorted by hash
+CoordinateHash = np.dtype([('hash', np.uint64), ('x', np.uint16), ('y', np.uint16), ('z', np.uint16)])
 # TODO: fix
 FloorLevel = int
+# usedAt is the unix time of the last hit, 0 marks an empty slot, ambiguous hashes were seen at several coordinates
+LearnedCoordinate = np.dtype([('hash', np.uint64), ('x', np.uint16), ('y', np.uint16), ('z', np.uint16), ('usedAt', np.uint32), ('isAmbiguous', np.bool_)])
 TileFriction = 70 | 90 | 95 | 100 | 110 | 125 | 140 | 150 | 160 | 200 | 250
 WaypointDistance = np.dtype([('index', np.uint16), ('distance', np.float32)])
 Waypoint = np.dtype([
@@ -0,0 +1,34 @@
+from numba import njit
+import numpy as np
+
+
+# every row keeps 8 sqms per byte, the most significant bit being the leftmost sqm
+def packWalkableFloorsSqms(walkableFloorsSqms: np.ndarray) -> np.ndarray:
+    return np.packbits(walkableFloorsSqms.astype(np.bool_), axis=-1)
+
+
+# the packed floors are always passed as arguments, numba cannot cache kernels reading large global arrays
+@njit(cache=True, fastmath=True)
+def isSqmWalkable(packedWalkableFloorsSqms: np.ndarray, x: int, y: int, floorLevel: int) -> bool:
+    if y < 0 or y >= packedWalkableFloorsSqms.shape[1] or x < 0 or x >= packedWalkableFloorsSqms.shape[2] * 8:
+        return False
+    return (packedWalkableFloorsSqms[floorLevel, y, x >> 3] >> (7 - (x & 7))) & 1 == 1
+
+
+# sqms outside of the map are not walkable
+@njit(cache=True, fastmath=True)
+def getWalkableSqmsWindow(packedWalkableFloorsSqms: np.ndarray, x: int, y: int, floorLevel: int, width: int, height: int) -> np.ndarray:
+    window = np.zeros((height, width), dtype=np.uint8)
+    floorHeight = packedWalkableFloorsSqms.shape[1]
+    floorWidth = packedWalkableFloorsSqms.shape[2] * 8
+    for windowY in range(height):
+        sqmY = y + windowY
+        if sqmY < 0 or sqmY >= floorHeight:
+            continue
+        for windowX in range(width):
+            sqmX = x + windowX
+            if sqmX < 0 or sqmX >= floorWidth:
+                continue
+            window[windowY, windowX] = (
+                packedWalkableFloorsSqms[floorLevel, sqmY, sqmX >> 3] >> (7 - (sqmX & 7))) & 1
+    return window
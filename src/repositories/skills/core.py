@@ -5,72 +5,69 @@ from src.utils.core import hashit
 from src.utils.image import convertGraysToBlack
 from .config import minutesOrHoursHashes, numbersHashes
 from .locators import getSkillsIconPosition
+from .snapshot import getSkillsSnapshot
 
 
 # TODO: add unit tests
 # PERF: [0.04747469999999998, 2.9300000000009874e-05]
 def getCapacity(screenshot: GrayImage) -> Union[int, None]:
-    skillsIconPosition = getSkillsIconPosition(screenshot)
-    if skillsIconPosition is None:
+    skillsSnapshot = getSkillsSnapshot(screenshot)
+    if skillsSnapshot is None:
         return None
-    position = skillsIconPosition[0] + 6, skillsIconPosition[1] + \
-        132, skillsIconPosition[2], skillsIconPosition[3]
-    return getValuesCount(screenshot, position)
+    return int(skillsSnapshot['capacity'])
 
 
 # TODO: add unit tests
 # TODO: add perf
 def getFood(screenshot: GrayImage) -> Union[int, None]:
-    skillsIconPosition = getSkillsIconPosition(screenshot)
-    if skillsIconPosition is None:
+    skillsSnapshot = getSkillsSnapshot(screenshot)
+    if skillsSnapshot is None:
         return None
-    position = skillsIconPosition[0] + 6, skillsIconPosition[1] + \
-        160, skillsIconPosition[2], skillsIconPosition[3]
-    return getMinutesCount(screenshot, position)
+    return int(skillsSnapshot['food'])
 
 
 # TODO: add unit tests
 # PERF: [0.04967209999999955, 3.1599999999798456e-05]
 def getHp(screenshot: GrayImage) -> Union[int, None]:
-    skillsIconPosition = getSkillsIconPosition(screenshot)
-    if skillsIconPosition is None:
+    skillsSnapshot = getSkillsSnapshot(screenshot)
+    if skillsSnapshot is None:
         return None
-    position = skillsIconPosition[0] + 6, skillsIconPosition[1] + \
-        90, skillsIconPosition[2], skillsIconPosition[3]
-    return getValuesCount(screenshot, position)
+    return int(skillsSnapshot['hp'])
 
 
 # TODO: add unit tests
 # PERF: [0.05254219999999998, 2.970000000068751e-05]
 def getMana(screenshot: GrayImage) -> Union[int, None]:
-    skillsIconPosition = getSkillsIconPosition(screenshot)
-    if skillsIconPosition is None:
+    skillsSnapshot = getSkillsSnapshot(screenshot)
+    if skillsSnapshot is None:
         return None
-    position = skillsIconPosition[0] + 6, skillsIconPosition[1] + \
-        104, skillsIconPosition[2], skillsIconPosition[3]
-    return getValuesCount(screenshot, position)
+    return int(skillsSnapshot['mana'])
 
 
 # TODO: add unit tests
 # PERF: [0.04700700000000024, 3.0399999999985994e-05]
 def getSpeed(screenshot: GrayImage) -> Union[int, None]:
-    skillsIconPosition = getSkillsIconPosition(screenshot)
-    if skillsIconPosition is None:
+    skillsSnapshot = getSkillsSnapshot(screenshot)
+    if skillsSnapshot is None:
         return None
-    position = skillsIconPosition[0] + 6, skillsIconPosition[1] + \
-        146, skillsIconPosition[2], skillsIconPosition[3]
-    return getValuesCount(screenshot, position)
+    return int(skillsSnapshot['speed'])
 
 
 # TODO: add unit tests
 # PERF: [0.047493200000000346, 2.0000000000131024e-05]
 def getStamina(screenshot: GrayImage) -> Union[int, None]:
+    skillsSnapshot = getSkillsSnapshot(screenshot)
+    if skillsSnapshot is None:
+        return None
+    return int(skillsSnapshot['stamina'])
+
+
+# TODO: add unit tests
+def getSkillsRegion(screenshot: GrayImage) -> Union[BBox, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
         return None
-    position = (skillsIconPosition[0] + 6), (skillsIconPosition[1] +
-                                            174), skillsIconPosition[2], skillsIconPosition[3]
-    return getMinutesCount(screenshot, position)
+    return (skillsIconPosition[0], skillsIconPosition[1], max(skillsIconPosition[2], 6 + 144), max(skillsIconPosition[3], 174 + 8))
 
 
 # TODO: add unit tests
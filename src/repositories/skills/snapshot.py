@@ -0,0 +1,128 @@
+from numba import njit
+import numpy as np
+from typing import Union
+from src.shared.typings import GrayImage
+from src.utils.core import cacheByFrame, hashit
+from .config import images
+from .locators import getSkillsIconPosition
+from .typings import SkillsSnapshot
+
+
+# rows of the panel below the skills icon in SkillsSnapshot order, values rows are counts and the others are hours and minutes
+skillsRowsOffsets = np.array([90, 104, 132, 146, 160, 174], dtype=np.int32)
+skillsRowsAreValues = np.array([True, True, True, True, False, False], dtype=np.bool_)
+# the panel is cropped once from the first row to the end of the last one, 6 pixels right of the icon
+skillsPanelX = 6
+skillsPanelWidth = 144
+skillsRowHeight = 8
+digitsTemplates = np.array([images['digits'][digit] for digit in range(10)], dtype=np.uint8)
+
+
+# same pixels the hashed digits images get, grays become black and values rows only keep their digits color
+@njit(cache=True, fastmath=True)
+def getDigitPixel(pixel: int, isValue: bool) -> int:
+    if isValue:
+        return 192 if pixel == 126 or pixel == 192 else 0
+    return 0 if pixel >= 50 and pixel <= 100 else pixel
+
+
+# digit drawn in the 8x6 cell, -1 for an empty cell and -2 for anything else
+@njit(cache=True, fastmath=True)
+def getCellDigit(panel: GrayImage, y: int, x: int, isValue: bool, digitsTemplates: np.ndarray) -> int:
+    isEmpty = True
+    for cellY in range(8):
+        for cellX in range(6):
+            if getDigitPixel(panel[y + cellY, x + cellX], isValue) != 0:
+                isEmpty = False
+    if isEmpty:
+        return -1
+    for digit in range(10):
+        isDigit = True
+        for cellY in range(8):
+            for cellX in range(6):
+                if getDigitPixel(panel[y + cellY, x + cellX], isValue) != digitsTemplates[digit, cellY, cellX]:
+                    isDigit = False
+                    break
+            if not isDigit:
+                break
+        if isDigit:
+            return digit
+    return -2
+
+
+# number of a group of digits cells 8 columns apart, 0 when the group is not a number the hashes tables know,
+# values groups have no leading zeros and hours or minutes groups always show both digits up to 59
+@njit(cache=True, fastmath=True)
+def getGroupNumber(panel: GrayImage, y: int, x: int, digitsCount: int, isValue: bool, digitsTemplates: np.ndarray) -> int:
+    for gapIndex in range(digitsCount - 1):
+        for cellY in range(8):
+            for cellX in range(2):
+                if getDigitPixel(panel[y + cellY, x + gapIndex * 8 + 6 + cellX], isValue) != 0:
+                    return 0
+    number = 0
+    digitsFound = 0
+    for cellIndex in range(digitsCount):
+        digit = getCellDigit(panel, y, x + cellIndex * 8, isValue, digitsTemplates)
+        if digit == -2:
+            return 0
+        if digit == -1:
+            if digitsFound > 0 or not isValue:
+                return 0
+            continue
+        if digitsFound == 0 and digit == 0 and isValue and cellIndex < digitsCount - 1:
+            return 0
+        number = number * 10 + digit
+        digitsFound += 1
+    if digitsFound == 0 or (not isValue and number >= 60):
+        return 0
+    return number
+
+
+# TODO: add perf
+# decodes the rows flagged as changed, the others keep their previous values
+@njit(cache=True, fastmath=True)
+def decodeSkillsRows(panel: GrayImage, rowsOffsets: np.ndarray, rowsAreValues: np.ndarray, changedRows: np.ndarray, values: np.ndarray, digitsTemplates: np.ndarray):
+    for rowIndex in range(len(rowsOffsets)):
+        if not changedRows[rowIndex]:
+            continue
+        y = rowsOffsets[rowIndex] - rowsOffsets[0]
+        if y + 8 > panel.shape[0] or panel.shape[1] < 144:
+            values[rowIndex] = 0
+        elif rowsAreValues[rowIndex]:
+            values[rowIndex] = getGroupNumber(panel, y, 94, 3, True, digitsTemplates) * 1000 + getGroupNumber(panel, y, 122, 3, True, digitsTemplates)
+        else:
+            values[rowIndex] = getGroupNumber(panel, y, 110, 2, False, digitsTemplates) * 60 + getGroupNumber(panel, y, 130, 2, False, digitsTemplates)
+
+
+class SkillsReader:
+    def __init__(self):
+        self.rowsHashes = np.zeros(len(skillsRowsOffsets), dtype=np.uint64)
+        self.values = np.zeros(len(skillsRowsOffsets), dtype=np.int32)
+        self.hasValues = False
+
+    # TODO: add perf
+    def read(self, screenshot: GrayImage) -> Union[np.void, None]:
+        skillsIconPosition = getSkillsIconPosition(screenshot)
+        if skillsIconPosition is None:
+            return None
+        y = skillsIconPosition[1] + skillsRowsOffsets[0]
+        x = skillsIconPosition[0] + skillsPanelX
+        panel = screenshot[y:y + skillsRowsOffsets[-1] - skillsRowsOffsets[0] + skillsRowHeight, x:x + skillsPanelWidth]
+        rowsHashes = np.array([hashit(panel[rowOffset - skillsRowsOffsets[0]:rowOffset - skillsRowsOffsets[0] + skillsRowHeight])
+                               for rowOffset in skillsRowsOffsets], dtype=np.uint64)
+        # most frames only the hp or mana row changes, unchanged rows are not decoded again
+        changedRows = rowsHashes != self.rowsHashes if self.hasValues else np.ones(len(skillsRowsOffsets), dtype=np.bool_)
+        if changedRows.any():
+            decodeSkillsRows(panel, skillsRowsOffsets, skillsRowsAreValues, changedRows, self.values, digitsTemplates)
+        self.rowsHashes = rowsHashes
+        self.hasValues = True
+        return self.values.copy().view(SkillsSnapshot)[0]
+
+
+skillsReader = SkillsReader()
+
+
+# TODO: add unit tests
+@cacheByFrame
+def getSkillsSnapshot(screenshot: GrayImage) -> Union[np.void, None]:
+    return skillsReader.read(screenshot)
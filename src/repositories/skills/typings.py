@@ -0,0 +1,12 @@
+import numpy as np
+
+
+# values of every skills panel row read from a single frame
+SkillsSnapshot = np.dtype([
+    ('hp', np.int32),
+    ('mana', np.int32),
+    ('capacity', np.int32),
+    ('speed', np.int32),
+    ('food', np.int32),
+    ('stamina', np.int32),
+])
@@ -1,4 +1,5 @@
-from src.shared.typings import GrayImage
+from typing import Union
+from src.shared.typings import BBox, GrayImage
 from .locators import getStopIconPosition, getStatsPz, getStatsHur, getStatsPoison
 
 def getStats(screenshot: GrayImage):
@@ -22,4 +23,12 @@ def getStats(screenshot: GrayImage):
       'pz': statsPz,
       'hur': statsHur,
       'poison': statsPoison
-    }
\ No newline at end of file
+    }
+
+def getStatsBarRegion(screenshot: GrayImage) -> Union[BBox, None]:
+  stopIcon = getStopIconPosition(screenshot)
+
+  if stopIcon is None:
+    return None
+
+  return (stopIcon[0] - 117, stopIcon[1], 117 + stopIcon[2], max(stopIcon[3], 12))
@@ -1,5 +1,7 @@
+from typing import Union
 from src.shared.typings import BBox, GrayImage
 from .config import barSize
+from .locators import getHpIconPosition, getManaIconPosition
 
 
 # TODO: add unit tests
@@ -20,3 +22,20 @@ def getManaBar(screenshot: GrayImage, heartPos: BBox) -> GrayImage:
     x0 = heartPos[0] + 14
     x1 = x0 + barSize
     return screenshot[y0:y1, x0:x1][0]
+
+
+
+# TODO: add unit tests
+def getHpBarRegion(screenshot: GrayImage) -> Union[BBox, None]:
+    heartPos = getHpIconPosition(screenshot)
+    if heartPos is None:
+        return None
+    return (heartPos[0], heartPos[1], max(heartPos[2], 13 + barSize), max(heartPos[3], 6))
+
+
+# TODO: add unit tests
+def getManaBarRegion(screenshot: GrayImage) -> Union[BBox, None]:
+    manaPos = getManaIconPosition(screenshot)
+    if manaPos is None:
+        return None
+    return (manaPos[0], manaPos[1], max(manaPos[2], 14 + barSize), max(manaPos[3], 6))
@@ -1,11 +1,12 @@
 from typing import Union
 from src.shared.typings import BBox, GrayImage
-from src.utils.core import cacheObjectPosition, locate
+from src.utils.core import cacheByFrame, cacheObjectPosition, locate
 from .config import images
 
 
 # TODO: add unit tests
 # PERF: [0.053614899999999466, 1.699999999438262e-06]
+@cacheByFrame
 @cacheObjectPosition
 def getHpIconPosition(screenshot: GrayImage) -> Union[BBox, None]:
     return locate(screenshot, images['icons']['hp'])
@@ -13,6 +14,7 @@ def getHpIconPosition(screenshot: GrayImage) -> Union[BBox, None]:
 
 # TODO: add unit tests
 # PERF: [0.05365620000000071, 1.7000000003264404e-06]
+@cacheByFrame
 @cacheObjectPosition
 def getManaIconPosition(screenshot: GrayImage) -> Union[BBox, None]:
     return locate(screenshot, images['icons']['mana'])
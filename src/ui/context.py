@@ -2,8 +2,10 @@ from os.path import exists
 import time
 from tinydb import Query, TinyDB
 from tkinter import messagebox
+from src.gameplay.core.flowFields import loadFlowFields
 from src.gameplay.core.load import loadContextFromConfig, loadNgCfgs
 from src.repositories.chat.core import resetOldList
+from src.utils.layout import dumpLayouts, loadLayouts
 # from src.utils.core import getScreenshot
 
 
@@ -18,6 +20,11 @@ class Context:
         self.enabledProfile = self.getEnabledProfile()
         self.context = loadContextFromConfig(
             self.enabledProfile['config'], context)
+        loadLayouts(self.enabledProfile['config'].get('ng_layouts', {}))
+
+    def updateLayouts(self):
+        self.enabledProfile['config']['ng_layouts'] = dumpLayouts()
+        self.db.update(self.enabledProfile)
 
     def updateMainBackpack(self, backpack: str):
         self.context['ng_backpacks']['main'] = backpack
@@ -63,6 +70,7 @@ class Context:
                     'poison_hotkey': 'g'
                 },
                 'ignorable_creatures': [],
+                'ng_layouts': {},
                 'healing': {
                     'highPriority': {
                         'healthFood': {
@@ -158,10 +166,15 @@ class Context:
             }
         })
 
-    def loadScript(self, script):
+    def loadScript(self, script, scriptPath=None):
         self.context['ng_cave']['waypoints']['items'] = script.copy()
         self.enabledProfile['config']['ng_cave']['waypoints']['items'] = script.copy()
         self.db.update(self.enabledProfile)
+        if scriptPath is not None:
+            loadFlowFields(scriptPath, script)
+
+    def saveScript(self, scriptPath):
+        loadFlowFields(scriptPath, self.context['ng_cave']['waypoints']['items'])
 
     def loadCfg(self, cfg):
         self.context = loadNgCfgs(cfg, self.context)
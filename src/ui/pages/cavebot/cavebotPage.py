@@ -405,6 +405,7 @@ class CavebotPage(customtkinter.CTkToplevel):
         if file:
             with open(file, 'w') as f:
                 json.dump(self.context.context['ng_cave']['waypoints']['items'], f, indent=4)
+            self.context.saveScript(file)
             messagebox.showinfo('Sucesso', 'Script salvo com sucesso!')
 
     def loadScript(self):
@@ -417,7 +418,7 @@ class CavebotPage(customtkinter.CTkToplevel):
             with open(file, 'r') as f:
                 self.table.delete()
                 script = json.load(f)
-                self.context.loadScript(script)
+                self.context.loadScript(script, file)
                 for waypoint in script:
                     self.table.insert('', 'end', values=(
                         waypoint['label'], waypoint['type'], waypoint['coordinate'], waypoint['options']))
@@ -0,0 +1,46 @@
+import json
+import numpy as np
+import os
+from typing import Dict, Tuple, Union
+
+
+# arrays start on page boundaries so every floor is mapped without touching its neighbours
+pageSize = 4096
+headerLengthSize = 8
+
+
+def getAlignedOffset(offset: int) -> int:
+    return (offset + pageSize - 1) // pageSize * pageSize
+
+
+# the index is a json header at the start of the file, followed by the raw arrays
+def createAssetsBundle(path: str, layout: Dict[str, Tuple[Tuple[int, ...], str]]) -> Dict[str, np.memmap]:
+    index = {}
+    offset = 0
+    for name, (shape, dtype) in layout.items():
+        index[name] = {'offset': offset, 'shape': list(shape), 'dtype': np.dtype(dtype).str}
+        offset = getAlignedOffset(offset + int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    header = json.dumps(index).encode('utf-8')
+    dataOffset = getAlignedOffset(headerLengthSize + len(header))
+    # bundles are built into folders that are not versioned, e.g. the npys of a fresh checkout
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(len(header).to_bytes(headerLengthSize, 'little'))
+        file.write(header)
+        file.truncate(dataOffset + offset)
+    return mapAssetsBundle(path, index, dataOffset, 'r+')
+
+
+# nothing is read here, pages are loaded by the os when an array is sliced
+def openAssetsBundle(path: str) -> Union[Dict[str, np.memmap], None]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as file:
+        headerLength = int.from_bytes(file.read(headerLengthSize), 'little')
+        index = json.loads(file.read(headerLength).decode('utf-8'))
+    return mapAssetsBundle(path, index, getAlignedOffset(headerLengthSize + headerLength), 'r')
+
+
+def mapAssetsBundle(path: str, index: Dict[str, dict], dataOffset: int, mode: str) -> Dict[str, np.memmap]:
+    return {name: np.memmap(path, dtype=np.dtype(entry['dtype']), mode=mode, offset=dataOffset + entry['offset'], shape=tuple(entry['shape']))
+            for name, entry in index.items()}
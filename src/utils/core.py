@@ -1,41 +1,94 @@
 import cv2
-import dxcam
 from farmhash import FarmHash64
+from functools import wraps
 import numpy as np
-from typing import Callable, Union
+from typing import Callable, Dict, Union
 from src.shared.typings import BBox, GrayImage
+from .frameSources import DxcamFrameSource
+from .layout import currentLayoutMatches, getAnchor, getMatchingLayoutKey, getNewLayoutKey, registerAnchor, setAnchor, startLayout, useLayout
+from .regionsOfInterest import requestFullFrame
 
 
-camera = dxcam.create(device_idx=0, output_idx=1, output_color='BGRA')
+frameSource = None
 latestScreenshot = None
+# values derived from the current frame, the frame itself is kept so its id cannot be reused
+frameCache = {}
+frameCacheStats: Dict[str, Dict[str, int]] = {}
 
 
 # TODO: add unit tests
 def cacheObjectPosition(func: Callable) -> Callable:
-    lastX = None
-    lastY = None
-    lastW = None
-    lastH = None
-    lastImgHash = None
+    anchorName = f'{func.__module__}.{func.__name__}'
 
+    @wraps(func)
     def inner(screenshot):
-        nonlocal lastX, lastY, lastW, lastH, lastImgHash
-        if lastX != None and lastY != None and lastW != None and lastH != None:
-            if hashit(screenshot[lastY:lastY + lastH, lastX:lastX + lastW]) == lastImgHash:
-                return (lastX, lastY, lastW, lastH)
+        anchor = getAnchor(anchorName)
+        if anchor is not None:
+            (x, y, w, h) = anchor['position']
+            if hashit(screenshot[y:y + h, x:x + w]) == anchor['hash']:
+                return anchor['position']
+            # the anchor moved, regions of interest captured around the old position are stale
+            requestFullFrame()
+        # most anchors moving means another client layout
+        isAnotherLayout = anchor is not None and not currentLayoutMatches(screenshot)
+        # missing or moved anchors are verified in the stored layouts of the resolution before being searched
+        if anchor is None or isAnotherLayout:
+            layoutKey = getMatchingLayoutKey(screenshot, anchorName if anchor is None else None)
+            if layoutKey is not None:
+                useLayout(layoutKey)
+                isAnotherLayout = False
+                anchor = getAnchor(anchorName)
+                if anchor is not None:
+                    (x, y, w, h) = anchor['position']
+                    if hashit(screenshot[y:y + h, x:x + w]) == anchor['hash']:
+                        return anchor['position']
         res = func(screenshot)
         if res is None:
             return None
-        lastX = res[0]
-        lastY = res[1]
-        lastW = res[2]
-        lastH = res[3]
-        lastImgHash = hashit(
-            screenshot[lastY:lastY + lastH, lastX:lastX + lastW])
+        # blank or loading frames locate no anchor, so another client layout only starts once one of its anchors is found
+        if isAnotherLayout:
+            startLayout(getNewLayoutKey(screenshot))
+        setAnchor(anchorName, res, hashit(
+            screenshot[res[1]:res[1] + res[3], res[0]:res[0] + res[2]]))
         return res
+    registerAnchor(anchorName, inner)
     return inner
 
 
+# buffers of the frame sources are reused between frames, so the cache must be
+# dropped by clearFrameCache whenever a new frame is installed
+def cacheByFrame(func: Callable) -> Callable:
+    name = f'{func.__module__}.{func.__name__}'
+    stats = frameCacheStats.setdefault(name, {'hits': 0, 'misses': 0})
+
+    @wraps(func)
+    def inner(screenshot, *args):
+        key = (name, id(screenshot), args)
+        cachedValue = frameCache.get(key, None)
+        if cachedValue is not None and cachedValue[0] is screenshot:
+            stats['hits'] += 1
+            return cachedValue[1]
+        stats['misses'] += 1
+        res = func(screenshot, *args)
+        frameCache[key] = (screenshot, res)
+        return res
+    return inner
+
+
+def clearFrameCache():
+    frameCache.clear()
+
+
+def getFrameCacheStats() -> Dict[str, Dict[str, int]]:
+    return {name: stats.copy() for name, stats in frameCacheStats.items()}
+
+
+def resetFrameCacheStats():
+    for stats in frameCacheStats.values():
+        stats['hits'] = 0
+        stats['misses'] = 0
+
+
 # TODO: add unit tests
 def hashit(arr: np.ndarray) -> int:
     return FarmHash64(np.ascontiguousarray(arr))
@@ -50,6 +103,38 @@ def locate(compareImage: GrayImage, img: GrayImage, confidence: float = 0.85, ty
     return res[3][0], res[3][1], len(img[0]), len(img)
 
 
+def downsample(img: GrayImage, factor: int) -> GrayImage:
+    return cv2.resize(img, (len(img[0]) // factor, len(img) // factor), interpolation=cv2.INTER_AREA)
+
+
+# TODO: add perf
+# the coarse match only proposes candidates, every candidate is confirmed at full resolution
+def locateByPyramid(compareImage: GrayImage, coarseCompareImage: GrayImage, img: GrayImage, factor: int, confidence: float = 0.85, candidatesCount: int = 5) -> Union[BBox, None]:
+    coarseImg = downsample(img, factor)
+    coarseMatch = cv2.matchTemplate(coarseCompareImage, coarseImg, cv2.TM_CCOEFF_NORMED)
+    padding = factor * 2
+    bestPosition = None
+    bestConfidence = confidence
+    for _ in range(candidatesCount):
+        (_, coarseConfidence, _, (coarseX, coarseY)) = cv2.minMaxLoc(coarseMatch)
+        if coarseConfidence <= 0:
+            break
+        # suppress the neighbourhood so the next candidate is a different region
+        coarseMatch[max(coarseY - len(coarseImg) // 2, 0):coarseY + len(coarseImg) // 2 + 1,
+                    max(coarseX - len(coarseImg[0]) // 2, 0):coarseX + len(coarseImg[0]) // 2 + 1] = -1
+        x0 = max(coarseX * factor - padding, 0)
+        y0 = max(coarseY * factor - padding, 0)
+        areaImage = compareImage[y0:coarseY * factor + len(img) + padding, x0:coarseX * factor + len(img[0]) + padding]
+        if len(areaImage) < len(img) or len(areaImage[0]) < len(img[0]):
+            continue
+        (_, matchConfidence, _, (x, y)) = cv2.minMaxLoc(
+            cv2.matchTemplate(areaImage, img, cv2.TM_CCOEFF_NORMED))
+        if matchConfidence > bestConfidence:
+            bestConfidence = matchConfidence
+            bestPosition = (x0 + x, y0 + y, len(img[0]), len(img))
+    return bestPosition
+
+
 # TODO: add unit tests
 def locateMultiple(compareImg: GrayImage, img: GrayImage, confidence: float = 0.85) -> Union[BBox, None]:
     match = cv2.matchTemplate(compareImg, img, cv2.TM_CCOEFF_NORMED)
@@ -60,11 +145,25 @@ def locateMultiple(compareImg: GrayImage, img: GrayImage, confidence: float = 0.
     return resultList
 
 
-# TODO: add unit tests
+def getFrameSource():
+    global frameSource
+    if frameSource is None:
+        frameSource = DxcamFrameSource()
+    return frameSource
+
+
+def setFrameSource(source):
+    global frameSource, latestScreenshot
+    frameSource = source
+    latestScreenshot = None
+
+
 def getScreenshot() -> GrayImage:
-    global camera, latestScreenshot
-    screenshot = camera.grab()
+    global latestScreenshot
+    screenshot = getFrameSource().grab()
     if screenshot is None:
         return latestScreenshot
-    latestScreenshot = cv2.cvtColor(screenshot, cv2.COLOR_BGRA2GRAY)
+    # a new frame may reuse the buffer of an older one
+    clearFrameCache()
+    latestScreenshot = screenshot
     return latestScreenshot
@@ -0,0 +1,130 @@
+import cv2
+import numpy as np
+import os
+from time import sleep, time
+from typing import List, Tuple, Union
+from src.shared.typings import BBox, GrayImage
+from .regionsOfInterest import consumeRegionsToGrab, getBoundingRegion, requestFullFrame
+
+
+replayFramesExtensions = ('.npy', '.png')
+
+
+class DxcamFrameSource:
+    def __init__(self, deviceIdx: int = 0, outputIdx: int = 1, useRegionsOfInterest: bool = False):
+        # dxcam only exists on windows, importing it here keeps replay sources usable everywhere
+        import dxcam
+        self.camera = dxcam.create(
+            device_idx=deviceIdx, output_idx=outputIdx, output_color='BGRA')
+        self.useRegionsOfInterest = useRegionsOfInterest
+        self.buffers = None
+        self.bufferIndex = 0
+        self.grabbedRegions: List[BBox] = []
+
+    def grab(self) -> Union[GrayImage, None]:
+        if self.useRegionsOfInterest:
+            return self.grabRegionsOfInterest()
+        screenshot = self.camera.grab()
+        if screenshot is None:
+            return None
+        return cv2.cvtColor(screenshot, cv2.COLOR_BGRA2GRAY)
+
+    # only the declared regions are copied out of the desktop duplication and converted, the rest of the buffer
+    # keeps the pixels of the latest frame that grabbed them, a full frame or a previous grab of other regions
+    def grabRegionsOfInterest(self) -> Union[GrayImage, None]:
+        regions = None
+        if self.buffers is not None:
+            regions = consumeRegionsToGrab(
+                self.buffers[0].shape[1], self.buffers[0].shape[0])
+        if regions is None:
+            screenshot = self.camera.grab()
+            if screenshot is None:
+                requestFullFrame()
+                return None
+            if self.buffers is None:
+                self.buffers = [np.empty(screenshot.shape[:2], dtype=np.uint8), np.empty(
+                    screenshot.shape[:2], dtype=np.uint8)]
+            buffer = cv2.cvtColor(screenshot, cv2.COLOR_BGRA2GRAY, dst=self.getNextBuffer())
+            # both buffers hold the full frame so the next region grabs only differ inside their regions
+            np.copyto(self.buffers[1 - self.bufferIndex], buffer)
+            self.grabbedRegions = []
+            return buffer
+        (x, y, width, height) = getBoundingRegion(regions)
+        screenshot = self.camera.grab(region=(x, y, x + width, y + height))
+        if screenshot is None:
+            return None
+        previousBuffer = self.buffers[self.bufferIndex]
+        buffer = self.getNextBuffer()
+        # the buffers only differ inside the regions of the previous grab, copying them back makes the buffer the latest frame again
+        for (regionX, regionY, regionWidth, regionHeight) in self.grabbedRegions:
+            buffer[regionY:regionY + regionHeight, regionX:regionX + regionWidth] = \
+                previousBuffer[regionY:regionY + regionHeight, regionX:regionX + regionWidth]
+        self.grabbedRegions = regions
+        return convertRegionsToGray(screenshot, (x, y), regions, buffer)
+
+    # the previous frame must stay untouched while the current one is written
+    def getNextBuffer(self) -> GrayImage:
+        self.bufferIndex = 1 - self.bufferIndex
+        return self.buffers[self.bufferIndex]
+
+
+class ReplayFrameSource:
+    # fps=None streams frames as fast as possible
+    def __init__(self, path: str, fps: Union[float, None] = None, loop: bool = False):
+        self.path = path
+        self.fps = fps
+        self.loop = loop
+        self.frameIndex = 0
+        self.lastGrabAt = None
+        self.frames = None
+        self.framesPaths = None
+        if os.path.isdir(path):
+            self.framesPaths = getReplayFramesPaths(path)
+        else:
+            self.frames = np.load(path, mmap_mode='r')
+
+    def __len__(self) -> int:
+        if self.framesPaths is not None:
+            return len(self.framesPaths)
+        return len(self.frames)
+
+    def grab(self) -> Union[GrayImage, None]:
+        if self.frameIndex >= len(self):
+            if not self.loop or len(self) == 0:
+                return None
+            self.frameIndex = 0
+        if self.fps is not None and self.lastGrabAt is not None:
+            sleep(max((1 / self.fps) - (time() - self.lastGrabAt), 0))
+        self.lastGrabAt = time()
+        frame = self.getFrame(self.frameIndex)
+        self.frameIndex += 1
+        return frame
+
+    # middlewares write into the screenshot (e.g. radar cross), so every frame must be a private copy
+    def getFrame(self, frameIndex: int) -> GrayImage:
+        if self.framesPaths is not None:
+            return loadReplayFrame(self.framesPaths[frameIndex])
+        return np.array(self.frames[frameIndex], dtype=np.uint8)
+
+    def rewind(self):
+        self.frameIndex = 0
+        self.lastGrabAt = None
+
+
+# TODO: add perf
+def convertRegionsToGray(screenshot: np.ndarray, offset: Tuple[int, int], regions: List[BBox], buffer: GrayImage) -> GrayImage:
+    (xOffset, yOffset) = offset
+    for (x, y, width, height) in regions:
+        cv2.cvtColor(screenshot[y - yOffset:y - yOffset + height, x - xOffset:x - xOffset + width],
+                     cv2.COLOR_BGRA2GRAY, dst=buffer[y:y + height, x:x + width])
+    return buffer
+
+
+def getReplayFramesPaths(path: str) -> List[str]:
+    return [os.path.join(path, fileName) for fileName in sorted(os.listdir(path)) if fileName.endswith(replayFramesExtensions)]
+
+
+def loadReplayFrame(path: str) -> GrayImage:
+    if path.endswith('.npy'):
+        return np.array(np.load(path), dtype=np.uint8)
+    return np.array(cv2.cvtColor(cv2.imread(path), cv2.COLOR_BGR2GRAY), dtype=np.uint8)
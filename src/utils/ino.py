@@ -2,10 +2,22 @@ import serial
 from time import sleep
 import base64
 
-arduinoSerial = serial.Serial('COM33', 115200, timeout=1)
+# the port is opened by the first command, importing the bot does not need the board plugged in
+arduinoSerial = None
+
+def getArduinoSerial():
+    global arduinoSerial
+    if arduinoSerial is None:
+        arduinoSerial = serial.Serial('COM33', 115200, timeout=1)
+    return arduinoSerial
+
+# replays of recorded sessions send the commands to anything with a write method instead of the board
+def setArduinoSerial(newArduinoSerial):
+    global arduinoSerial
+    arduinoSerial = newArduinoSerial
 
 def sendCommandArduino(command):
     commandBytes = command.encode('utf-8')
     commandBase64 = base64.b64encode(commandBytes).decode('utf-8') + '\n'
-    arduinoSerial.write(commandBase64.encode())
-    sleep(0.01)
\ No newline at end of file
+    getArduinoSerial().write(commandBase64.encode())
+    sleep(0.01)
@@ -0,0 +1,158 @@
+from typing import Callable, Dict, List, Union
+from src.shared.typings import BBox, GrayImage
+
+
+# anchors are kept per monitor resolution and client layout, each one with its position and the hash of its pixels,
+# layouts are keyed by resolution and the index of the client layout seen at that resolution, e.g. 1920x1080/0
+layouts: Dict[str, Dict[str, dict]] = {}
+currentLayoutKey = None
+anchors: Dict[str, dict] = {}
+anchorsLocators: Dict[str, Callable] = {}
+hasLayoutChanged = False
+# a new client layout is only stored once it found as many anchors as the layout it replaced,
+# so a loading frame with a few anchors drawn does not become a layout
+pendingLayoutMinAnchorsCount = 0
+# least recently used layouts of a resolution are dropped beyond this count
+maxLayoutsPerResolution = 8
+
+
+def registerAnchor(name: str, locator: Callable):
+    anchorsLocators[name] = locator
+
+
+def getAnchor(name: str) -> Union[dict, None]:
+    return anchors.get(name, None)
+
+
+def setAnchor(name: str, position: BBox, positionHash: int):
+    global hasLayoutChanged
+    anchor = anchors.get(name, None)
+    if anchor is not None and anchor['position'] == position and anchor['hash'] == positionHash:
+        return
+    anchors[name] = {'position': position, 'hash': positionHash}
+    if currentLayoutKey in layouts:
+        hasLayoutChanged = True
+    elif currentLayoutKey is not None and len(anchors) >= max(pendingLayoutMinAnchorsCount, 1):
+        storePendingLayout()
+
+
+# a pending layout holding the same anchors as a stored one of its resolution is that layout
+def storePendingLayout():
+    global hasLayoutChanged
+    resolutionLayoutsKeys = getResolutionLayoutsKeys(currentLayoutKey.split('/')[0])
+    for layoutKey in resolutionLayoutsKeys:
+        if all(layouts[layoutKey].get(name, None) == anchor for name, anchor in anchors.items()):
+            useLayout(layoutKey)
+            return
+    layouts[currentLayoutKey] = anchors
+    for layoutKey in resolutionLayoutsKeys[:max(len(resolutionLayoutsKeys) + 1 - maxLayoutsPerResolution, 0)]:
+        del layouts[layoutKey]
+    hasLayoutChanged = True
+
+
+def getResolutionKey(screenshot: GrayImage) -> str:
+    return f'{len(screenshot[0])}x{len(screenshot)}'
+
+
+def getResolutionLayoutsKeys(resolutionKey: str) -> List[str]:
+    return [layoutKey for layoutKey in layouts if layoutKey.startswith(f'{resolutionKey}/')]
+
+
+# a layout matches a screenshot when most of its anchors still hash the same, a single dragged panel keeps its layout
+def layoutMatches(layoutAnchors: Dict[str, dict], screenshot: GrayImage) -> bool:
+    # core imports this module to register its anchors
+    from .core import hashit
+    matchedAnchorsCount = 0
+    for anchor in layoutAnchors.values():
+        (x, y, w, h) = anchor['position']
+        if hashit(screenshot[y:y + h, x:x + w]) == anchor['hash']:
+            matchedAnchorsCount += 1
+    return matchedAnchorsCount * 2 > len(layoutAnchors)
+
+
+def currentLayoutMatches(screenshot: GrayImage) -> bool:
+    return layoutMatches(anchors, screenshot)
+
+
+# the current layout while the resolution holds, otherwise a stored layout of the resolution matching the screenshot
+# or a new pending one
+def getLayoutKey(screenshot: GrayImage) -> str:
+    if currentLayoutKey is not None and currentLayoutKey.startswith(f'{getResolutionKey(screenshot)}/'):
+        return currentLayoutKey
+    layoutKey = getMatchingLayoutKey(screenshot)
+    return getNewLayoutKey(screenshot) if layoutKey is None else layoutKey
+
+
+# stored layouts of the resolution other than the current one matching the screenshot,
+# with anchorName only the ones where that anchor was already found
+def getMatchingLayoutKey(screenshot: GrayImage, anchorName: Union[str, None] = None) -> Union[str, None]:
+    for layoutKey in reversed(getResolutionLayoutsKeys(getResolutionKey(screenshot))):
+        if layoutKey == currentLayoutKey or (anchorName is not None and anchorName not in layouts[layoutKey]):
+            continue
+        if layoutMatches(layouts[layoutKey], screenshot):
+            return layoutKey
+    return None
+
+
+def getNewLayoutKey(screenshot: GrayImage) -> str:
+    resolutionKey = getResolutionKey(screenshot)
+    layoutsIndexes = [int(layoutKey.split('/')[1]) for layoutKey in getResolutionLayoutsKeys(resolutionKey)]
+    return f'{resolutionKey}/{max(layoutsIndexes, default=-1) + 1}'
+
+
+# returns True when the layout has been switched and its anchors must be verified
+def useLayout(layoutKey: str) -> bool:
+    global anchors, currentLayoutKey
+    if layoutKey == currentLayoutKey:
+        return False
+    if layoutKey not in layouts:
+        startLayout(layoutKey)
+        return True
+    currentLayoutKey = layoutKey
+    # the least recently used layouts are the first ones
+    layouts[layoutKey] = layouts.pop(layoutKey)
+    anchors = layouts[layoutKey]
+    return True
+
+
+# layouts not stored yet start pending and empty, replacing a pending layout keeps what the stored one requires
+def startLayout(layoutKey: str):
+    global anchors, currentLayoutKey, pendingLayoutMinAnchorsCount
+    if currentLayoutKey is None or currentLayoutKey in layouts:
+        pendingLayoutMinAnchorsCount = len(anchors)
+    currentLayoutKey = layoutKey
+    anchors = {}
+
+
+# TODO: add perf
+# persisted anchors are verified by their hash, only the ones that moved are searched again
+def calibrateLayout(screenshot: GrayImage) -> Dict[str, Union[BBox, None]]:
+    useLayout(getLayoutKey(screenshot))
+    return {name: locator(screenshot) for name, locator in anchorsLocators.items()}
+
+
+def loadLayouts(serializedLayouts: Dict[str, Dict[str, dict]]):
+    global anchors, currentLayoutKey, hasLayoutChanged, pendingLayoutMinAnchorsCount
+    layouts.clear()
+    for layoutKey, serializedAnchors in serializedLayouts.items():
+        # layouts persisted before client layouts were told apart are the first client layout of their resolution
+        if '/' not in layoutKey:
+            layoutKey = f'{layoutKey}/0'
+        layouts[layoutKey] = {name: {'position': tuple(anchor['position']), 'hash': anchor['hash']}
+                              for name, anchor in serializedAnchors.items()}
+    currentLayoutKey = None
+    anchors = {}
+    hasLayoutChanged = False
+    pendingLayoutMinAnchorsCount = 0
+
+
+def dumpLayouts() -> Dict[str, Dict[str, dict]]:
+    return {layoutKey: {name: {'position': list(anchor['position']), 'hash': anchor['hash']} for name, anchor in layoutAnchors.items()}
+            for layoutKey, layoutAnchors in layouts.items()}
+
+
+def consumeLayoutChanges() -> bool:
+    global hasLayoutChanged
+    changed = hasLayoutChanged
+    hasLayoutChanged = False
+    return changed
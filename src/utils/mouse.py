@@ -1,4 +1,3 @@
-import pyautogui
 from src.shared.typings import XYCoordinate
 from .ino import sendCommandArduino
 
@@ -26,5 +25,7 @@ def rightClick(windowCoordinate: XYCoordinate = None):
     sendCommandArduino("rightClick")
 
 def scroll(clicks: int):
+    # pyautogui needs a display, it is only imported when the cursor position is needed
+    import pyautogui
     curX, curY = pyautogui.position()
     sendCommandArduino(f"scroll,{curX}, {curY}, {clicks}")
@@ -0,0 +1,91 @@
+from typing import Dict, List, Union
+from src.shared.typings import BBox
+
+
+regionsOfInterest: Dict[str, BBox] = {}
+shouldGrabFullFrame = True
+
+
+def setRegionOfInterest(name: str, region: BBox):
+    regionsOfInterest[name] = region
+
+
+def removeRegionOfInterest(name: str):
+    regionsOfInterest.pop(name, None)
+
+
+def clearRegionsOfInterest():
+    regionsOfInterest.clear()
+    requestFullFrame()
+
+
+# anchors must be searched over the whole screen, so the next grab converts everything
+def requestFullFrame():
+    global shouldGrabFullFrame
+    shouldGrabFullFrame = True
+
+
+# TODO: add perf
+def consumeRegionsToGrab(width: int, height: int) -> Union[List[BBox], None]:
+    global shouldGrabFullFrame
+    if shouldGrabFullFrame or len(regionsOfInterest) == 0:
+        shouldGrabFullFrame = False
+        return None
+    regions = []
+    for region in regionsOfInterest.values():
+        clippedRegion = clipRegion(region, width, height)
+        if clippedRegion is not None:
+            regions.append(clippedRegion)
+    if len(regions) == 0:
+        return None
+    return mergeRegions(regions)
+
+
+def clipRegion(region: BBox, width: int, height: int) -> Union[BBox, None]:
+    x0 = max(region[0], 0)
+    y0 = max(region[1], 0)
+    x1 = min(region[0] + region[2], width)
+    y1 = min(region[1] + region[3], height)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+# overlapping rectangles are replaced by their bounding box so no pixel is converted twice
+def mergeRegions(regions: List[BBox]) -> List[BBox]:
+    mergedRegions = list(regions)
+    hasMerged = True
+    while hasMerged:
+        hasMerged = False
+        for i in range(len(mergedRegions)):
+            for j in range(i + 1, len(mergedRegions)):
+                if regionsOverlap(mergedRegions[i], mergedRegions[j]):
+                    mergedRegions[i] = getBoundingRegion(
+                        [mergedRegions[i], mergedRegions[j]])
+                    del mergedRegions[j]
+                    hasMerged = True
+                    break
+            if hasMerged:
+                break
+    return mergedRegions
+
+
+def regionsOverlap(region: BBox, otherRegion: BBox) -> bool:
+    return region[0] < otherRegion[0] + otherRegion[2] and otherRegion[0] < region[0] + region[2] and \
+        region[1] < otherRegion[1] + otherRegion[3] and otherRegion[1] < region[1] + region[3]
+
+
+def getBoundingRegion(regions: List[BBox]) -> BBox:
+    x0 = min(region[0] for region in regions)
+    y0 = min(region[1] for region in regions)
+    x1 = max(region[0] + region[2] for region in regions)
+    y1 = max(region[1] + region[3] for region in regions)
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+# a missing anchor can only be found again over a fully converted frame
+def declareRegionOfInterest(name: str, region: Union[BBox, None]):
+    if region is None:
+        requestFullFrame()
+        return
+    setRegionOfInterest(name, region)
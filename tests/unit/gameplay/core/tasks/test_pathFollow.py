@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+from src.gameplay.core.tasks.pathFollow import PathFollowTask
+
+
+walkpoints = [[10, 10, 7], [11, 10, 7], [12, 10, 7], [13, 10, 7], [13, 11, 7]]
+
+
+@pytest.fixture
+def context():
+    return {'ng_screenshot': None, 'ng_radar': {'coordinate': (9, 10, 7), 'lastCoordinateVisited': (9, 10, 7)}, 'ng_lastPressedKey': None}
+
+
+# the coordinate of a tick becomes the last coordinate visited once the tasks ran, as in the pilot thread
+def walkTo(task, context, coordinate):
+    context['ng_radar']['coordinate'] = coordinate
+    context = task.ping(context)
+    context['ng_radar']['lastCoordinateVisited'] = coordinate
+    return task.ping(context)
+
+
+@pytest.fixture(autouse=True)
+def frictions(mocker):
+    mocker.patch('src.gameplay.core.tasks.pathFollow.getTilesFrictionsByCoordinates',
+                 side_effect=lambda path: np.array([100, 100, 200, 100, 100][:len(path)]))
+    mocker.patch('src.gameplay.core.tasks.pathFollow.getSpeed', return_value=219)
+
+
+def test_should_test_default_params(context):
+    task = PathFollowTask(context, walkpoints)
+    assert task.name == 'pathFollow'
+    assert task.shouldTimeoutTreeWhenTimeout == True
+    assert task.path.dtype == np.int32
+    assert task.walkpoint == (10, 10, 7)
+    assert task.delayBeforeStart == 0
+    assert task.delayOfTimeout == 0.4
+
+
+def test_should_compute_timeouts_by_tile_friction(context):
+    task = PathFollowTask(context, walkpoints)
+    assert task.tilesMovementSpeeds.tolist() == [200, 200, 400, 200, 200]
+    assert task.getWalkpointTimeout(2) == 0.8
+
+
+def test_should_assume_slowest_movement_when_speed_is_unknown(context, mocker):
+    mocker.patch('src.gameplay.core.tasks.pathFollow.getSpeed', return_value=None)
+    task = PathFollowTask(context, walkpoints)
+    assert task.delayOfTimeout == 1.7
+
+
+def test_should_update_timeouts_when_speed_changes(context, mocker):
+    task = PathFollowTask(context, walkpoints)
+    mocker.patch('src.gameplay.core.tasks.pathFollow.getSpeed', return_value=2382)
+    mocker.patch('src.gameplay.core.tasks.pathFollow.keyDown')
+    task.ping(context)
+    assert task.tilesMovementSpeeds.tolist() == [50, 50, 150, 50, 50]
+
+
+def test_should_hold_key_along_same_direction(context, mocker):
+    keyDownSpy = mocker.patch('src.gameplay.core.tasks.pathFollow.keyDown')
+    pressSpy = mocker.patch('src.gameplay.core.tasks.pathFollow.press')
+    task = PathFollowTask(context, walkpoints)
+    context = task.do(context)
+    keyDownSpy.assert_called_once_with('right')
+    assert context['ng_lastPressedKey'] == 'right'
+    context = walkTo(task, context, (10, 10, 7))
+    context = task.ping(context)
+    keyDownSpy.assert_called_once_with('right')
+    pressSpy.assert_not_called()
+    assert task.walkpoint == (11, 10, 7)
+
+
+def test_should_release_key_before_direction_changes(context, mocker):
+    mocker.patch('src.gameplay.core.tasks.pathFollow.keyDown')
+    keyUpSpy = mocker.patch('src.gameplay.utils.keyUp')
+    task = PathFollowTask(context, walkpoints)
+    context = task.do(context)
+    context = walkTo(task, context, (12, 10, 7))
+    keyUpSpy.assert_called_once_with('right')
+    assert context['ng_lastPressedKey'] is None
+    assert task.walkpoint == (13, 10, 7)
+
+
+def test_should_restart_walkpoint_timeout_when_walkpoint_is_reached(context, mocker):
+    mocker.patch('src.gameplay.core.tasks.pathFollow.keyDown')
+    task = PathFollowTask(context, walkpoints)
+    task.startedAt = 0
+    context = task.do(context)
+    context['ng_radar']['coordinate'] = (11, 10, 7)
+    context = task.ping(context)
+    assert task.startedAt > 0
+    assert task.delayOfTimeout == 0.8
+    assert task.getRemainingWalkpoints() == [(12, 10, 7), (13, 10, 7), (13, 11, 7)]
+
+
+def test_should_press_single_walkpoint(context, mocker):
+    pressSpy = mocker.patch('src.gameplay.core.tasks.pathFollow.press')
+    task = PathFollowTask(context, [[10, 10, 7]])
+    task.do(context)
+    pressSpy.assert_called_once_with('right')
+
+
+def test_should_wait_before_each_walkpoint_when_passinho(context, mocker):
+    keyDownSpy = mocker.patch('src.gameplay.core.tasks.pathFollow.keyDown')
+    task = PathFollowTask(context, walkpoints, passinho=True)
+    assert task.delayBeforeStart == 0.4
+    assert task.delayOfTimeout == 0.8
+    context = task.do(context)
+    keyDownSpy.assert_called_once_with('right')
+    context['ng_lastPressedKey'] = None
+    context['ng_radar']['coordinate'] = (10, 10, 7)
+    task.ping(context)
+    keyDownSpy.assert_called_once_with('right')
+
+
+def test_should_not_handle_keys_while_the_player_is_mid_step(context, mocker):
+    keyDownSpy = mocker.patch('src.gameplay.core.tasks.pathFollow.keyDown')
+    keyUpSpy = mocker.patch('src.gameplay.utils.keyUp')
+    task = PathFollowTask(context, walkpoints)
+    context['ng_radar']['lastCoordinateVisited'] = None
+    context = task.do(context)
+    keyDownSpy.assert_not_called()
+    context['ng_radar']['lastCoordinateVisited'] = (9, 10, 7)
+    context = task.ping(context)
+    keyDownSpy.assert_called_once_with('right')
+    context['ng_radar']['coordinate'] = (12, 10, 7)
+    context = task.ping(context)
+    keyUpSpy.assert_not_called()
+    assert task.walkpoint == (13, 10, 7)
+    context['ng_radar']['lastCoordinateVisited'] = (12, 10, 7)
+    context = task.ping(context)
+    keyUpSpy.assert_called_once_with('right')
+
+
+def test_should_did_when_last_walkpoint_is_reached(context):
+    task = PathFollowTask(context, walkpoints)
+    assert task.did(context) == False
+    context['ng_radar']['coordinate'] = (13, 11, 7)
+    assert task.did(context) == True
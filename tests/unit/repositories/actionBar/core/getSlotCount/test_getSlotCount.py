@@ -0,0 +1,34 @@
+import pathlib
+from src.repositories.actionBar.core import getSlotCount
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+screenshotsPath = f'{currentPath}/../slotIsAvailable'
+
+
+def test_should_read_the_count_from_the_counts_font_glyphs():
+    screenshot = loadFromRGBToGray(f'{screenshotsPath}/smallHealthPotionAvailable.png')
+    assert getSlotCount(screenshot, 1) == 100
+
+
+def test_should_read_the_count_with_tesseract_once_when_a_digit_has_no_glyph(mocker):
+    mocker.patch('src.repositories.actionBar.counts.countsCache', {})
+    mocker.patch('src.repositories.actionBar.counts.countGlyphsDigits', {})
+    imageToString = mocker.patch('pytesseract.image_to_string', return_value='801\n')
+    assert getSlotCount(loadFromRGBToGray(f'{screenshotsPath}/strongManaPotionAvailable.png'), 1) == 801
+    assert getSlotCount(loadFromRGBToGray(f'{screenshotsPath}/strongManaPotionAvailable.png'), 1) == 801
+    imageToString.assert_called_once()
+
+
+def test_should_not_run_tesseract_when_every_digit_has_a_glyph(mocker):
+    mocker.patch('src.repositories.actionBar.counts.countsCache', {})
+    imageToString = mocker.patch('pytesseract.image_to_string')
+    assert getSlotCount(loadFromRGBToGray(f'{screenshotsPath}/strongManaPotionAvailable.png'), 1) == 801
+    imageToString.assert_not_called()
+
+
+def test_should_return_None_when_the_action_bar_is_not_found(mocker):
+    mocker.patch('src.repositories.actionBar.core.getSlotCountImage', return_value=None)
+    screenshot = loadFromRGBToGray(f'{screenshotsPath}/manaPotionAvailable.png')
+    assert getSlotCount(screenshot, 1) is None
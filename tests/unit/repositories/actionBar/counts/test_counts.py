@@ -0,0 +1,58 @@
+import numpy as np
+import pathlib
+import pytest
+from src.repositories.actionBar import counts
+from src.repositories.actionBar.core import getSlotCountImage
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+screenshotsPath = f'{currentPath}/../core/slotIsAvailable'
+potions = ['antidote', 'berserk', 'bullseye', 'greatHealth', 'greatMana', 'greatSpirit', 'health', 'mana', 'mastermind', 'smallHealth',
+           'strongHealth', 'strongMana', 'supremeHealth', 'ultimateHealth', 'ultimateMana']
+expectedCounts = {'smallHealth': 100, 'strongMana': 801}
+
+
+def getCountImage(screenshotName: str) -> np.ndarray:
+    return getSlotCountImage(loadFromRGBToGray(f'{screenshotsPath}/{screenshotName}.png'), 1)
+
+
+@pytest.fixture(autouse=True)
+def clearCountsCache(mocker):
+    mocker.patch.dict(counts.countsCache, clear=True)
+
+
+@pytest.mark.parametrize('potion', potions)
+def test_should_read_recorded_slots_counts(potion):
+    assert counts.getCount(getCountImage(f'{potion}PotionAvailable')) == expectedCounts.get(potion, 1)
+    assert counts.getCount(getCountImage(f'{potion}PotionNotAvailable')) == 0
+
+
+@pytest.mark.parametrize('screenshotPath, slot, count', [
+    ('hasAttackCooldown/withAttackCooldown.png', 4, 262),
+    ('hasAttackCooldown/withAttackCooldown.png', 6, 126),
+    ('hasSupportCooldown/withSupportCooldown.png', 4, 261),
+])
+def test_should_read_recorded_counts_of_other_slots(screenshotPath, slot, count):
+    screenshot = loadFromRGBToGray(f'{currentPath}/../core/{screenshotPath}')
+    assert counts.getCount(getSlotCountImage(screenshot, slot)) == count
+
+
+@pytest.mark.parametrize('digit', sorted(counts.countGlyphsTemplates))
+def test_should_decode_every_recorded_digit_glyph(digit):
+    assert counts.getCountGlyphDigit(counts.countGlyphsTemplates[digit]) == digit
+
+
+def test_should_return_None_for_glyphs_without_exact_template_while_digits_are_missing():
+    countImage = getCountImage('strongManaPotionAvailable').copy()
+    countImage[2, 13] = 0
+    assert counts.getCount(countImage) is None
+
+
+def test_should_match_glyphs_partially_covered_by_potions_once_every_digit_has_a_template(mocker):
+    countImage = getCountImage('strongManaPotionAvailable').copy()
+    missingGlyphs = {digit: np.full((8, 6), digit, dtype=np.uint8) for digit in range(10) if digit not in counts.countGlyphsTemplates}
+    mocker.patch.dict(counts.countGlyphsTemplates, missingGlyphs)
+    countImage[2, 13] = 0
+    countImage[4, 14] = 0
+    assert counts.getCount(countImage) == 801
@@ -0,0 +1,37 @@
+import numpy as np
+import pathlib
+from src.repositories.battleList.config import slotsIconsBits
+from src.repositories.battleList.core import getSlotsIcons, skullsIconsMask
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+contentsPath = f'{currentPath}/../hasSkull'
+
+
+def test_should_return_no_icons_when_there_are_no_players():
+    content = loadFromRGBToGray(f'{contentsPath}/noPlayers.png')
+    slotsIcons = getSlotsIcons(content, np.arange(3))
+    np.testing.assert_array_equal(slotsIcons, np.zeros(3, dtype=np.uint8))
+
+
+def test_should_return_the_black_skull_bit_of_the_player_slot():
+    content = loadFromRGBToGray(f'{contentsPath}/playerWithBlackSkull.png')
+    slotsIcons = getSlotsIcons(content, np.arange(3))
+    np.testing.assert_array_equal(slotsIcons, np.array([0, slotsIconsBits['blackSkull'], 0], dtype=np.uint8))
+
+
+# skulls only differ by their color, in gray every colored skull template matches every colored skull
+def test_should_return_skulls_bits_of_colored_skulls():
+    for skullName in ['Orange', 'Red', 'White', 'Yellow']:
+        content = loadFromRGBToGray(f'{contentsPath}/playerWith{skullName}Skull.png')
+        slotsIcons = getSlotsIcons(content, np.array([0, 1]))
+        assert slotsIcons[0] & skullsIconsMask > 0
+        assert slotsIcons[0] & slotsIconsBits['dust'] == 0
+        assert slotsIcons[1] == 0
+
+
+def test_should_skip_slots_whose_icons_strip_is_cut():
+    content = loadFromRGBToGray(f'{contentsPath}/playerWithBlackSkull.png')[:22 + 12]
+    slotsIcons = getSlotsIcons(content, np.array([1]))
+    np.testing.assert_array_equal(slotsIcons, np.zeros(1, dtype=np.uint8))
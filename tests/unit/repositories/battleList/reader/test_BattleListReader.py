@@ -0,0 +1,50 @@
+import numpy as np
+import pathlib
+from src.repositories.battleList.core import getCreatures
+from src.repositories.battleList.reader import BattleListReader
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+contentsPath = f'{currentPath}/../core'
+beingAttackedContent = loadFromRGBToGray(f'{contentsPath}/getBeingAttackedCreatures/beingAttackedCreature.png')
+fullContent = loadFromRGBToGray(f'{contentsPath}/getFilledSlotsCount/fullCreaturesInBattleListContent.png')
+
+
+def test_should_read_the_same_creatures_as_getCreatures():
+    reader = BattleListReader()
+    for content in [beingAttackedContent, fullContent, beingAttackedContent]:
+        np.testing.assert_array_equal(reader.read(content), getCreatures(content))
+
+
+def test_should_only_decode_changed_slots(mocker):
+    reader = BattleListReader()
+    getSlotRowSpy = mocker.spy(reader, 'getSlotRow')
+    reader.read(beingAttackedContent)
+    assert getSlotRowSpy.call_count == 3
+    reader.read(beingAttackedContent)
+    assert getSlotRowSpy.call_count == 3
+    content = np.vstack([beingAttackedContent[:44], beingAttackedContent[22:44], beingAttackedContent[66:]])
+    creatures = reader.read(content)
+    assert creatures['name'].tolist() == ['Dromedary', 'Dragon', 'Dragon']
+    assert getSlotRowSpy.call_count == 3
+    assert reader.diff == {'added': ['Dragon'], 'removed': ['Rat'], 'previousTarget': 'Dromedary', 'target': 'Dromedary', 'targetChanged': False}
+
+
+def test_should_reuse_slots_moved_up_by_a_creature_leaving_the_list(mocker):
+    reader = BattleListReader()
+    reader.read(beingAttackedContent)
+    getSlotRowSpy = mocker.spy(reader, 'getSlotRow')
+    content = np.vstack([beingAttackedContent[22:], beingAttackedContent[-22:]])
+    creatures = reader.read(content)
+    assert creatures['name'].tolist() == ['Dragon', 'Rat']
+    getSlotRowSpy.assert_not_called()
+    assert reader.diff == {'added': [], 'removed': ['Dromedary'], 'previousTarget': 'Dromedary', 'target': None, 'targetChanged': True}
+
+
+def test_should_remove_every_creature_when_the_battle_list_is_not_found():
+    reader = BattleListReader()
+    reader.read(beingAttackedContent)
+    assert reader.diff == {'added': ['Dromedary', 'Dragon', 'Rat'], 'removed': [], 'previousTarget': None, 'target': 'Dromedary', 'targetChanged': True}
+    assert reader.read(None) == []
+    assert reader.diff == {'added': [], 'removed': ['Dromedary', 'Dragon', 'Rat'], 'previousTarget': 'Dromedary', 'target': None, 'targetChanged': True}
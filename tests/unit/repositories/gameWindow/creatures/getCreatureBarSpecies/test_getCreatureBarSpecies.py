@@ -0,0 +1,15 @@
+from src.repositories.gameWindow.creatures import getBattleListNames, getCreatureBarSpecies
+
+
+def test_should_keep_every_creature_of_the_same_species():
+    battleListNames = getBattleListNames([{'name': 'Rat'}, {'name': 'Rat'}, {'name': 'Unknown'}])
+    assert getCreatureBarSpecies(battleListNames, ['Rat']) == ['Rat', 'Rat', 'Unknown']
+
+
+def test_should_keep_the_battle_list_order():
+    battleListNames = ['Rat', 'Cave Rat', 'Dusted', 'Rat']
+    assert getCreatureBarSpecies(battleListNames, ['Cave Rat', 'Rat']) == ['Rat', 'Cave Rat', 'Dusted', 'Rat']
+
+
+def test_should_not_keep_creatures_of_unmatched_species():
+    assert getCreatureBarSpecies(['Rat', 'Cave Rat', 'Rat'], ['Cave Rat']) == ['Cave Rat']
@@ -0,0 +1,69 @@
+from numba import njit
+import numpy as np
+from src.repositories.gameWindow.creatures import getCreaturesBars
+
+
+def drawCreatureBar(gameWindowImage: np.ndarray, x: int, y: int):
+    gameWindowImage[y:y + 4, x:x + 27] = 0
+    gameWindowImage[y + 1:y + 3, x + 1:x + 26] = 112
+
+
+# the serial scan getCreaturesBars ran before the row bands, kept verbatim as the reference of the banded scan
+@njit(fastmath=True)
+def getSerialBars(gameWindowImage: np.ndarray):
+    bars = []
+    width = gameWindowImage.shape[1] - 27
+    height = gameWindowImage.shape[0] - 3
+    creatureIndex = 0
+    for y in range(height):
+        x = -1
+        while x < width:
+            x += 1
+            if gameWindowImage[y, x + 26] != 0:
+                x += 26
+                continue
+            bothBordersAreBlack = True
+            for l in range(25):
+                key = x + 25 - l
+                if gameWindowImage[y, key] != 0 or gameWindowImage[y + 3, key] != 0:
+                    bothBordersAreBlack = False
+                    x = key
+                    break
+            if bothBordersAreBlack == False:
+                continue
+            if (
+                gameWindowImage[y + 1, x] != 0 or
+                gameWindowImage[y + 2, x] != 0 or
+                gameWindowImage[y + 1, x + 26] != 0 or
+                gameWindowImage[y + 2, x + 26] != 0
+            ):
+                continue
+            bars.append((x, y))
+            creatureIndex += 1
+            x += 26
+    return bars
+
+
+def getSerialCreaturesBars(gameWindowImage: np.ndarray):
+    return [(int(x), int(y)) for (x, y) in getSerialBars(gameWindowImage)]
+
+
+def test_should_return_empty_list_when_there_are_no_bars():
+    gameWindowImage = np.full((704, 960), 90, dtype=np.uint8)
+    assert getCreaturesBars(gameWindowImage) == []
+
+
+def test_should_return_bars_sorted_by_row_and_column():
+    gameWindowImage = np.full((704, 960), 90, dtype=np.uint8)
+    for (x, y) in [(500, 300), (10, 300), (933, 0), (0, 700), (100, 40)]:
+        drawCreatureBar(gameWindowImage, x, y)
+    assert getCreaturesBars(gameWindowImage) == [(933, 0), (100, 40), (10, 300), (500, 300), (0, 700)]
+
+
+def test_should_find_the_same_bars_as_the_serial_scan():
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        gameWindowImage = rng.integers(0, 4, (352, 480), dtype=np.uint8) * 60
+        for _ in range(20):
+            drawCreatureBar(gameWindowImage, rng.integers(0, 480 - 27), rng.integers(0, 352 - 4))
+        assert getCreaturesBars(gameWindowImage) == getSerialCreaturesBars(gameWindowImage)
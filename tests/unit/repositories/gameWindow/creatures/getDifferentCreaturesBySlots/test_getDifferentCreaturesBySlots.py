@@ -0,0 +1,57 @@
+import numpy as np
+from src.gameplay.comboSpells.core import spellsPath
+from src.repositories.gameWindow.creatures import getDifferentCreaturesBySlots
+
+
+species = ['Rotworm', 'Cyclops', 'Dragon']
+
+
+def getRandomCreatures(rng: np.random.Generator, count: int):
+    return [{'name': species[rng.integers(len(species))], 'slot': (int(rng.integers(0, 15)), int(rng.integers(0, 11))), 'isBeingAttacked': bool(rng.integers(2))} for _ in range(count)]
+
+
+# pair by pair comparison of every previous creature inside the slots with every current creature
+def getExpectedDifferentCreatures(previousGameWindowCreatures, currentGameWindowCreatures, slots):
+    slots = [tuple(slot) for slot in slots]
+    differentCreatures = []
+    for previousGameWindowCreature in previousGameWindowCreatures:
+        if tuple(previousGameWindowCreature['slot']) not in slots:
+            continue
+        creatureDoesNotExists = True
+        for currentGameWindowCreature in currentGameWindowCreatures:
+            if previousGameWindowCreature['name'] == currentGameWindowCreature['name'] and tuple(previousGameWindowCreature['slot']) == tuple(currentGameWindowCreature['slot']):
+                creatureDoesNotExists = False
+                break
+        if creatureDoesNotExists:
+            differentCreatures.append(previousGameWindowCreature)
+    return differentCreatures
+
+
+def test_should_return_empty_list_when_there_are_no_previous_creatures():
+    assert getDifferentCreaturesBySlots([], getRandomCreatures(np.random.default_rng(0), 3), spellsPath['exori']) == []
+
+
+def test_should_return_creatures_gone_from_spell_area():
+    previousGameWindowCreatures = [
+        {'name': 'Rotworm', 'slot': (6, 4)},
+        {'name': 'Rotworm', 'slot': (8, 6)},
+        {'name': 'Cyclops', 'slot': (7, 6)},
+        {'name': 'Cyclops', 'slot': (4, 4)},
+    ]
+    currentGameWindowCreatures = [
+        {'name': 'Rotworm', 'slot': (8, 6)},
+        {'name': 'Rotworm', 'slot': (7, 6)},
+    ]
+    differentCreatures = getDifferentCreaturesBySlots(
+        previousGameWindowCreatures, currentGameWindowCreatures, spellsPath['exori'])
+    assert differentCreatures == [previousGameWindowCreatures[0], previousGameWindowCreatures[2]]
+
+
+def test_should_find_the_same_creatures_as_comparing_every_pair():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        previousGameWindowCreatures = getRandomCreatures(rng, int(rng.integers(0, 30)))
+        currentGameWindowCreatures = [creature for creature in previousGameWindowCreatures if rng.random() < 0.5] + getRandomCreatures(rng, int(rng.integers(0, 10)))
+        slots = spellsPath[list(spellsPath.keys())[rng.integers(len(spellsPath))]]
+        differentCreatures = getDifferentCreaturesBySlots(previousGameWindowCreatures, currentGameWindowCreatures, slots)
+        assert differentCreatures == getExpectedDifferentCreatures(previousGameWindowCreatures, currentGameWindowCreatures, slots)
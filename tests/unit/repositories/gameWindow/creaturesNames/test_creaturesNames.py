@@ -0,0 +1,86 @@
+import math
+import numpy as np
+from src.repositories.gameWindow.creaturesNames import getBattleListSpecies, getCreatureNameTemplate, getMatchedCreaturesNames, getPackedCreaturesNamesTemplates, packCreaturesNamesTemplates
+from src.utils.matrix import hasMatrixInsideOther
+
+
+def getCreatureNameImg(rng: np.random.Generator, width: int) -> np.ndarray:
+    return np.where(rng.random((11, width)) < 0.3, 0, 255).astype(np.uint8)
+
+
+# name lookup of a single species as it was done for every battle list entry
+def hasCreatureName(gameWindowImage: np.ndarray, creatureBar, creatureNameImg: np.ndarray) -> bool:
+    gameWindowWidth = gameWindowImage.shape[1]
+    (creatureBarX, creatureBarY) = creatureBar
+    creatureBarY0 = creatureBarY - 13
+    creatureBarY1 = creatureBarY0 + 11
+    creatureNameImgHalfWidth = math.floor(creatureNameImg.shape[1] / 2)
+    leftDiff = max(creatureNameImgHalfWidth - 13, 0)
+    gapLeft = 0 if creatureBarX > leftDiff else leftDiff - creatureBarX
+    gapInnerLeft = 0 if creatureNameImg.shape[1] > 27 else math.ceil((27 - creatureNameImg.shape[1]) / 2)
+    rightDiff = max(creatureNameImg.shape[1] - creatureNameImgHalfWidth - 14, 0)
+    gapRight = 0 if gameWindowWidth > (creatureBarX + 27 + rightDiff) else creatureBarX + 27 + rightDiff - gameWindowWidth
+    gapInnerRight = 0 if creatureNameImg.shape[1] > 27 else math.floor((27 - creatureNameImg.shape[1]) / 2)
+    gg = 13 + gapLeft + gapInnerLeft - gapRight - gapInnerRight
+    startingX = max(0, creatureBarX - creatureNameImgHalfWidth + gg)
+    endingX = min(gameWindowWidth, creatureBarX + creatureNameImgHalfWidth + gg)
+    creatureWithDirtNameImg = gameWindowImage[creatureBarY0:creatureBarY1, startingX:endingX]
+    if creatureNameImg.shape[1] != creatureWithDirtNameImg.shape[1]:
+        creatureWithDirtNameImg = gameWindowImage[creatureBarY0:creatureBarY1, startingX:endingX + 1]
+    if hasMatrixInsideOther(creatureWithDirtNameImg, creatureNameImg):
+        return True
+    creatureNameImg2 = creatureNameImg
+    creatureWithDirtNameImg2 = gameWindowImage[creatureBarY0:creatureBarY1, startingX + 1:endingX + 1]
+    if creatureNameImg2.shape[1] != creatureWithDirtNameImg2.shape[1]:
+        creatureNameImg2 = creatureNameImg2[:, 0:creatureNameImg2.shape[1] - 1]
+    if hasMatrixInsideOther(creatureWithDirtNameImg2, creatureNameImg2):
+        return True
+    creatureWithDirtNameImg3 = gameWindowImage[creatureBarY0:creatureBarY1, startingX:endingX - 1]
+    creatureNameImg3 = creatureNameImg[:, 1:creatureNameImg.shape[1]]
+    if creatureWithDirtNameImg3.shape[1] != creatureNameImg3.shape[1]:
+        creatureNameImg3 = creatureNameImg3[:, 0:creatureNameImg3.shape[1] - 1]
+    return hasMatrixInsideOther(creatureWithDirtNameImg3, creatureNameImg3)
+
+
+def test_should_dedupe_battle_list_species_keeping_their_order():
+    battleListCreatures = [{'name': 'Rotworm'}, {'name': 'Unknown'}, {'name': 'Rotworm'}, {'name': 'Cyclops'}]
+    assert getBattleListSpecies(battleListCreatures) == ['Rotworm', 'Unknown', 'Cyclops']
+
+
+def test_should_shift_the_last_alignment_by_one_column():
+    creatureNameImg = np.array([[0, 255, 0], [255, 0, 255]], dtype=np.uint8)
+    creatureNameTemplate = getCreatureNameTemplate(creatureNameImg)
+    assert creatureNameTemplate['width'] == 3
+    np.testing.assert_array_equal(creatureNameTemplate['alignments'][2], [[255, 0, 255], [0, 255, 255]])
+    np.testing.assert_array_equal(creatureNameTemplate['columnsLettersCounts'][0], [1, 1, 1])
+    np.testing.assert_array_equal(creatureNameTemplate['columnsLettersCounts'][2], [1, 1, 0])
+
+
+def test_should_match_the_name_drawn_above_the_bar():
+    rng = np.random.default_rng(1)
+    creaturesNamesImgs = {'Rotworm': getCreatureNameImg(rng, 40), 'Cyclops': getCreatureNameImg(rng, 35)}
+    gameWindowImage = np.full((352, 480), 240, dtype=np.uint8)
+    (creatureBarX, creatureBarY) = (200, 100)
+    cyclopsNameImg = creaturesNamesImgs['Cyclops']
+    startingX = creatureBarX - 35 // 2 + 13
+    gameWindowImage[creatureBarY - 13:creatureBarY - 2, startingX:startingX + 35] = np.where(cyclopsNameImg == 0, 192, 240)
+    packedCreaturesNamesTemplates = getPackedCreaturesNamesTemplates(['Rotworm', 'Cyclops'], creaturesNamesImgs.get)
+    matches = getMatchedCreaturesNames(gameWindowImage, creatureBarX, creatureBarY, *packedCreaturesNamesTemplates)
+    np.testing.assert_array_equal(matches, [False, True])
+
+
+def test_should_match_the_same_names_as_every_single_species_lookup():
+    rng = np.random.default_rng(0)
+    creaturesNamesImgs = [getCreatureNameImg(rng, width) for width in rng.integers(18, 80, 12)]
+    packedCreaturesNamesTemplates = packCreaturesNamesTemplates(
+        [getCreatureNameTemplate(creatureNameImg) for creatureNameImg in creaturesNamesImgs])
+    for _ in range(300):
+        gameWindowImage = rng.choice(np.array([0, 113, 192, 240, 255], dtype=np.uint8), (352, 480), p=[0.3, 0.2, 0.2, 0.15, 0.15])
+        creatureNameImg = creaturesNamesImgs[rng.integers(len(creaturesNamesImgs))]
+        creatureBar = (int(rng.integers(50, 400)), int(rng.integers(0, 340)))
+        startingX = creatureBar[0] - creatureNameImg.shape[1] // 2 + 13 + int(rng.integers(-1, 2))
+        if creatureBar[1] >= 13:
+            gameWindowImage[creatureBar[1] - 13:creatureBar[1] - 2, startingX:startingX + creatureNameImg.shape[1]][creatureNameImg == 0] = 0
+        matches = getMatchedCreaturesNames(gameWindowImage, creatureBar[0], creatureBar[1], *packedCreaturesNamesTemplates)
+        expectedMatches = [hasCreatureName(gameWindowImage, creatureBar, creatureNameImg) for creatureNameImg in creaturesNamesImgs]
+        np.testing.assert_array_equal(matches, expectedMatches)
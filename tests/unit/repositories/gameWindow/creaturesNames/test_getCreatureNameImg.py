@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from src.repositories.gameWindow import creaturesNames
+from src.repositories.gameWindow.config import imagesPath
+from src.utils.assetsBundle import createAssetsBundle, openAssetsBundle
+from src.utils.image import loadFromRGBToGray
+
+
+species = ['Rat', 'Dragon Lord', 'Demon']
+
+
+def getMonsterNameImg(creatureName: str) -> np.ndarray:
+    return loadFromRGBToGray(f'{imagesPath}/monsters/{creatureName}.png')
+
+
+# same layout buildMonsters.py writes, templates side by side in an 11 pixels tall buffer
+@pytest.fixture
+def creaturesNamesAtlas(tmp_path, mocker):
+    monstersNamesImgs = [getMonsterNameImg(creatureName) for creatureName in species]
+    widths = np.array([monsterNameImg.shape[1] for monsterNameImg in monstersNamesImgs], dtype=np.int32)
+    path = f'{tmp_path}/creaturesNamesAtlas.bin'
+    atlas = createAssetsBundle(path, {
+        'names': ((len(species),), '<U64'),
+        'offsets': ((len(species),), 'int32'),
+        'widths': ((len(species),), 'int32'),
+        'templates': ((11, int(widths.sum())), 'uint8'),
+    })
+    atlas['names'][:] = species
+    atlas['widths'][:] = widths
+    atlas['offsets'][:] = np.cumsum(widths) - widths
+    for offset, monsterNameImg in zip(atlas['offsets'], monstersNamesImgs):
+        atlas['templates'][:, offset:offset + monsterNameImg.shape[1]] = monsterNameImg
+    for asset in atlas.values():
+        asset.flush()
+    del atlas
+    openedAtlas = openAssetsBundle(path)
+    mocker.patch.object(creaturesNames, 'creaturesNamesAtlas', openedAtlas)
+    mocker.patch.object(creaturesNames, 'creaturesNamesAtlasIndexes', {
+        str(creatureName): index for index, creatureName in enumerate(openedAtlas['names'])})
+    mocker.patch.dict(creaturesNames.creaturesNamesImgs, clear=True)
+    return openedAtlas
+
+
+def test_should_slice_names_templates_equal_to_their_pngs(creaturesNamesAtlas, mocker):
+    loadSpy = mocker.spy(creaturesNames, 'loadFromRGBToGray')
+    for creatureName in species:
+        creatureNameImg = creaturesNames.getCreatureNameImg(creatureName)
+        assert isinstance(creatureNameImg, np.memmap)
+        np.testing.assert_array_equal(creatureNameImg, getMonsterNameImg(creatureName))
+    loadSpy.assert_not_called()
+
+
+def test_should_decode_the_png_of_species_missing_from_the_atlas(creaturesNamesAtlas, mocker):
+    loadSpy = mocker.spy(creaturesNames, 'loadFromRGBToGray')
+    np.testing.assert_array_equal(creaturesNames.getCreatureNameImg('Dragon'), getMonsterNameImg('Dragon'))
+    loadSpy.assert_called_once()
+
+
+def test_should_decode_pngs_when_there_is_no_atlas(mocker):
+    mocker.patch.object(creaturesNames, 'creaturesNamesAtlasIndexes', None)
+    mocker.patch.dict(creaturesNames.creaturesNamesImgs, clear=True)
+    np.testing.assert_array_equal(creaturesNames.getCreatureNameImg('Rat'), getMonsterNameImg('Rat'))
@@ -0,0 +1,47 @@
+import numpy as np
+from src.repositories.gameWindow.distances import blockedSlotDistance, getSlotsDistances, isPlayerSlotSurrounded, isSlotReachable, unreachableSlotDistance
+
+
+noSlots = np.zeros((0, 2), dtype=np.int32)
+
+
+def test_should_count_steps_from_player_slot():
+    walkableSqms = np.ones((11, 15), dtype=np.uint8)
+    distances = getSlotsDistances(walkableSqms, noSlots)
+    assert distances[5, 7] == 0
+    assert distances[5, 8] == 1
+    assert distances[4, 8] == 2
+    assert distances[0, 0] == 12
+    assert distances[10, 14] == 12
+
+
+def test_should_walk_around_blocked_slots():
+    walkableSqms = np.ones((11, 15), dtype=np.uint8)
+    walkableSqms[:10, 9] = 0
+    distances = getSlotsDistances(walkableSqms, np.array([[8, 10]], dtype=np.int32))
+    assert distances[0, 9] == blockedSlotDistance
+    assert distances[10, 8] == blockedSlotDistance
+    assert distances[5, 10] == unreachableSlotDistance
+    walkableSqms[10, 9] = 1
+    distances = getSlotsDistances(walkableSqms, noSlots)
+    assert distances[5, 10] == 13
+
+
+def test_should_reach_slots_next_to_a_reachable_slot():
+    walkableSqms = np.ones((11, 15), dtype=np.uint8)
+    walkableSqms[:, 10] = 0
+    slots = np.array([[8, 5], [9, 5], [9, 4], [9, 6]], dtype=np.int32)
+    distances = getSlotsDistances(walkableSqms, slots)
+    assert isSlotReachable(distances, (8, 5)) == True
+    assert isSlotReachable(distances, (9, 4)) == True
+    assert isSlotReachable(distances, (9, 5)) == False
+    assert isSlotReachable(distances, (11, 5)) == False
+    assert isSlotReachable(distances, (7, 5)) == False
+
+
+def test_should_be_surrounded_only_when_every_neighbour_is_blocked():
+    walkableSqms = np.ones((11, 15), dtype=np.uint8)
+    slots = np.array([[6, 4], [7, 4], [8, 4], [6, 5], [8, 5], [6, 6], [7, 6]], dtype=np.int32)
+    assert isPlayerSlotSurrounded(getSlotsDistances(walkableSqms, slots)) == False
+    walkableSqms[6, 8] = 0
+    assert isPlayerSlotSurrounded(getSlotsDistances(walkableSqms, slots)) == True
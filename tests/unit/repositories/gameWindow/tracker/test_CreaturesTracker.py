@@ -0,0 +1,88 @@
+import numpy as np
+from src.repositories.gameWindow.tracker import CreaturesTracker
+
+
+gameWindowImage = np.zeros((704, 960), dtype=np.uint8)
+battleListCreatures = [{'name': 'Rotworm'}, {'name': 'Rotworm'}]
+
+
+def makeCreatureBarCreatures(creatureBarSpecies, creatureBar, *args):
+    return [{'name': creatureName, 'slot': (creatureBar[0] // 64, creatureBar[1] // 64)} for creatureName in creatureBarSpecies], args[-3]
+
+
+def mockCreatures(mocker, creaturesBars, monstersSpecies=['Rotworm']):
+    mocker.patch('src.repositories.gameWindow.tracker.getSortedCreaturesBars', return_value=creaturesBars)
+    mocker.patch('src.repositories.gameWindow.tracker.makeCreatureBarCreatures', side_effect=makeCreatureBarCreatures)
+    return mocker.patch('src.repositories.gameWindow.tracker.getCreatureBarMonstersSpecies', return_value=monstersSpecies)
+
+
+def track(tracker, coordinate=(33000, 32000, 7)):
+    return tracker.track(battleListCreatures, None, (0, 0), gameWindowImage, coordinate)
+
+
+def test_should_match_names_once_per_creature(mocker):
+    getCreatureBarMonstersSpeciesSpy = mockCreatures(mocker, [(200, 200), (500, 300)])
+    tracker = CreaturesTracker()
+    creatures = track(tracker)
+    assert [creature['id'] for creature in creatures] == [1, 1, 2, 2]
+    assert [event['type'] for event in tracker.events] == ['appeared', 'appeared']
+    mockCreatures(mocker, [(210, 200), (500, 310)])
+    creatures = track(tracker)
+    assert [creature['id'] for creature in creatures] == [1, 1, 2, 2]
+    assert [creature['name'] for creature in creatures] == ['Rotworm', 'Rotworm', 'Rotworm', 'Rotworm']
+    assert tracker.events == []
+    assert getCreatureBarMonstersSpeciesSpy.call_count == 2
+
+
+def test_should_keep_ids_while_the_screen_scrolls_under_the_player(mocker):
+    mockCreatures(mocker, [(200, 200)])
+    tracker = CreaturesTracker()
+    track(tracker)
+    mockCreatures(mocker, [(136, 200)])
+    creatures = track(tracker, (33001, 32000, 7))
+    assert creatures[0]['id'] == 1
+
+
+def test_should_predict_creatures_motion(mocker):
+    mockCreatures(mocker, [(200, 200)])
+    tracker = CreaturesTracker()
+    track(tracker)
+    for x in [264, 328, 392]:
+        mockCreatures(mocker, [(x, 200)])
+        creatures = track(tracker)
+        assert creatures[0]['id'] == 1
+    assert np.array_equal(tracker.tracks[0]['velocity'], [64, 0])
+
+
+def test_should_match_names_again_when_bars_are_crowded(mocker):
+    mockCreatures(mocker, [(200, 200), (300, 200)])
+    tracker = CreaturesTracker()
+    track(tracker)
+    getCreatureBarMonstersSpeciesSpy = mockCreatures(mocker, [(250, 200), (260, 200)])
+    creatures = track(tracker)
+    assert sorted(creature['id'] for creature in creatures) == [1, 1, 2, 2]
+    assert getCreatureBarMonstersSpeciesSpy.call_count == 2
+
+
+def test_should_tell_died_from_disappeared_creatures(mocker):
+    mockCreatures(mocker, [(400, 300), (900, 300)])
+    tracker = CreaturesTracker()
+    track(tracker)
+    mockCreatures(mocker, [])
+    for _ in range(CreaturesTracker.maxMissedTicks):
+        track(tracker)
+        assert tracker.events == []
+        assert tracker.getLastSeenCreature(1)['slot'] == (6, 4)
+    track(tracker)
+    assert [(event['type'], event['id']) for event in tracker.events] == [('died', 1), ('disappeared', 2)]
+    assert tracker.getLastSeenCreature(1)['slot'] == (6, 4)
+    assert tracker.tracks == []
+
+
+def test_should_drop_tracks_when_changing_floor(mocker):
+    mockCreatures(mocker, [(400, 300)])
+    tracker = CreaturesTracker()
+    track(tracker)
+    creatures = track(tracker, (33000, 32000, 6))
+    assert creatures[0]['id'] == 2
+    assert [(event['type'], event['id']) for event in tracker.events] == [('disappeared', 1), ('appeared', 2)]
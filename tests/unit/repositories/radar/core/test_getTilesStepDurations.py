@@ -0,0 +1,20 @@
+import numpy as np
+from src.repositories.radar.core import getBreakpointTileMovementSpeed, getTilesStepDurations
+
+
+tilesFrictions = np.arange(256)
+
+
+def test_should_return_same_step_durations_as_getBreakpointTileMovementSpeed():
+    for charSpeed in [0, 1, 110, 111, 219, 220, 598, 1070, 2444, 4557, 81350, 81351]:
+        stepDurations = getTilesStepDurations(charSpeed, tilesFrictions)
+        expectedStepDurations = [getBreakpointTileMovementSpeed(charSpeed, tileFriction) for tileFriction in tilesFrictions]
+        assert stepDurations.tolist() == expectedStepDurations
+
+
+def test_should_return_fastest_step_durations_when_char_speed_is_above_every_breakpoint():
+    assert getTilesStepDurations(100000, np.array([70, 250])).tolist() == [50, 50]
+
+
+def test_should_return_step_duration_of_each_tile():
+    assert getTilesStepDurations(219, np.array([100, 200, 100, 93])).tolist() == [200, 400, 200, 200]
@@ -0,0 +1,91 @@
+import numpy as np
+from src.repositories.radar.dStarLite import DStarLitePlanner
+from src.repositories.radar.flowFields import getGridDistancesToGoal
+from src.repositories.radar.routes import getGridDistances, getSqmsCosts, unreachableDistance
+
+
+floorHeight = 40
+floorWidth = 64
+walkableSqms = np.ones((floorHeight, floorWidth), dtype=np.uint8)
+# a wall with a gap at its top
+walkableSqms[5:, 30] = 0
+frictions = np.full((floorHeight, floorWidth), 100, dtype=np.uint8)
+frictions[0:3, :] = 200
+costs = getSqmsCosts(walkableSqms, frictions, 70)
+region = (0, 0, floorWidth, floorHeight)
+
+
+def toCoordinate(x, y):
+    return (x + 31744, y + 30976, 0)
+
+
+def getWalkpointsCost(coordinate, walkpoints, nonWalkableCoordinates):
+    previousCoordinate = coordinate
+    walkpointsCost = 0
+    for walkpoint in walkpoints:
+        assert abs(walkpoint[0] - previousCoordinate[0]) + abs(walkpoint[1] - previousCoordinate[1]) == 1
+        assert tuple(walkpoint) not in nonWalkableCoordinates
+        walkpointsCost += int(costs[walkpoint[1] - 30976, walkpoint[0] - 31744])
+        previousCoordinate = walkpoint
+    return walkpointsCost
+
+
+def getShortestCost(x, y, goalX, goalY, nonWalkableCoordinates):
+    blockedCosts = costs.copy()
+    for nonWalkableCoordinate in nonWalkableCoordinates:
+        blockedCosts[nonWalkableCoordinate[1] - 30976, nonWalkableCoordinate[0] - 31744] = 0
+    return getGridDistances(blockedCosts, x, y)[goalY, goalX]
+
+
+def test_should_return_shortest_walkpoints():
+    planner = DStarLitePlanner(toCoordinate(50, 20), region, costs, 70)
+    planner.updateNonWalkableCoordinates(toCoordinate(10, 20), [])
+    walkpoints = planner.getWalkpoints(toCoordinate(10, 20))
+    assert walkpoints[-1] == list(toCoordinate(50, 20))
+    assert getWalkpointsCost(toCoordinate(10, 20), walkpoints, []) == getShortestCost(10, 20, 50, 20, [])
+
+
+def test_should_repair_walkpoints_when_creatures_move():
+    planner = DStarLitePlanner(toCoordinate(50, 20), region, costs, 70)
+    rng = np.random.default_rng(0)
+    (x, y) = (10, 20)
+    for _ in range(30):
+        nonWalkableCoordinates = [toCoordinate(int(rng.integers(0, floorWidth)), int(rng.integers(0, 8))) for _ in range(6)]
+        nonWalkableCoordinates = [nonWalkableCoordinate for nonWalkableCoordinate in nonWalkableCoordinates
+                                  if nonWalkableCoordinate not in (toCoordinate(x, y), toCoordinate(50, 20))]
+        planner.updateNonWalkableCoordinates(toCoordinate(x, y), nonWalkableCoordinates)
+        walkpoints = planner.getWalkpoints(toCoordinate(x, y))
+        shortestCost = getShortestCost(x, y, 50, 20, nonWalkableCoordinates)
+        if shortestCost == unreachableDistance:
+            assert walkpoints == []
+            continue
+        assert getWalkpointsCost(toCoordinate(x, y), walkpoints, nonWalkableCoordinates) == shortestCost
+        if len(walkpoints) > 1:
+            (x, y) = (walkpoints[0][0] - 31744, walkpoints[0][1] - 30976)
+    assert planner.getMetrics()['replansPerSecond'] > 0
+    assert planner.getMetrics()['meanRepairCost'] > 0
+
+
+def test_should_return_empty_walkpoints_when_player_is_trapped():
+    planner = DStarLitePlanner(toCoordinate(50, 20), region, costs, 70)
+    nonWalkableCoordinates = [toCoordinate(30, 4), toCoordinate(30, 3)]
+    planner.updateNonWalkableCoordinates(toCoordinate(10, 20), nonWalkableCoordinates)
+    assert getWalkpointsCost(toCoordinate(10, 20), planner.getWalkpoints(toCoordinate(10, 20)), nonWalkableCoordinates) == getShortestCost(10, 20, 50, 20, nonWalkableCoordinates)
+    blockedCoordinates = planner.updateNonWalkableCoordinates(toCoordinate(10, 20), nonWalkableCoordinates + [toCoordinate(30, 2), toCoordinate(30, 1), toCoordinate(30, 0)])
+    assert blockedCoordinates == {toCoordinate(30, 2), toCoordinate(30, 1), toCoordinate(30, 0)}
+    assert planner.getWalkpoints(toCoordinate(10, 20)) == []
+    planner.updateNonWalkableCoordinates(toCoordinate(10, 20), [])
+    assert planner.getWalkpoints(toCoordinate(10, 20))[-1] == list(toCoordinate(50, 20))
+
+
+def test_should_start_from_flow_field_distances():
+    distances = np.minimum(getGridDistancesToGoal(costs, 50, 20), np.iinfo(np.uint32).max).astype(np.uint32)
+    planner = DStarLitePlanner(toCoordinate(50, 20), region, costs, 70, distances=distances)
+    planner.updateNonWalkableCoordinates(toCoordinate(10, 20), [])
+    assert planner.getMetrics()['meanRepairCost'] == 0
+    walkpoints = planner.getWalkpoints(toCoordinate(10, 20))
+    assert getWalkpointsCost(toCoordinate(10, 20), walkpoints, []) == distances[20, 10]
+    nonWalkableCoordinates = [toCoordinate(30, 4), toCoordinate(29, 4)]
+    planner.updateNonWalkableCoordinates(toCoordinate(10, 20), nonWalkableCoordinates)
+    walkpoints = planner.getWalkpoints(toCoordinate(10, 20))
+    assert getWalkpointsCost(toCoordinate(10, 20), walkpoints, nonWalkableCoordinates) == getShortestCost(10, 20, 50, 20, nonWalkableCoordinates)
@@ -0,0 +1,100 @@
+import numpy as np
+from src.repositories.radar.flowFields import buildFlowField, followFlowField, getFlowFieldRegion, getFlowFieldsGoalsRegions, getFlowFieldWalkpoints, getWalkWaypointsGoals, unreachableFlowDistance
+from src.repositories.radar.routes import getGridDistances, getSqmsCosts
+from src.repositories.radar.walkableSqms import packWalkableFloorsSqms
+
+
+floorHeight = 40
+floorWidth = 64
+walkableFloorsSqms = np.ones((1, floorHeight, floorWidth), dtype=np.uint8)
+# a wall with a gap at its top
+walkableFloorsSqms[0, 5:, 30] = 0
+floorsPathsSqms = np.full((1, floorHeight, floorWidth), 100, dtype=np.uint8)
+floorsPathsSqms[0, 0:3, :] = 200
+packedWalkableFloorsSqms = packWalkableFloorsSqms(walkableFloorsSqms)
+costs = getSqmsCosts(walkableFloorsSqms[0], floorsPathsSqms[0], 70)
+region = (0, 0, floorWidth, floorHeight)
+
+
+def toCoordinate(x, y):
+    return (x + 31744, y + 30976, 0)
+
+
+def assertIsWalkableRoute(coordinate, walkpoints, nonWalkableCoordinates=[]):
+    previousCoordinate = coordinate
+    for walkpoint in walkpoints:
+        assert abs(walkpoint[0] - previousCoordinate[0]) + abs(walkpoint[1] - previousCoordinate[1]) == 1
+        assert walkableFloorsSqms[0, walkpoint[1] - 30976, walkpoint[0] - 31744] == 1
+        assert tuple(walkpoint) not in nonWalkableCoordinates
+        previousCoordinate = walkpoint
+
+
+def test_should_return_distances_to_goal():
+    distances = buildFlowField(packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(50, 20), region, 70)
+    assert distances.dtype == np.uint32
+    assert distances[20, 50] == 0
+    assert distances[20, 51] == 100
+    assert distances[20, 30] == unreachableFlowDistance
+    # walking from (10, 20) costs the same as walking to (10, 20) from the goal, minus its own sqm plus the goal sqm
+    assert distances[20, 10] == getGridDistances(costs, 50, 20)[20, 10] - costs[20, 10] + costs[20, 50]
+
+
+def test_should_follow_flow_field_to_goal():
+    distances = buildFlowField(packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(50, 20), region, 70)
+    path = followFlowField(distances, 10, 20)
+    assert tuple(path[-1]) == (50, 20)
+    assert (30, 4) in [tuple(step) for step in path]
+
+
+def test_should_return_walkpoints_to_goal():
+    distances = buildFlowField(packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(50, 20), region, 70)
+    walkpoints = getFlowFieldWalkpoints(distances, region, packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(10, 20), [], 70)
+    assertIsWalkableRoute(toCoordinate(10, 20), walkpoints)
+    assert walkpoints[-1] == list(toCoordinate(50, 20))
+    walkpointsCost = sum(int(costs[walkpoint[1] - 30976, walkpoint[0] - 31744]) for walkpoint in walkpoints)
+    assert walkpointsCost == distances[20, 10]
+
+
+def test_should_walk_around_creatures_close_to_the_player():
+    distances = buildFlowField(packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(50, 20), region, 70)
+    nonWalkableCoordinates = [toCoordinate(29, 4), toCoordinate(29, 3), toCoordinate(28, 5)]
+    walkpoints = getFlowFieldWalkpoints(distances, region, packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(27, 6), nonWalkableCoordinates, 70)
+    assertIsWalkableRoute(toCoordinate(27, 6), walkpoints, nonWalkableCoordinates)
+    assert walkpoints[-1] == list(toCoordinate(50, 20))
+
+
+def test_should_return_empty_walkpoints_when_player_is_trapped():
+    distances = buildFlowField(packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(50, 20), region, 70)
+    nonWalkableCoordinates = [toCoordinate(9, 20), toCoordinate(11, 20), toCoordinate(10, 19), toCoordinate(10, 21)]
+    walkpoints = getFlowFieldWalkpoints(distances, region, packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(10, 20), nonWalkableCoordinates, 70)
+    assert walkpoints == []
+
+
+def test_should_pad_region_around_goal_and_previous_coordinate():
+    region = getFlowFieldRegion((31900, 31100, 7), (31800, 31120, 7), 2048, 2560)
+    assert region == (56 - 53, 124 - 54, 100 + 107, 20 + 109)
+
+
+def test_should_ignore_previous_coordinate_of_another_floor():
+    region = getFlowFieldRegion((31900, 31100, 7), (31800, 31120, 6), 2048, 2560)
+    assert region == (156 - 53, 124 - 54, 107, 109)
+
+
+def test_should_return_goals_of_walk_waypoints_only():
+    waypoints = [
+        {'type': 'walk', 'coordinate': [1, 2, 7]},
+        {'type': 'useRope', 'coordinate': [3, 4, 7]},
+        {'type': 'walk', 'coordinate': [5, 6, 6]},
+    ]
+    (goals, previousCoordinates) = getWalkWaypointsGoals(waypoints)
+    assert goals == [(1, 2, 7), (5, 6, 6)]
+    assert previousCoordinates == [(5, 6, 6), (3, 4, 7)]
+
+
+def test_should_merge_regions_of_goals_walked_from_several_waypoints():
+    goals = [(31900, 31100, 7), (31950, 31100, 7), (31900, 31100, 7)]
+    previousCoordinates = [(31800, 31120, 7), (31900, 31100, 7), (31950, 31040, 7)]
+    (goalsCoordinates, regions) = getFlowFieldsGoalsRegions(goals, previousCoordinates, 2048, 2560)
+    assert goalsCoordinates == [(31900, 31100, 7), (31950, 31100, 7)]
+    assert regions[0] == (56 - 53, 64 - 54, 150 + 107, 80 + 109)
+    assert regions[1] == getFlowFieldRegion((31950, 31100, 7), (31900, 31100, 7), 2048, 2560)
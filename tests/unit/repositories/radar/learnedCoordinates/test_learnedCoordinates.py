@@ -0,0 +1,49 @@
+import numpy as np
+from src.repositories.radar.learnedCoordinates import getLearnedCoordinate, learnCoordinate, openLearnedCoordinates, probesCount
+
+
+def test_should_return_None_when_hash_was_never_learned(tmp_path):
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', 64)
+    assert getLearnedCoordinate(learnedCoordinates, 123, 1) is None
+
+def test_should_persist_learned_coordinates_between_sessions(tmp_path):
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', 64)
+    learnCoordinate(learnedCoordinates, 2 ** 64 - 1, (33000, 32000, 7), 10)
+    learnedCoordinates.flush()
+    del learnedCoordinates
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', 128)
+    assert len(learnedCoordinates) == 64
+    assert getLearnedCoordinate(learnedCoordinates, 2 ** 64 - 1, 11) == (33000, 32000, 7)
+    assert learnedCoordinates['usedAt'].max() == 11
+
+def test_should_stop_serving_a_hash_seen_at_another_coordinate(tmp_path):
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', 64)
+    learnCoordinate(learnedCoordinates, 5, (33000, 32000, 7), 1)
+    learnCoordinate(learnedCoordinates, 5, (33001, 32000, 7), 2)
+    assert getLearnedCoordinate(learnedCoordinates, 5, 3) is None
+    learnCoordinate(learnedCoordinates, 5, (33000, 32000, 7), 4)
+    assert getLearnedCoordinate(learnedCoordinates, 5, 5) is None
+    assert np.count_nonzero(learnedCoordinates['usedAt']) == 1
+
+def test_should_keep_serving_a_hash_learned_again_at_the_same_coordinate(tmp_path):
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', 64)
+    learnCoordinate(learnedCoordinates, 5, (33000, 32000, 7), 1)
+    learnCoordinate(learnedCoordinates, 5, (33000, 32000, 7), 2)
+    assert getLearnedCoordinate(learnedCoordinates, 5, 3) == (33000, 32000, 7)
+
+def test_should_recreate_learned_coordinates_written_without_ambiguous_hashes(tmp_path):
+    legacyLearnedCoordinate = np.dtype([('hash', np.uint64), ('x', np.uint16), ('y', np.uint16), ('z', np.uint16), ('usedAt', np.uint32)])
+    np.save(f'{tmp_path}/learned.npy', np.ones(64, dtype=legacyLearnedCoordinate))
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', 32)
+    assert len(learnedCoordinates) == 32
+    assert getLearnedCoordinate(learnedCoordinates, 1, 1) is None
+
+def test_should_evict_least_recently_used_coordinate_when_slots_are_full(tmp_path):
+    learnedCoordinates = openLearnedCoordinates(f'{tmp_path}/learned.npy', probesCount)
+    for index in range(probesCount):
+        learnCoordinate(learnedCoordinates, index, (33000 + index, 32000, 7), 10 + index)
+    getLearnedCoordinate(learnedCoordinates, 0, 100)
+    learnCoordinate(learnedCoordinates, probesCount, (34000, 32000, 7), 101)
+    assert getLearnedCoordinate(learnedCoordinates, 0, 102) == (33000, 32000, 7)
+    assert getLearnedCoordinate(learnedCoordinates, 1, 103) is None
+    assert getLearnedCoordinate(learnedCoordinates, probesCount, 104) == (34000, 32000, 7)
@@ -0,0 +1,20 @@
+import numpy as np
+from src.repositories.radar.radarImagesCoordinates import getRadarImageCoordinate, openRadarImagesCoordinates
+from src.repositories.radar.typings import CoordinateHash
+
+
+def test_should_return_empty_index_when_file_does_not_exist(tmp_path):
+    radarImagesCoordinates = openRadarImagesCoordinates(f'{tmp_path}/radarImagesCoordinates.npy')
+    assert len(radarImagesCoordinates) == 0
+    assert getRadarImageCoordinate(radarImagesCoordinates, 10) is None
+
+def test_should_get_coordinate_by_hash_from_memory_mapped_file(tmp_path):
+    records = np.array([(3, 33000, 32000, 7), (10, 33001, 32001, 6), (2 ** 64 - 1, 33002, 32002, 5)], dtype=CoordinateHash)
+    np.save(f'{tmp_path}/radarImagesCoordinates.npy', records)
+    radarImagesCoordinates = openRadarImagesCoordinates(f'{tmp_path}/radarImagesCoordinates.npy')
+    assert isinstance(radarImagesCoordinates, np.memmap)
+    assert getRadarImageCoordinate(radarImagesCoordinates, 3) == (33000, 32000, 7)
+    assert getRadarImageCoordinate(radarImagesCoordinates, 10) == (33001, 32001, 6)
+    assert getRadarImageCoordinate(radarImagesCoordinates, 2 ** 64 - 1) == (33002, 32002, 5)
+    assert getRadarImageCoordinate(radarImagesCoordinates, 4) is None
+    assert getRadarImageCoordinate(radarImagesCoordinates, 11) is None
@@ -0,0 +1,101 @@
+import numpy as np
+from src.repositories.radar.routes import buildFloorRoutesGraph, getBorderPortals, getGridDistances, getRoute, getSqmsCosts, mergeRoutesGraphs
+from src.repositories.radar.walkableSqms import packWalkableFloorsSqms
+
+
+floorHeight = 64
+floorWidth = 96
+walkableFloorsSqms = np.ones((2, floorHeight, floorWidth), dtype=np.uint8)
+# a wall crossing the first floor with a single gap at its bottom
+walkableFloorsSqms[0, :, 40] = 0
+walkableFloorsSqms[0, 60, 40] = 1
+# an enclosed room
+walkableFloorsSqms[0, 20:25, 70] = 0
+walkableFloorsSqms[0, 20:25, 74] = 0
+walkableFloorsSqms[0, 20, 70:75] = 0
+walkableFloorsSqms[0, 24, 70:75] = 0
+# stairs linking both floors
+walkableFloorsSqms[:, 10, 10] = 0
+floorsChangesSqms = {0: np.zeros((floorHeight, floorWidth), dtype=np.bool_), 1: np.zeros((floorHeight, floorWidth), dtype=np.bool_)}
+floorsChangesSqms[0][10, 10] = True
+floorsChangesSqms[1][10, 10] = True
+floorsPathsSqms = np.full((2, floorHeight, floorWidth), 100, dtype=np.uint8)
+floorsPathsSqms[0, 30:50, 0:30] = 200
+packedWalkableFloorsSqms = packWalkableFloorsSqms(walkableFloorsSqms)
+floorsCosts = {floorLevel: getSqmsCosts(walkableFloorsSqms[floorLevel], floorsPathsSqms[floorLevel], 70) for floorLevel in range(2)}
+routesGraph = mergeRoutesGraphs([buildFloorRoutesGraph(floorLevel, floorsCosts, floorsChangesSqms)
+                                for floorLevel in range(2)], floorHeight, floorWidth, 2, 70)
+
+
+def toCoordinate(x, y, z):
+    return (x + 31744, y + 30976, z)
+
+
+def getRouteCost(route, z):
+    return sum(int(floorsCosts[z][coordinate[1] - 30976, coordinate[0] - 31744]) for coordinate in route)
+
+
+def assertIsWalkableRoute(coordinate, route):
+    previousCoordinate = coordinate
+    for routeCoordinate in route:
+        assert abs(routeCoordinate[0] - previousCoordinate[0]) + abs(routeCoordinate[1] - previousCoordinate[1]) == 1
+        assert routeCoordinate[2] == previousCoordinate[2]
+        assert walkableFloorsSqms[routeCoordinate[2], routeCoordinate[1] - 30976, routeCoordinate[0] - 31744] == 1
+        previousCoordinate = routeCoordinate
+
+
+def test_should_return_one_portal_in_the_middle_of_short_openings():
+    costs = np.array([0, 1, 1, 1, 0, 0, 0, 0])
+    otherCosts = np.array([1, 1, 1, 1, 1, 1, 1, 0])
+    assert getBorderPortals(costs, otherCosts) == [2]
+
+
+def test_should_return_two_portals_at_the_ends_of_long_openings():
+    costs = np.array([1, 1, 1, 1, 1, 1, 1, 0])
+    otherCosts = np.array([1, 1, 1, 1, 1, 1, 1, 1])
+    assert getBorderPortals(costs, otherCosts) == [0, 6]
+
+
+def test_should_return_optimal_route_inside_a_cluster():
+    coordinate = toCoordinate(2, 2, 0)
+    goalCoordinate = toCoordinate(20, 8, 0)
+    route = getRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, coordinate, goalCoordinate)
+    assertIsWalkableRoute(coordinate, route)
+    assert route[-1] == goalCoordinate
+    assert getRouteCost(route, 0) == getGridDistances(floorsCosts[0], 2, 2)[8, 20]
+
+
+def test_should_return_route_through_the_gap_of_a_wall_far_away():
+    coordinate = toCoordinate(5, 20, 0)
+    goalCoordinate = toCoordinate(90, 5, 0)
+    route = getRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, coordinate, goalCoordinate, allowFloorChanges=False)
+    assertIsWalkableRoute(coordinate, route)
+    assert route[-1] == goalCoordinate
+    assert toCoordinate(40, 60, 0) in route
+    assert getRouteCost(route, 0) <= getGridDistances(floorsCosts[0], 5, 20)[5, 90] * 1.1
+
+
+def test_should_return_route_through_floor_change_when_goal_is_in_another_floor():
+    coordinate = toCoordinate(5, 5, 0)
+    goalCoordinate = toCoordinate(80, 50, 1)
+    route = getRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, coordinate, goalCoordinate)
+    floorChangeIndex = route.index(toCoordinate(10, 10, 0))
+    assertIsWalkableRoute(coordinate, route[:floorChangeIndex])
+    assertIsWalkableRoute(route[floorChangeIndex + 1], route[floorChangeIndex + 2:])
+    assert route[floorChangeIndex + 1][2] == 1
+    assert route[-1] == goalCoordinate
+
+
+def test_should_return_empty_route_when_floor_changes_are_not_allowed():
+    route = getRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(5, 5, 0), toCoordinate(80, 50, 1), allowFloorChanges=False)
+    assert route == []
+
+
+def test_should_return_empty_route_when_goal_is_not_reachable():
+    route = getRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(5, 5, 0), toCoordinate(72, 22, 0))
+    assert route == []
+
+
+def test_should_return_empty_route_when_goal_is_not_walkable():
+    route = getRoute(routesGraph, packedWalkableFloorsSqms, floorsPathsSqms, toCoordinate(5, 5, 0), toCoordinate(40, 5, 0))
+    assert route == []
@@ -0,0 +1,121 @@
+import numpy as np
+from src.repositories.radar.tracker import CoordinateTracker
+
+
+screenshot = np.zeros((10, 10), dtype=np.uint8)
+
+
+def mockRadar(mocker, hashedCoordinate=None, floorLevel=7):
+    mocker.patch('src.repositories.radar.tracker.getRadarToolsPosition', return_value=(0, 0, 1, 1))
+    mocker.patch('src.repositories.radar.tracker.getRadarImage', return_value=np.zeros((109, 106), dtype=np.uint8))
+    mocker.patch('src.repositories.radar.tracker.getHashedCoordinate', return_value=hashedCoordinate)
+    mocker.patch('src.repositories.radar.tracker.getFloorLevel', return_value=floorLevel)
+    mocker.patch('src.repositories.radar.tracker.getLearnedCoordinates')
+    mocker.patch('src.repositories.radar.tracker.learnCoordinate')
+
+
+def test_should_accept_first_coordinate_found_on_floor(mocker):
+    mockRadar(mocker)
+    locateOnFloorSpy = mocker.patch('src.repositories.radar.tracker.locateOnFloor', return_value=(33000, 32000, 7))
+    tracker = CoordinateTracker()
+    assert tracker.track(screenshot, 0.1) == (33000, 32000, 7)
+    locateOnFloorSpy.assert_called_once()
+
+def test_should_verify_walkpoint_before_widening_the_search(mocker):
+    mockRadar(mocker)
+    locateAroundCoordinateSpy = mocker.patch(
+        'src.repositories.radar.tracker.locateAroundCoordinate', return_value=(33001, 32000, 7))
+    locateOnFloorSpy = mocker.patch('src.repositories.radar.tracker.locateOnFloor')
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 0)
+    assert tracker.track(screenshot, 0.1, walkpoint=(33001, 32000, 7)) == (33001, 32000, 7)
+    assert locateAroundCoordinateSpy.call_count == 1
+    assert locateAroundCoordinateSpy.call_args[0][1:] == ((33001, 32000, 7), 1)
+    locateOnFloorSpy.assert_not_called()
+    assert tracker.step == (1, 0)
+
+def test_should_predict_next_coordinate_from_last_step(mocker):
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 0)
+    tracker.accept((33001, 32000, 7), 0)
+    predictedCoordinates = tracker.getPredictedCoordinates(0.25, 0.1)
+    assert predictedCoordinates == [(33003, 32000, 7), (33001, 32000, 7)]
+
+def test_should_reject_impossible_jump_while_the_same_radar_image_repeats(mocker):
+    mockRadar(mocker)
+    mocker.patch('src.repositories.radar.tracker.locateAroundCoordinate', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.locateOnFloor', return_value=(33100, 32000, 7))
+    mocker.patch('src.repositories.radar.tracker.time', return_value=100.1)
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    for _ in range(5):
+        assert tracker.track(screenshot, 0.1) is None
+    assert tracker.coordinate == (33000, 32000, 7)
+
+def test_should_accept_jump_once_different_radar_images_agree_on_it(mocker):
+    mockRadar(mocker)
+    mocker.patch('src.repositories.radar.tracker.hashit', side_effect=[1, 2, 3])
+    mocker.patch('src.repositories.radar.tracker.locateAroundCoordinate', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.locateOnFloor', side_effect=[(33100, 32000, 7), (33101, 32000, 7), (33102, 32000, 7)])
+    mocker.patch('src.repositories.radar.tracker.time', side_effect=[100.1, 100.2, 100.3])
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    assert tracker.track(screenshot, 0.1) is None
+    assert tracker.track(screenshot, 0.1) is None
+    assert tracker.track(screenshot, 0.1) == (33102, 32000, 7)
+
+def test_should_restart_jump_confirmation_when_candidates_are_not_reachable_from_each_other(mocker):
+    mockRadar(mocker)
+    mocker.patch('src.repositories.radar.tracker.hashit', side_effect=[1, 2, 3])
+    mocker.patch('src.repositories.radar.tracker.locateAroundCoordinate', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.locateOnFloor', side_effect=[(33100, 32000, 7), (33200, 32000, 7), (33201, 32000, 7)])
+    mocker.patch('src.repositories.radar.tracker.time', side_effect=[100.1, 100.2, 100.3])
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    for _ in range(3):
+        assert tracker.track(screenshot, 0.1) is None
+
+def test_should_accept_jump_when_hash_and_floor_correlation_agree(mocker):
+    mockRadar(mocker, hashedCoordinate=(33100, 32000, 7))
+    mocker.patch('src.repositories.radar.tracker.locateAroundCoordinate', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.locateOnFloor', return_value=(33100, 32000, 7))
+    mocker.patch('src.repositories.radar.tracker.time', return_value=100.1)
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    assert tracker.track(screenshot, 0.1) == (33100, 32000, 7)
+
+def test_should_search_around_the_player_when_the_hashed_coordinate_is_unreachable(mocker):
+    mockRadar(mocker, hashedCoordinate=(33000, 32100, 7))
+    locateAroundCoordinateSpy = mocker.patch(
+        'src.repositories.radar.tracker.locateAroundCoordinate', return_value=(33000, 32000, 7))
+    mocker.patch('src.repositories.radar.tracker.time', return_value=100.1)
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    assert tracker.track(screenshot, 0.1) == (33000, 32000, 7)
+    locateAroundCoordinateSpy.assert_called_once()
+
+def test_should_never_accept_a_repeated_wrong_hash_match(mocker):
+    mockRadar(mocker, hashedCoordinate=(33000, 32100, 7))
+    mocker.patch('src.repositories.radar.tracker.locateAroundCoordinate', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.locateOnFloor', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.time', return_value=100.1)
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    for _ in range(5):
+        assert tracker.track(screenshot, 0.1) is None
+    assert tracker.coordinate == (33000, 32000, 7)
+
+def test_should_reject_impossible_jump_from_hashed_coordinate(mocker):
+    mockRadar(mocker, hashedCoordinate=(33000, 32100, 7))
+    mocker.patch('src.repositories.radar.tracker.locateAroundCoordinate', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.locateOnFloor', return_value=None)
+    mocker.patch('src.repositories.radar.tracker.time', return_value=100.1)
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    assert tracker.track(screenshot, 0.1) is None
+
+def test_should_accept_reachable_coordinate_on_another_floor(mocker):
+    tracker = CoordinateTracker()
+    tracker.accept((33000, 32000, 7), 100)
+    assert tracker.isReachable((33001, 32000, 6), 100.05, 0.1) is True
+    assert tracker.isReachable((33010, 32000, 6), 100.05, 0.1) is False
@@ -0,0 +1,41 @@
+import numpy as np
+from src.repositories.radar.walkableSqms import getWalkableSqmsWindow, isSqmWalkable, packWalkableFloorsSqms
+
+
+walkableFloorsSqms = np.random.default_rng(7).integers(0, 2, size=(2, 20, 24), dtype=np.uint8)
+packedWalkableFloorsSqms = packWalkableFloorsSqms(walkableFloorsSqms)
+
+
+def test_should_pack_8_sqms_per_byte():
+    assert packedWalkableFloorsSqms.shape == (2, 20, 3)
+    assert packedWalkableFloorsSqms.dtype == np.uint8
+
+
+def test_should_return_same_walkability_as_unpacked_floors():
+    for floorLevel in range(2):
+        for y in range(20):
+            for x in range(24):
+                assert isSqmWalkable(packedWalkableFloorsSqms, x, y, floorLevel) == (
+                    walkableFloorsSqms[floorLevel, y, x] == 1)
+
+
+def test_should_return_False_when_sqm_is_outside_of_floor():
+    walkableFloorsSqms = np.ones((1, 4, 8), dtype=np.uint8)
+    packedWalkableFloorsSqms = packWalkableFloorsSqms(walkableFloorsSqms)
+    assert isSqmWalkable(packedWalkableFloorsSqms, -1, 0, 0) == False
+    assert isSqmWalkable(packedWalkableFloorsSqms, 8, 0, 0) == False
+    assert isSqmWalkable(packedWalkableFloorsSqms, 0, 4, 0) == False
+
+
+def test_should_return_window_equal_to_unpacked_floor_slice():
+    window = getWalkableSqmsWindow(packedWalkableFloorsSqms, 5, 3, 1, 15, 11)
+    assert window.dtype == np.uint8
+    assert np.array_equal(window, walkableFloorsSqms[1, 3:14, 5:20])
+
+
+def test_should_fill_window_outside_of_floor_with_non_walkable_sqms():
+    walkableFloorsSqms = np.ones((1, 4, 8), dtype=np.uint8)
+    packedWalkableFloorsSqms = packWalkableFloorsSqms(walkableFloorsSqms)
+    window = getWalkableSqmsWindow(packedWalkableFloorsSqms, -1, -1, 0, 3, 3)
+    expectedWindow = np.array([[0, 0, 0], [0, 1, 1], [0, 1, 1]], dtype=np.uint8)
+    assert np.array_equal(window, expectedWindow)
@@ -0,0 +1,47 @@
+import numpy as np
+import pathlib
+from src.repositories.skills.core import getValuesCount
+from src.repositories.skills.locators import getSkillsIconPosition
+from src.repositories.skills import snapshot
+from src.repositories.skills.snapshot import SkillsReader
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+screenshotsPath = f'{currentPath}/../../actionBar/core'
+healingScreenshot = loadFromRGBToGray(f'{screenshotsPath}/hasHealingCooldown/withHealingCooldown.png')
+supportScreenshot = loadFromRGBToGray(f'{screenshotsPath}/hasSupportCooldown/withSupportCooldown.png')
+
+
+def test_should_read_every_skills_row_of_recorded_screenshots():
+    reader = SkillsReader()
+    assert reader.read(healingScreenshot).tolist() == (8880, 1000, 11407, 771, 0, 2520)
+    assert reader.read(supportScreenshot).tolist() == (9770, 501, 11410, 985, 0, 2520)
+
+
+def test_should_return_None_when_the_skills_icon_is_not_found(mocker):
+    mocker.patch('src.repositories.skills.snapshot.getSkillsIconPosition', return_value=None)
+    assert SkillsReader().read(healingScreenshot) is None
+
+
+def test_should_only_decode_rows_changed_since_the_previous_read(mocker):
+    reader = SkillsReader()
+    reader.read(healingScreenshot)
+    decodeSkillsRowsSpy = mocker.spy(snapshot, 'decodeSkillsRows')
+    skillsSnapshot = reader.read(healingScreenshot.copy())
+    decodeSkillsRowsSpy.assert_not_called()
+    assert skillsSnapshot['hp'] == 8880
+    # the support screenshot has the same stamina and food rows
+    skillsSnapshot = reader.read(supportScreenshot)
+    np.testing.assert_array_equal(decodeSkillsRowsSpy.call_args[0][3], [True, True, True, True, False, False])
+    assert skillsSnapshot['mana'] == 501
+
+
+def test_should_decode_values_as_the_digits_hashes():
+    reader = SkillsReader()
+    (x, y, _, _) = getSkillsIconPosition(healingScreenshot)
+    for hpOffset in [0, 5, 37]:
+        screenshot = healingScreenshot.copy()
+        # shifted digits are not numbers of the hashes table
+        screenshot[y + 90:y + 98, x + 6 + 122:x + 6 + 144] = np.roll(screenshot[y + 90:y + 98, x + 6 + 122:x + 6 + 144], hpOffset, axis=1)
+        assert reader.read(screenshot)['hp'] == getValuesCount(screenshot, (x + 6, y + 90, 0, 0))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from src.utils.assetsBundle import createAssetsBundle, openAssetsBundle, pageSize
+
+
+def test_should_return_None_when_bundle_does_not_exist(tmp_path):
+    assert openAssetsBundle(f'{tmp_path}/assets.bin') is None
+
+
+def test_should_read_arrays_written_by_createAssetsBundle(tmp_path):
+    path = f'{tmp_path}/assets.bin'
+    floors = np.arange(3 * 5 * 7, dtype=np.uint8).reshape(3, 5, 7)
+    hashes = np.array([1, 2, 3], dtype=np.uint64)
+    bundle = createAssetsBundle(path, {
+        'floors': (floors.shape, 'uint8'),
+        'hashes': (hashes.shape, 'uint64'),
+    })
+    bundle['floors'][:] = floors
+    bundle['hashes'][:] = hashes
+    for asset in bundle.values():
+        asset.flush()
+    del bundle
+    openedBundle = openAssetsBundle(path)
+    assert np.array_equal(openedBundle['floors'], floors)
+    assert np.array_equal(openedBundle['hashes'], hashes)
+    assert openedBundle['hashes'].dtype == np.uint64
+
+
+def test_should_create_the_folder_of_a_bundle(tmp_path):
+    path = f'{tmp_path}/npys/assets.bin'
+    createAssetsBundle(path, {'floors': ((2, 2), 'uint8')})
+    assert openAssetsBundle(path)['floors'].shape == (2, 2)
+
+
+def test_should_align_every_array_to_a_page(tmp_path):
+    path = f'{tmp_path}/assets.bin'
+    bundle = createAssetsBundle(path, {
+        'first': ((3,), 'uint8'),
+        'second': ((3,), 'uint8'),
+    })
+    assert bundle['first'].offset % pageSize == 0
+    assert bundle['second'].offset % pageSize == 0
+    assert bundle['second'].offset - bundle['first'].offset == pageSize
+
+
+def test_should_open_bundle_as_read_only(tmp_path):
+    path = f'{tmp_path}/assets.bin'
+    createAssetsBundle(path, {'floors': ((2, 2), 'uint8')})
+    openedBundle = openAssetsBundle(path)
+    with pytest.raises(ValueError):
+        openedBundle['floors'][0, 0] = 1
@@ -0,0 +1,46 @@
+import numpy as np
+import src.utils.core as coreUtils
+from src.utils.frameSources import ReplayFrameSource
+
+
+def test_should_cacheByFrame_compute_once_per_frame_and_arguments():
+    calls = []
+
+    def getValue(screenshot, slot):
+        calls.append(slot)
+        return int(screenshot[0, 0]) + slot
+    cachedGetValue = coreUtils.cacheByFrame(getValue)
+    coreUtils.clearFrameCache()
+    coreUtils.resetFrameCacheStats()
+    screenshot = np.full((2, 2), 10, dtype=np.uint8)
+    assert cachedGetValue(screenshot, 1) == 11
+    assert cachedGetValue(screenshot, 1) == 11
+    assert cachedGetValue(screenshot, 2) == 12
+    assert calls == [1, 2]
+    assert coreUtils.getFrameCacheStats()[f'{__name__}.getValue'] == {'hits': 1, 'misses': 2}
+    assert cachedGetValue(np.full((2, 2), 20, dtype=np.uint8), 1) == 21
+    assert calls == [1, 2, 1]
+
+def test_should_cacheByFrame_recompute_after_frame_cache_is_cleared():
+    calls = []
+
+    def getValue(screenshot):
+        calls.append(1)
+        return int(screenshot[0, 0])
+    cachedGetValue = coreUtils.cacheByFrame(getValue)
+    screenshot = np.zeros((2, 2), dtype=np.uint8)
+    assert cachedGetValue(screenshot) == 0
+    screenshot[0, 0] = 5
+    coreUtils.clearFrameCache()
+    assert cachedGetValue(screenshot) == 5
+    assert len(calls) == 2
+
+def test_should_getScreenshot_drop_frame_cache_when_a_new_frame_is_grabbed(tmp_path):
+    np.save(f'{tmp_path}/session.npy', np.zeros((1, 2, 2), dtype=np.uint8))
+    coreUtils.setFrameSource(ReplayFrameSource(f'{tmp_path}/session.npy'))
+    try:
+        coreUtils.frameCache[('getValue', 0, ())] = (None, 1)
+        coreUtils.getScreenshot()
+        assert len(coreUtils.frameCache) == 0
+    finally:
+        coreUtils.setFrameSource(None)
@@ -0,0 +1,107 @@
+import numpy as np
+import src.utils.core as coreUtils
+from src.utils.frameSources import DxcamFrameSource, ReplayFrameSource
+from src.utils.image import save
+
+
+def makeFrames(count: int) -> np.ndarray:
+    return np.array([np.full((4, 6), index, dtype=np.uint8) for index in range(count)], dtype=np.uint8)
+
+
+# desktop duplication returning a BGRA frame per grab, cropped to the requested region
+class FakeCamera:
+    def __init__(self, frames):
+        self.frames = frames
+        self.frameIndex = 0
+
+    def grab(self, region=None):
+        frame = np.repeat(self.frames[self.frameIndex][:, :, None], 4, axis=2)
+        self.frameIndex += 1
+        if region is None:
+            return frame
+        return frame[region[1]:region[3], region[0]:region[2]]
+
+
+def makeDxcamFrameSource(mocker, frames) -> DxcamFrameSource:
+    mocker.patch.dict('sys.modules', {'dxcam': mocker.Mock(create=mocker.Mock(return_value=FakeCamera(frames)))})
+    return DxcamFrameSource(useRegionsOfInterest=True)
+
+
+def test_should_stream_frames_from_a_directory_of_npy_and_png_files(tmp_path):
+    frames = makeFrames(3)
+    np.save(f'{tmp_path}/frame-0.npy', frames[0])
+    save(frames[1], f'{tmp_path}/frame-1.png')
+    np.save(f'{tmp_path}/frame-2.npy', frames[2])
+    (tmp_path / 'notes.txt').write_text('ignored')
+    frameSource = ReplayFrameSource(str(tmp_path))
+    assert len(frameSource) == 3
+    for frame in frames:
+        np.testing.assert_array_equal(frameSource.grab(), frame)
+    assert frameSource.grab() is None
+
+def test_should_stream_frames_from_a_memory_mapped_frames_file(tmp_path):
+    frames = makeFrames(2)
+    np.save(f'{tmp_path}/session.npy', frames)
+    frameSource = ReplayFrameSource(f'{tmp_path}/session.npy')
+    firstFrame = frameSource.grab()
+    np.testing.assert_array_equal(firstFrame, frames[0])
+    firstFrame[0, 0] = 255
+    np.testing.assert_array_equal(frameSource.grab(), frames[1])
+    frameSource.rewind()
+    np.testing.assert_array_equal(frameSource.grab(), frames[0])
+
+def test_should_restart_from_first_frame_when_loop_is_enabled(tmp_path):
+    frames = makeFrames(2)
+    np.save(f'{tmp_path}/session.npy', frames)
+    frameSource = ReplayFrameSource(f'{tmp_path}/session.npy', loop=True)
+    grabbedFrames = [frameSource.grab()[0, 0] for _ in range(5)]
+    assert grabbedFrames == [0, 1, 0, 1, 0]
+
+def test_should_wait_between_frames_when_fps_is_set(tmp_path, mocker):
+    frames = makeFrames(2)
+    np.save(f'{tmp_path}/session.npy', frames)
+    sleepSpy = mocker.patch('src.utils.frameSources.sleep')
+    frameSource = ReplayFrameSource(f'{tmp_path}/session.npy', fps=10)
+    frameSource.grab()
+    sleepSpy.assert_not_called()
+    frameSource.grab()
+    sleepSpy.assert_called_once()
+    assert 0 < sleepSpy.call_args[0][0] <= 0.1
+
+def test_should_getScreenshot_return_latest_screenshot_when_frame_source_has_no_frame(tmp_path):
+    frames = makeFrames(1)
+    np.save(f'{tmp_path}/session.npy', frames)
+    coreUtils.setFrameSource(ReplayFrameSource(f'{tmp_path}/session.npy'))
+    try:
+        np.testing.assert_array_equal(coreUtils.getScreenshot(), frames[0])
+        np.testing.assert_array_equal(coreUtils.getScreenshot(), frames[0])
+    finally:
+        coreUtils.setFrameSource(None)
+
+
+def test_should_keep_pixels_outside_the_regions_from_the_latest_full_frame(mocker):
+    frames = np.array([np.full((4, 6), 10 * (index + 1), dtype=np.uint8) for index in range(4)], dtype=np.uint8)
+    mocker.patch('src.utils.frameSources.consumeRegionsToGrab', side_effect=[[(0, 0, 2, 2)], [(0, 0, 2, 2)], [(4, 2, 2, 2)]])
+    frameSource = makeDxcamFrameSource(mocker, frames)
+    np.testing.assert_array_equal(frameSource.grab(), frames[0])
+    for frameIndex in range(1, 3):
+        frame = frameSource.grab().copy()
+        np.testing.assert_array_equal(frame[0:2, 0:2], frames[frameIndex][0:2, 0:2])
+        frame[0:2, 0:2] = frames[0][0:2, 0:2]
+        np.testing.assert_array_equal(frame, frames[0])
+    # the pixels of the first region are the ones of its latest grab, not the ones of the frame two grabs ago
+    frame = frameSource.grab().copy()
+    np.testing.assert_array_equal(frame[2:4, 4:6], frames[3][2:4, 4:6])
+    np.testing.assert_array_equal(frame[0:2, 0:2], frames[2][0:2, 0:2])
+    frame[2:4, 4:6] = frames[0][2:4, 4:6]
+    frame[0:2, 0:2] = frames[0][0:2, 0:2]
+    np.testing.assert_array_equal(frame, frames[0])
+
+
+def test_should_keep_the_previous_frame_untouched_while_grabbing_regions(mocker):
+    frames = np.array([np.full((4, 6), 10 * (index + 1), dtype=np.uint8) for index in range(2)], dtype=np.uint8)
+    mocker.patch('src.utils.frameSources.consumeRegionsToGrab', side_effect=[[(0, 0, 2, 2)]])
+    frameSource = makeDxcamFrameSource(mocker, frames)
+    previousFrame = frameSource.grab()
+    frameSource.grab()
+    np.testing.assert_array_equal(previousFrame, frames[0])
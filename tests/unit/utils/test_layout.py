@@ -0,0 +1,168 @@
+import numpy as np
+import pytest
+import src.utils.layout as layout
+from src.utils.core import cacheObjectPosition, hashit
+
+
+def makeScreenshot(anchorPosition) -> np.ndarray:
+    screenshot = np.zeros((40, 60), dtype=np.uint8)
+    (x, y) = anchorPosition
+    screenshot[y:y + 4, x:x + 4] = np.arange(16, dtype=np.uint8).reshape(4, 4) + 1
+    return screenshot
+
+
+def makeLocator(calls: list):
+    def locateAnchor(screenshot):
+        calls.append(1)
+        (ys, xs) = np.nonzero(screenshot)
+        if len(xs) == 0:
+            return None
+        return (int(xs.min()), int(ys.min()), 4, 4)
+    return cacheObjectPosition(locateAnchor)
+
+
+@pytest.fixture(autouse=True)
+def clearLayouts(mocker):
+    mocker.patch.dict(layout.anchorsLocators, clear=True)
+    layout.loadLayouts({})
+
+
+def test_should_search_anchor_only_when_its_pixels_changed():
+    calls = []
+    locateAnchor = makeLocator(calls)
+    screenshot = makeScreenshot((10, 5))
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert len(calls) == 1
+    assert locateAnchor(makeScreenshot((30, 20))) == (30, 20, 4, 4)
+    assert len(calls) == 2
+
+
+def test_should_verify_persisted_layout_without_searching():
+    screenshot = makeScreenshot((10, 5))
+    calls = []
+    locateAnchor = makeLocator(calls)
+    anchorName = f'{__name__}.locateAnchor'
+    layout.loadLayouts({'60x40': {anchorName: {'position': [
+                       10, 5, 4, 4], 'hash': hashit(screenshot[5:9, 10:14])}}})
+    positions = layout.calibrateLayout(screenshot)
+    assert positions[anchorName] == (10, 5, 4, 4)
+    assert len(calls) == 0
+    assert layout.consumeLayoutChanges() is False
+
+
+def test_should_dump_and_flag_layout_changes():
+    locateAnchor = makeLocator([])
+    screenshot = makeScreenshot((10, 5))
+    layout.calibrateLayout(screenshot)
+    assert layout.consumeLayoutChanges() is True
+    assert layout.consumeLayoutChanges() is False
+    dumpedLayouts = layout.dumpLayouts()
+    assert dumpedLayouts['60x40/0'][f'{__name__}.locateAnchor'] == {
+        'position': [10, 5, 4, 4], 'hash': hashit(screenshot[5:9, 10:14])}
+    layout.loadLayouts(dumpedLayouts)
+    layout.useLayout('60x40/0')
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+
+
+def test_should_keep_anchors_of_each_client_layout_of_a_resolution():
+    calls = []
+    locateAnchor = makeLocator(calls)
+    firstClientLayoutScreenshot = makeScreenshot((10, 5))
+    secondClientLayoutScreenshot = makeScreenshot((30, 20))
+    layout.calibrateLayout(firstClientLayoutScreenshot)
+    assert locateAnchor(secondClientLayoutScreenshot) == (30, 20, 4, 4)
+    assert sorted(layout.dumpLayouts()) == ['60x40/0', '60x40/1']
+    assert len(calls) == 2
+    # switching back verifies the anchors of the first client layout instead of searching them
+    assert locateAnchor(firstClientLayoutScreenshot) == (10, 5, 4, 4)
+    assert locateAnchor(secondClientLayoutScreenshot) == (30, 20, 4, 4)
+    assert len(calls) == 2
+    assert layout.currentLayoutKey == '60x40/1'
+
+
+def test_should_move_an_anchor_inside_its_client_layout_when_most_anchors_did_not_move():
+    layout.useLayout('60x40/0')
+    screenshot = makeScreenshot((10, 5))
+    movedScreenshot = makeScreenshot((30, 20))
+    for stillScreenshot in (screenshot, movedScreenshot):
+        stillScreenshot[30:34, 50:54] = 200
+    layout.setAnchor('still', (50, 30, 4, 4), hashit(screenshot[30:34, 50:54]))
+    layout.setAnchor('stillToo', (50, 30, 2, 2), hashit(screenshot[30:32, 50:52]))
+    locateAnchor = makeLocator([])
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert locateAnchor(movedScreenshot) == (30, 20, 4, 4)
+    assert list(layout.dumpLayouts()) == ['60x40/0']
+
+
+def makeLayoutScreenshot(anchorPosition) -> np.ndarray:
+    screenshot = makeScreenshot(anchorPosition)
+    screenshot[30:34, 50:54] = 200
+    return screenshot
+
+
+def storeLayoutWithStillAnchors(screenshot: np.ndarray):
+    layout.useLayout('60x40/0')
+    layout.setAnchor('still', (50, 30, 4, 4), hashit(screenshot[30:34, 50:54]))
+    layout.setAnchor('stillToo', (50, 30, 2, 2), hashit(screenshot[30:32, 50:52]))
+
+
+def test_should_keep_the_stored_layout_through_blank_frames():
+    calls = []
+    locateAnchor = makeLocator(calls)
+    screenshot = makeScreenshot((10, 5))
+    layout.calibrateLayout(screenshot)
+    assert locateAnchor(np.zeros((40, 60), dtype=np.uint8)) is None
+    assert locateAnchor(np.zeros((40, 60), dtype=np.uint8)) is None
+    assert list(layout.dumpLayouts()) == ['60x40/0']
+    assert layout.currentLayoutKey == '60x40/0'
+    calls.clear()
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert len(calls) == 0
+
+
+def test_should_not_store_a_loading_frame_with_a_few_anchors_drawn():
+    calls = []
+    locateAnchor = makeLocator(calls)
+    screenshot = makeLayoutScreenshot((10, 5))
+    storeLayoutWithStillAnchors(screenshot)
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert locateAnchor(makeScreenshot((30, 20))) == (30, 20, 4, 4)
+    assert list(layout.dumpLayouts()) == ['60x40/0']
+    calls.clear()
+    # the stored layout is verified again once the frame is drawn
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert len(calls) == 0
+    assert layout.currentLayoutKey == '60x40/0'
+
+
+def test_should_look_for_a_missing_anchor_in_the_stored_layouts_of_the_resolution_first():
+    calls = []
+    locateAnchor = makeLocator(calls)
+    screenshot = makeLayoutScreenshot((10, 5))
+    storeLayoutWithStillAnchors(screenshot)
+    locateAnchor(screenshot)
+    layout.useLayout('60x40/1')
+    calls.clear()
+    assert locateAnchor(screenshot) == (10, 5, 4, 4)
+    assert len(calls) == 0
+    assert layout.currentLayoutKey == '60x40/0'
+
+
+def test_should_drop_the_least_recently_used_layouts_of_a_resolution(mocker):
+    mocker.patch.object(layout, 'maxLayoutsPerResolution', 2)
+    locateAnchor = makeLocator([])
+    layout.calibrateLayout(makeScreenshot((10, 5)))
+    for anchorPosition in [(30, 20), (10, 5), (40, 10)]:
+        locateAnchor(makeScreenshot(anchorPosition))
+    assert list(layout.dumpLayouts()) == ['60x40/0', '60x40/2']
+
+
+def test_should_use_the_stored_layout_holding_the_same_anchors_as_a_pending_one():
+    screenshot = makeScreenshot((10, 5))
+    anchorName = f'{__name__}.locateAnchor'
+    layout.loadLayouts({'60x40/0': {anchorName: {'position': [10, 5, 4, 4], 'hash': hashit(screenshot[5:9, 10:14])}}})
+    layout.useLayout('60x40/1')
+    layout.setAnchor(anchorName, (10, 5, 4, 4), hashit(screenshot[5:9, 10:14]))
+    assert layout.currentLayoutKey == '60x40/0'
+    assert list(layout.dumpLayouts()) == ['60x40/0']
@@ -0,0 +1,27 @@
+import cv2
+import numpy as np
+from src.utils.core import downsample, locateByPyramid
+
+
+def makeFloorImage() -> np.ndarray:
+    noise = np.random.default_rng(0).integers(0, 256, (64, 80), dtype=np.uint8)
+    return cv2.resize(noise, (320, 256), interpolation=cv2.INTER_NEAREST)
+
+
+def test_should_locate_image_confirmed_at_full_resolution():
+    floorImage = makeFloorImage()
+    radarImage = floorImage[101:101 + 54, 157:157 + 53].copy()
+    position = locateByPyramid(floorImage, downsample(floorImage, 4), radarImage, 4, confidence=0.9)
+    assert position == (157, 101, 53, 54)
+
+def test_should_return_None_when_no_candidate_reaches_confidence():
+    floorImage = makeFloorImage()
+    radarImage = np.random.default_rng(1).integers(0, 256, (54, 53), dtype=np.uint8)
+    position = locateByPyramid(floorImage, downsample(floorImage, 4), radarImage, 4, confidence=0.9)
+    assert position is None
+
+def test_should_locate_image_near_the_borders():
+    floorImage = makeFloorImage()
+    radarImage = floorImage[256 - 54:256, 0:53].copy()
+    position = locateByPyramid(floorImage, downsample(floorImage, 4), radarImage, 4, confidence=0.9)
+    assert position == (0, 202, 53, 54)
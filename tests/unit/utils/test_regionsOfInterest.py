@@ -0,0 +1,52 @@
+import numpy as np
+import src.utils.regionsOfInterest as regionsOfInterest
+from src.utils.frameSources import convertRegionsToGray
+
+
+def resetRegionsOfInterest():
+    regionsOfInterest.regionsOfInterest.clear()
+    regionsOfInterest.shouldGrabFullFrame = True
+
+
+def test_should_merge_overlapping_regions_into_their_bounding_region():
+    regions = regionsOfInterest.mergeRegions([(0, 0, 10, 10), (50, 50, 5, 5), (5, 5, 10, 10)])
+    assert regions == [(0, 0, 15, 15), (50, 50, 5, 5)]
+
+def test_should_merge_regions_transitively():
+    regions = regionsOfInterest.mergeRegions([(0, 0, 10, 10), (20, 0, 10, 10), (8, 0, 14, 2)])
+    assert regions == [(0, 0, 30, 10)]
+
+def test_should_clip_regions_to_the_screen():
+    assert regionsOfInterest.clipRegion((-5, -5, 10, 10), 100, 100) == (0, 0, 5, 5)
+    assert regionsOfInterest.clipRegion((95, 98, 10, 10), 100, 100) == (95, 98, 5, 2)
+    assert regionsOfInterest.clipRegion((100, 0, 10, 10), 100, 100) is None
+
+def test_should_consume_full_frame_first_and_regions_afterwards():
+    resetRegionsOfInterest()
+    regionsOfInterest.declareRegionOfInterest('radar', (10, 10, 5, 5))
+    assert regionsOfInterest.consumeRegionsToGrab(100, 100) is None
+    assert regionsOfInterest.consumeRegionsToGrab(100, 100) == [(10, 10, 5, 5)]
+    resetRegionsOfInterest()
+
+def test_should_request_full_frame_when_region_is_missing():
+    resetRegionsOfInterest()
+    regionsOfInterest.declareRegionOfInterest('radar', (10, 10, 5, 5))
+    regionsOfInterest.consumeRegionsToGrab(100, 100)
+    regionsOfInterest.declareRegionOfInterest('chat', None)
+    assert regionsOfInterest.consumeRegionsToGrab(100, 100) is None
+    assert regionsOfInterest.consumeRegionsToGrab(100, 100) == [(10, 10, 5, 5)]
+    resetRegionsOfInterest()
+
+def test_should_consume_full_frame_when_there_are_no_regions():
+    resetRegionsOfInterest()
+    regionsOfInterest.shouldGrabFullFrame = False
+    assert regionsOfInterest.consumeRegionsToGrab(100, 100) is None
+
+def test_should_convert_only_regions_into_buffer():
+    screenshot = np.full((10, 20, 4), 200, dtype=np.uint8)
+    buffer = np.zeros((50, 50), dtype=np.uint8)
+    result = convertRegionsToGray(screenshot, (10, 5), [(10, 5, 4, 3), (25, 12, 5, 3)], buffer)
+    assert result is buffer
+    assert np.all(buffer[5:8, 10:14] == 200)
+    assert np.all(buffer[12:15, 25:30] == 200)
+    assert np.count_nonzero(buffer) == 4 * 3 + 5 * 3